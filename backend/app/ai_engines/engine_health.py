@@ -0,0 +1,54 @@
+"""
+Engine Health - EWMA latency and failure tracking for AI engines
+
+Each engine records the outcome of its raw API calls here so the router can
+prefer whichever engine is currently faster and more reliable.
+"""
+
+import os
+import time
+import threading
+from typing import Dict, Optional
+
+# Weight given to the newest sample (higher reacts faster to changes)
+EWMA_ALPHA = float(os.getenv("ENGINE_EWMA_ALPHA", "0.3"))
+# Latency (seconds) assumed for an engine that hasn't been sampled yet
+PRIOR_LATENCY = float(os.getenv("ENGINE_PRIOR_LATENCY", "2.0"))
+# Seconds without a sample for an engine's score to halve, so an idle
+# engine (e.g. one that had a single slow call) is eventually tried again
+SCORE_HALF_LIFE = float(os.getenv("ENGINE_SCORE_HALF_LIFE", "300"))
+
+
+class EngineHealth:
+    """Exponentially weighted moving averages of call latency and failure rate."""
+
+    def __init__(self, alpha: float = EWMA_ALPHA):
+        self.alpha = alpha
+        self.latency_ewma: Optional[float] = None
+        self.failure_ewma = 0.0
+        self.last_sample = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool):
+        """Fold one call's latency (seconds) and outcome into the averages."""
+        with self._lock:
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma = self.alpha * latency + (1 - self.alpha) * self.latency_ewma
+            self.failure_ewma = self.alpha * (0.0 if ok else 1.0) + (1 - self.alpha) * self.failure_ewma
+            self.last_sample = time.monotonic()
+
+    def score(self) -> float:
+        """Lower is better; unsampled engines start at PRIOR_LATENCY and idle scores decay."""
+        latency = PRIOR_LATENCY if self.latency_ewma is None else self.latency_ewma
+        decay = 0.5 ** ((time.monotonic() - self.last_sample) / SCORE_HALF_LIFE)
+        return latency * (1 + self.failure_ewma) * decay
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        """Current averages for health reporting."""
+        return {
+            "latency_ewma": self.latency_ewma,
+            "failure_ewma": self.failure_ewma,
+            "score": self.score()
+        }
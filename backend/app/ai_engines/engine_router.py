@@ -6,7 +6,13 @@ Maintains consistent API interface regardless of underlying engine.
 """
 
 import os
+import copy
+import json
+import time
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -18,6 +24,10 @@ logger = logging.getLogger(__name__)
 # Configuration
 PREFER_OLLAMA = os.getenv("PREFER_OLLAMA", "true").lower() == "true"
 FALLBACK_TO_GEMINI = os.getenv("FALLBACK_TO_GEMINI", "true").lower() == "true"
+HEALTH_CHECK_TTL = float(os.getenv("HEALTH_CHECK_TTL", "1.0"))
+# Opt-in memoization of first questions for identical candidate contexts
+CACHE_FIRST_QUESTION = os.getenv("CACHE_FIRST_QUESTION", "false").lower() == "true"
+FIRST_QUESTION_CACHE_SIZE = int(os.getenv("FIRST_QUESTION_CACHE_SIZE", "256"))
 
 class AIEngineRouter:
     """
@@ -35,6 +45,8 @@ class AIEngineRouter:
         self.gemini_engine = GeminiEngine()
         self.prefer_ollama = PREFER_OLLAMA
         self.fallback_enabled = FALLBACK_TO_GEMINI
+        # Engine pinned by force_engine(); while set, scores are ignored
+        self.forced_engine = None
         
         # Track engine usage statistics
         self.stats = {
@@ -44,6 +56,16 @@ class AIEngineRouter:
             "last_engine_used": None
         }
         
+        # Short-lived health_check() result shared by back-to-back callers
+        self._last_health = None
+        self._last_health_ts = 0.0
+        self._health_lock = threading.Lock()
+        
+        # LRU of first questions keyed by canonical candidate context
+        self.cache_enabled = CACHE_FIRST_QUESTION
+        self._first_question_cache = OrderedDict()
+        self._first_question_lock = threading.Lock()
+        
         logger.info(f"🔀 AI Engine Router initialized - Prefer Ollama: {self.prefer_ollama}, Fallback: {self.fallback_enabled}")
     
     def _select_engine(self, operation: str = "general") -> tuple:
@@ -56,7 +78,18 @@ class AIEngineRouter:
         Returns:
             (engine, engine_name) tuple
         """
-        if self.prefer_ollama and self.ollama_engine.available:
+        if self.forced_engine == "gemini":
+            self.stats["gemini_requests"] += 1
+            self.stats["last_engine_used"] = "gemini"
+            return self.gemini_engine, "gemini"
+        elif self.prefer_ollama and self.ollama_engine.available:
+            # With both engines healthy and none pinned, route by EWMA score rather than fixed preference
+            engine_name = "ollama" if self.forced_engine else min(self._healthy_engines(), key=self.score)
+            if engine_name == "gemini":
+                self.stats["gemini_requests"] += 1
+                self.stats["last_engine_used"] = "gemini"
+                logger.info(f"⚡ Routing {operation} to Gemini (score {self.score('gemini'):.2f}s vs {self.score('ollama'):.2f}s)")
+                return self.gemini_engine, "gemini"
             self.stats["ollama_requests"] += 1
             self.stats["last_engine_used"] = "ollama"
             return self.ollama_engine, "ollama"
@@ -73,6 +106,40 @@ class AIEngineRouter:
             self.stats["last_engine_used"] = "ollama"
             return self.ollama_engine, "ollama"
     
+    def _healthy_engines(self) -> List[str]:
+        """Engines that can currently serve requests, preferred engine first."""
+        engines = []
+        if self.ollama_engine.available:
+            engines.append("ollama")
+        if self.fallback_enabled and self.gemini_engine.api_key:
+            engines.append("gemini")
+        return engines
+
+    def score(self, engine_name: str) -> float:
+        """EWMA latency weighted by failure rate; lower is better."""
+        engine = self.ollama_engine if engine_name == "ollama" else self.gemini_engine
+        return engine.health.score()
+    
+    def _fallback_engine(self, engine_name: str):
+        """The other engine, when it can take over a failed call; None otherwise."""
+        if engine_name == "ollama":
+            return self.gemini_engine if self.fallback_enabled else None
+        return self.ollama_engine if self.ollama_engine.available else None
+
+    def _route(self, operation: str, method_name: str, *args):
+        """Run an engine method on the selected engine, falling back to the other one on failure."""
+        engine, engine_name = self._select_engine(operation)
+        fallback = self._fallback_engine(engine_name)
+        
+        if fallback is not None:
+            return self._execute_with_fallback(
+                method_name,
+                getattr(engine, method_name),
+                getattr(fallback, method_name),
+                *args
+            )
+        return getattr(engine, method_name)(*args)
+    
     def _execute_with_fallback(self, operation_name: str, primary_func, fallback_func, *args, **kwargs):
         """
         Execute operation with automatic fallback on failure.
@@ -95,7 +162,7 @@ class AIEngineRouter:
                 raise Exception("Empty or invalid result from primary engine")
         except Exception as e:
             logger.warning(f"⚠️ Primary engine failed for {operation_name}: {e}")
-            if self.fallback_enabled and fallback_func:
+            if fallback_func:
                 try:
                     self.stats["fallback_count"] += 1
                     logger.info(f"🔄 Using fallback engine for {operation_name}")
@@ -114,17 +181,7 @@ class AIEngineRouter:
         """
         Layer 1: Extract skills, experience level, and domain signals from resume.
         """
-        engine, engine_name = self._select_engine("context_extraction")
-        
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "extract_candidate_context",
-                self.ollama_engine.extract_candidate_context,
-                self.gemini_engine.extract_candidate_context,
-                resume_data, role, interview_type
-            )
-        else:
-            return engine.extract_candidate_context(resume_data, role, interview_type)
+        return self._route("context_extraction", "extract_candidate_context", resume_data, role, interview_type)
 
     # ============================================================================
     # LAYER 2: CONVERSATIONAL INTERVIEW INTELLIGENCE
@@ -134,33 +191,32 @@ class AIEngineRouter:
         """
         Layer 2: Generate first general question based on candidate context.
         """
-        engine, engine_name = self._select_engine("question_generation")
+        if not self.cache_enabled:
+            return self._generate_first_question(candidate_context)
         
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "generate_first_question",
-                self.ollama_engine.generate_first_question,
-                self.gemini_engine.generate_first_question,
-                candidate_context
-            )
-        else:
-            return engine.generate_first_question(candidate_context)
+        key = json.dumps(dict(candidate_context), sort_keys=True, default=str)
+        with self._first_question_lock:
+            cached = self._first_question_cache.get(key)
+            if cached is not None:
+                self._first_question_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+        
+        question = self._generate_first_question(candidate_context)
+        with self._first_question_lock:
+            self._first_question_cache[key] = copy.deepcopy(question)
+            if len(self._first_question_cache) > FIRST_QUESTION_CACHE_SIZE:
+                self._first_question_cache.popitem(last=False)
+        return question
+
+    def _generate_first_question(self, candidate_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Route a first-question request to an engine, bypassing the cache."""
+        return self._route("question_generation", "generate_first_question", candidate_context)
 
     def generate_next_question(self, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]], question_number: int) -> Dict[str, Any]:
         """
         Layer 2: Generate adaptive conversational questions (2-8) based on previous answers.
         """
-        engine, engine_name = self._select_engine("question_generation")
-        
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "generate_next_question",
-                self.ollama_engine.generate_next_question,
-                self.gemini_engine.generate_next_question,
-                candidate_context, conversation_history, question_number
-            )
-        else:
-            return engine.generate_next_question(candidate_context, conversation_history, question_number)
+        return self._route("question_generation", "generate_next_question", candidate_context, conversation_history, question_number)
 
     # ============================================================================
     # LAYER 3: EVALUATION & JOB INTELLIGENCE
@@ -170,65 +226,31 @@ class AIEngineRouter:
         """
         Layer 3: Evaluate candidate's answer for technical depth, communication, and relevance.
         """
-        engine, engine_name = self._select_engine("answer_evaluation")
-        
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "evaluate_answer",
-                self.ollama_engine.evaluate_answer,
-                self.gemini_engine.evaluate_answer,
-                question_text, answer, candidate_context, conversation_history
-            )
-        else:
-            return engine.evaluate_answer(question_text, answer, candidate_context, conversation_history)
+        return self._route("answer_evaluation", "evaluate_answer", question_text, answer, candidate_context, conversation_history)
+
+    def evaluate_answers_batch(self, question_texts: List[str], answers: List[str], candidate_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Layer 3: Evaluate several answers with one engine request instead of one per answer.
+        """
+        return self._route("answer_evaluation", "evaluate_answers_batch", question_texts, answers, candidate_context)
 
     def generate_final_report(self, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]], evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Layer 3: Generate comprehensive final report with scores and analysis.
         """
-        engine, engine_name = self._select_engine("report_generation")
-        
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "generate_final_report",
-                self.ollama_engine.generate_final_report,
-                self.gemini_engine.generate_final_report,
-                candidate_context, conversation_history, evaluations
-            )
-        else:
-            return engine.generate_final_report(candidate_context, conversation_history, evaluations)
+        return self._route("report_generation", "generate_final_report", candidate_context, conversation_history, evaluations)
 
     def calculate_job_fit(self, candidate_context: Dict[str, Any], job_description: Dict[str, Any]) -> Dict[str, Any]:
         """
         Layer 3: AI-Based Job Fit & Role Matching analysis.
         """
-        engine, engine_name = self._select_engine("job_fit_analysis")
-        
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "calculate_job_fit",
-                self.ollama_engine.calculate_job_fit,
-                self.gemini_engine.calculate_job_fit,
-                candidate_context, job_description
-            )
-        else:
-            return engine.calculate_job_fit(candidate_context, job_description)
+        return self._route("job_fit_analysis", "calculate_job_fit", candidate_context, job_description)
 
     def generate_aptitude_questions(self, difficulty: str = "medium", count: int = 10) -> List[Dict[str, Any]]:
         """
         Layer 3: Generate aptitude and logical reasoning questions for assessment.
         """
-        engine, engine_name = self._select_engine("aptitude_generation")
-        
-        if engine_name == "ollama" and self.fallback_enabled:
-            return self._execute_with_fallback(
-                "generate_aptitude_questions",
-                self.ollama_engine.generate_aptitude_questions,
-                self.gemini_engine.generate_aptitude_questions,
-                difficulty, count
-            )
-        else:
-            return engine.generate_aptitude_questions(difficulty, count)
+        return self._route("aptitude_generation", "generate_aptitude_questions", difficulty, count)
 
     def evaluate_aptitude_answer(self, question: Dict[str, Any], user_answer: str) -> Dict[str, Any]:
         """
@@ -238,6 +260,38 @@ class AIEngineRouter:
         engine, engine_name = self._select_engine("aptitude_evaluation")
         return engine.evaluate_aptitude_answer(question, user_answer)
 
+    # ============================================================================
+    # ASYNC VARIANTS (independent calls can be awaited together)
+    # ============================================================================
+
+    async def aextract_candidate_context(self, resume_data: Dict[str, Any], role: str, interview_type: str) -> Dict[str, Any]:
+        """Async variant of extract_candidate_context."""
+        return await asyncio.to_thread(self.extract_candidate_context, resume_data, role, interview_type)
+
+    async def agenerate_first_question(self, candidate_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of generate_first_question."""
+        return await asyncio.to_thread(self.generate_first_question, candidate_context)
+
+    async def agenerate_next_question(self, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]], question_number: int) -> Dict[str, Any]:
+        """Async variant of generate_next_question."""
+        return await asyncio.to_thread(self.generate_next_question, candidate_context, conversation_history, question_number)
+
+    async def aevaluate_answer(self, question_text: str, answer: str, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Async variant of evaluate_answer."""
+        return await asyncio.to_thread(self.evaluate_answer, question_text, answer, candidate_context, conversation_history)
+
+    async def aevaluate_answers_batch(self, question_texts: List[str], answers: List[str], candidate_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Async variant of evaluate_answers_batch."""
+        return await asyncio.to_thread(self.evaluate_answers_batch, question_texts, answers, candidate_context)
+
+    async def agenerate_final_report(self, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]], evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Async variant of generate_final_report."""
+        return await asyncio.to_thread(self.generate_final_report, candidate_context, conversation_history, evaluations)
+
+    async def acalculate_job_fit(self, candidate_context: Dict[str, Any], job_description: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of calculate_job_fit."""
+        return await asyncio.to_thread(self.calculate_job_fit, candidate_context, job_description)
+
     # ============================================================================
     # UTILITY METHODS
     # ============================================================================
@@ -249,7 +303,9 @@ class AIEngineRouter:
             "ollama_available": self.ollama_engine.available,
             "gemini_available": bool(self.gemini_engine.api_key),
             "current_preference": "ollama" if self.prefer_ollama else "gemini",
-            "fallback_enabled": self.fallback_enabled
+            "forced_engine": self.forced_engine,
+            "fallback_enabled": self.fallback_enabled,
+            "first_question_cache_size": len(self._first_question_cache)
         }
 
     def force_engine(self, engine_name: str) -> bool:
@@ -265,6 +321,8 @@ class AIEngineRouter:
         if engine_name.lower() == "ollama":
             if self.ollama_engine.available:
                 self.prefer_ollama = True
+                self.forced_engine = "ollama"
+                self._invalidate_health()
                 logger.info("🔀 Forced engine selection: Ollama")
                 return True
             else:
@@ -273,6 +331,8 @@ class AIEngineRouter:
         elif engine_name.lower() == "gemini":
             if self.gemini_engine.api_key:
                 self.prefer_ollama = False
+                self.forced_engine = "gemini"
+                self._invalidate_health()
                 logger.info("🔀 Forced engine selection: Gemini")
                 return True
             else:
@@ -286,24 +346,49 @@ class AIEngineRouter:
         """Reset engine preferences to default configuration."""
         self.prefer_ollama = PREFER_OLLAMA
         self.fallback_enabled = FALLBACK_TO_GEMINI
+        self.forced_engine = None
+        self._invalidate_health()
         logger.info("🔀 Engine preferences reset to defaults")
 
+    def clear_question_cache(self):
+        """Forget memoized first questions."""
+        with self._first_question_lock:
+            self._first_question_cache.clear()
+
+    def _invalidate_health(self):
+        """Drop the cached health_check() result after a configuration change."""
+        with self._health_lock:
+            self._last_health = None
+
     def health_check(self) -> Dict[str, Any]:
-        """Perform health check on both engines."""
+        """Perform health check on both engines, reusing a result younger than HEALTH_CHECK_TTL."""
+        with self._health_lock:
+            now = time.monotonic()
+            if self._last_health is None or now - self._last_health_ts >= HEALTH_CHECK_TTL:
+                self._last_health = self._build_health()
+                self._last_health_ts = now
+            # Each caller gets its own copy so mutating it can't change the cached entry
+            return copy.deepcopy(self._last_health)
+
+    def _build_health(self) -> Dict[str, Any]:
+        """Snapshot engine availability, EWMA health and router stats."""
         return {
             "ollama": {
                 "available": self.ollama_engine.available,
                 "model": self.ollama_engine.model,
-                "base_url": self.ollama_engine.base_url
+                "base_url": self.ollama_engine.base_url,
+                "health": self.ollama_engine.health.snapshot()
             },
             "gemini": {
                 "available": bool(self.gemini_engine.api_key),
-                "api_configured": bool(self.gemini_engine.api_key)
+                "api_configured": bool(self.gemini_engine.api_key),
+                "health": self.gemini_engine.health.snapshot()
             },
             "router": {
                 "prefer_ollama": self.prefer_ollama,
+                "forced_engine": self.forced_engine,
                 "fallback_enabled": self.fallback_enabled,
-                "stats": self.stats
+                "stats": dict(self.stats)
             }
         }
 
@@ -9,12 +9,23 @@ Uses Google Gemini API for all AI operations with clean request-response abstrac
 """
 
 import os
+import copy
 import json
+import time
+import hashlib
+import random
 import logging
+import threading
 import requests
+from collections import OrderedDict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from app.ai_engines.engine_health import EngineHealth
+from app.utils.json_utils import dump_json, load_json
+
 logger = logging.getLogger(__name__)
 
 # Gemini Configuration
@@ -25,6 +36,49 @@ GEMINI_BASE_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEM
 if GEMINI_API_KEY:
     logger.info("✅ Gemini API key loaded")
 
+# Default cap on in-flight requests per GeminiEngine instance. Throughput per
+# instance tops out at roughly GEMINI_MAX_CONCURRENCY / call latency, and the
+# token bucket below still bounds the request rate across all instances
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "8"))
+
+# Token bucket pacing Gemini requests: refills GEMINI_RATE_PER_SEC tokens a second, bursts up to GEMINI_RATE_BURST
+# (set GEMINI_RATE_PER_SEC=0 to disable pacing)
+GEMINI_RATE_PER_SEC = float(os.getenv("GEMINI_RATE_PER_SEC", "4"))
+GEMINI_RATE_BURST = int(os.getenv("GEMINI_RATE_BURST", "5"))
+_RATE_LOCK = threading.Lock()
+_rate_tokens = float(GEMINI_RATE_BURST)
+_rate_updated = time.monotonic()
+
+def _wait_for_rate_token():
+    """Block until the shared token bucket allows another Gemini request"""
+    global _rate_tokens, _rate_updated
+    if GEMINI_RATE_PER_SEC <= 0:
+        return
+    while True:
+        with _RATE_LOCK:
+            now = time.monotonic()
+            _rate_tokens = min(GEMINI_RATE_BURST, _rate_tokens + (now - _rate_updated) * GEMINI_RATE_PER_SEC)
+            _rate_updated = now
+            if _rate_tokens >= 1:
+                _rate_tokens -= 1
+                return
+            wait = (1 - _rate_tokens) / GEMINI_RATE_PER_SEC
+        time.sleep(wait)
+
+# Retry budget for rate limits and transient server errors before the router falls back
+GEMINI_MAX_ATTEMPTS = int(os.getenv("GEMINI_MAX_ATTEMPTS", "3"))
+GEMINI_RETRY_BASE_DELAY = float(os.getenv("GEMINI_RETRY_BASE_DELAY", "0.25"))
+GEMINI_RETRY_MAX_DELAY = float(os.getenv("GEMINI_RETRY_MAX_DELAY", "4.0"))
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# LRU of Gemini job fit analyses keyed by a digest of the candidate context and job description
+# (set JOB_FIT_CACHE_SIZE=0 to disable)
+JOB_FIT_CACHE_SIZE = int(os.getenv("JOB_FIT_CACHE_SIZE", "1024"))
+
+# Shared keep-alive session so each call skips the TCP + TLS handshake
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+
 
 class GeminiEngine:
     """
@@ -35,12 +89,22 @@ class GeminiEngine:
     Layer 3: Evaluation & Job Intelligence - Assessment and job fit analysis
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None):
         self.api_key = GEMINI_API_KEY
         self.model = GEMINI_MODEL
         self.base_url = GEMINI_BASE_URL
+        self.timeout = 30
+        self.health = EngineHealth()
+        
+        # Caps this engine's in-flight requests; other instances have their own limit
+        self.max_concurrency = max_concurrency or GEMINI_MAX_CONCURRENCY
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        
+        # Identical job fit requests reuse the earlier Gemini analysis
+        self._job_fit_cache = OrderedDict()
+        self._job_fit_lock = threading.Lock()
         
-    def call_gemini(self, prompt: str, temperature: float = 0.7, max_tokens: int = 1000) -> str:
+    def call_gemini(self, prompt: str, temperature: float = 0.7, max_tokens: int = 1000, response_mime_type: Optional[str] = None) -> str:
         """
         Clean request-response abstraction for Gemini API calls.
         
@@ -48,6 +112,7 @@ class GeminiEngine:
             prompt: The input prompt for Gemini
             temperature: Creativity level (0.0-1.0)
             max_tokens: Maximum response length
+            response_mime_type: Optional output format, e.g. "application/json"
             
         Returns:
             Generated text response
@@ -56,33 +121,23 @@ class GeminiEngine:
             logger.error("Gemini API key not configured")
             return ""
         
+        started = time.perf_counter()
+        content = ""
         try:
             headers = {
                 "Content-Type": "application/json",
             }
             
-            payload = {
-                "contents": [{
-                    "parts": [{
-                        "text": prompt
-                    }]
-                }],
-                "generationConfig": {
-                    "temperature": temperature,
-                    "maxOutputTokens": max_tokens,
-                    "topP": 0.8,
-                    "topK": 10
-                }
-            }
+            payload = self._build_payload(prompt, temperature, max_tokens, response_mime_type)
             
             url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={self.api_key}"
             
             logger.info(f"🔄 Gemini request: {len(prompt)} chars")
             
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self._post_with_retry(url, headers, payload)
             response.raise_for_status()
             
-            data = response.json()
+            data = load_json(response.content)
             
             if "candidates" in data and len(data["candidates"]) > 0:
                 content = data["candidates"][0]["content"]["parts"][0]["text"]
@@ -101,6 +156,117 @@ class GeminiEngine:
         except Exception as e:
             logger.error(f"❌ Unexpected Gemini error: {e}")
             return ""
+        finally:
+            # A failed call is charged a full timeout so the router backs off it
+            ok = bool(content)
+            self.health.record(time.perf_counter() - started if ok else self.timeout, ok)
+
+    def _build_payload(self, prompt: str, temperature: float, max_tokens: int, response_mime_type: Optional[str] = None) -> Dict[str, Any]:
+        """Build the generateContent request body shared by blocking and streaming calls."""
+        payload = {
+            "contents": [{
+                "parts": [{
+                    "text": prompt
+                }]
+            }],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens,
+                "topP": 0.8,
+                "topK": 10
+            }
+        }
+        if response_mime_type:
+            payload["generationConfig"]["responseMimeType"] = response_mime_type
+        return payload
+
+    def call_gemini_stream(self, prompt: str, temperature: float = 0.7, max_tokens: int = 1000,
+                           on_token=None, early_stop_on_substring: Optional[str] = None,
+                           stop_after_chars: Optional[int] = None) -> str:
+        """
+        Streaming variant of call_gemini that can stop before the full response is decoded.
+        
+        Args:
+            prompt: The input prompt for Gemini
+            temperature: Creativity level (0.0-1.0)
+            max_tokens: Maximum response length
+            on_token: Optional callback invoked with each text chunk as it arrives
+            early_stop_on_substring: Close the stream once this text has been received
+            stop_after_chars: Close the stream once this many characters have been received
+            
+        Returns:
+            Text received before the stream ended or was stopped
+        """
+        if not self.api_key:
+            logger.error("Gemini API key not configured")
+            return ""
+        
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:streamGenerateContent?alt=sse&key={self.api_key}"
+        payload = self._build_payload(prompt, temperature, max_tokens)
+        chunks = []
+        received = 0
+        
+        logger.info(f"🔄 Gemini stream request: {len(prompt)} chars")
+        
+        try:
+            _wait_for_rate_token()
+            with self._semaphore:
+                with _SESSION.post(url, headers={"Content-Type": "application/json"}, data=dump_json(payload),
+                                   timeout=self.timeout, stream=True) as response:
+                    response.raise_for_status()
+                    # Raw bytes: the stream declares no charset, so letting requests decode it
+                    # would fall back to ISO-8859-1 and garble non-ASCII text
+                    for line in response.iter_lines():
+                        # Server-sent events: one JSON response fragment per "data:" line
+                        if not line or not line.startswith(b"data:"):
+                            continue
+                        event = load_json(line[len(b"data:"):].decode("utf-8"))
+                        for candidate in event.get("candidates", [])[:1]:
+                            for part in candidate.get("content", {}).get("parts", []):
+                                text = part.get("text", "")
+                                if not text:
+                                    continue
+                                chunks.append(text)
+                                received += len(text)
+                                if on_token:
+                                    on_token(text)
+                        
+                        if stop_after_chars is not None and received >= stop_after_chars:
+                            break
+                        if early_stop_on_substring and early_stop_on_substring in "".join(chunks):
+                            break
+        except requests.exceptions.RequestException as e:
+            logger.error(f"❌ Gemini stream request failed: {e}")
+        except (KeyError, IndexError, json.JSONDecodeError) as e:
+            logger.error(f"❌ Gemini stream parsing failed: {e}")
+        except Exception as e:
+            logger.error(f"❌ Unexpected Gemini stream error: {e}")
+        
+        content = "".join(chunks).strip()
+        logger.info(f"✅ Gemini stream response: {len(content)} chars")
+        return content
+
+    def _post_with_retry(self, url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> requests.Response:
+        """POST to Gemini, retrying 429/5xx and timeouts with jittered exponential backoff."""
+        body = dump_json(payload)
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            final_attempt = attempt == GEMINI_MAX_ATTEMPTS - 1
+            try:
+                _wait_for_rate_token()
+                with self._semaphore:
+                    response = _SESSION.post(url, headers=headers, data=body, timeout=self.timeout)
+                if response.status_code not in _RETRYABLE_STATUS or final_attempt:
+                    return response
+                reason = f"HTTP {response.status_code}"
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if final_attempt:
+                    raise
+                reason = type(e).__name__
+            
+            # Sleep outside the semaphore so waiting retries don't block other callers
+            delay = min(GEMINI_RETRY_MAX_DELAY, GEMINI_RETRY_BASE_DELAY * 2 ** attempt) + random.uniform(0, 0.1)
+            logger.warning(f"🔁 Gemini {reason}, retrying in {delay:.2f}s (attempt {attempt + 2}/{GEMINI_MAX_ATTEMPTS})")
+            time.sleep(delay)
 
     # ============================================================================
     # LAYER 1: CONTEXT INTELLIGENCE (PROFILE UNDERSTANDING)
@@ -157,7 +323,7 @@ Extract and return ONLY a JSON object with:
         response = self.call_gemini(prompt, temperature=0.2, max_tokens=500)
         
         try:
-            domain_analysis = json.loads(response)
+            domain_analysis = load_json(response)
         except json.JSONDecodeError:
             # Fallback domain analysis
             domain_analysis = {
@@ -230,7 +396,7 @@ Return ONLY a JSON object:
         response = self.call_gemini(prompt, temperature=0.3, max_tokens=300)
         
         try:
-            question_data = json.loads(response)
+            question_data = load_json(response)
             question_data["timestamp"] = datetime.now().isoformat()
             return question_data
         except json.JSONDecodeError:
@@ -296,7 +462,7 @@ Return ONLY a JSON object:
         response = self.call_gemini(prompt, temperature=0.5, max_tokens=400)
         
         try:
-            question_data = json.loads(response)
+            question_data = load_json(response)
             question_data["timestamp"] = datetime.now().isoformat()
             return question_data
         except json.JSONDecodeError:
@@ -339,6 +505,9 @@ Return ONLY a JSON object:
         """
         logger.info("📊 Layer 3: Evaluating answer")
         
+        role = candidate_context.get("role", "Software Engineer")
+        experience_level = candidate_context.get("experience_level", "Mid-Level")
+        
         if not answer or len(answer.strip()) < 10:
             return {
                 "technical": 20,
@@ -348,9 +517,6 @@ Return ONLY a JSON object:
                 "timestamp": datetime.now().isoformat()
             }
         
-        role = candidate_context.get("role", "Software Engineer")
-        experience_level = candidate_context.get("experience_level", "Mid-Level")
-        
         prompt = f"""Evaluate this {experience_level} {role} interview answer objectively.
 
 Question: {question_text}
@@ -371,7 +537,7 @@ Return ONLY a JSON object with scores:
         response = self.call_gemini(prompt, temperature=0.1, max_tokens=200)
         
         try:
-            evaluation = json.loads(response)
+            evaluation = load_json(response)
             evaluation["timestamp"] = datetime.now().isoformat()
             return evaluation
         except json.JSONDecodeError:
@@ -384,6 +550,66 @@ Return ONLY a JSON object with scores:
                 "timestamp": datetime.now().isoformat()
             }
 
+    def evaluate_answers_batch(self, question_texts: List[str], answers: List[str], candidate_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Layer 3: Evaluate several answers with a single Gemini request.
+        
+        The candidate context and instructions are sent once for the whole batch
+        instead of once per answer. Falls back to per-answer evaluation if the
+        response is not a JSON array with one object per answer.
+        
+        Returns:
+            Evaluations in the same order as the answers
+        """
+        logger.info(f"📊 Layer 3: Evaluating {len(answers)} answers in one batch")
+        
+        # Too-short answers get the fixed low score without an API call
+        pending = [i for i, answer in enumerate(answers) if answer and len(answer.strip()) >= 10]
+        if len(pending) < 2:
+            return [self.evaluate_answer(q, a, candidate_context) for q, a in zip(question_texts, answers)]
+        
+        role = candidate_context.get("role", "Software Engineer")
+        experience_level = candidate_context.get("experience_level", "Mid-Level")
+        pairs = "\n\n".join(
+            f"{n}. Question: {question_texts[i]}\n   Answer: {answers[i]}"
+            for n, i in enumerate(pending, 1)
+        )
+        
+        prompt = f"""Evaluate these {len(pending)} {experience_level} {role} interview answers objectively.
+
+{pairs}
+
+Provide scores (0-100) for each answer:
+- Technical competency and depth
+- Communication clarity and structure  
+- Relevance to the question asked
+
+Return ONLY a JSON array with one object per answer, in the same order:
+[
+    {{"technical": 85, "communication": 90, "relevance": 85}}
+]"""
+
+        response = self.call_gemini(prompt, temperature=0.1, max_tokens=200 * len(pending), response_mime_type="application/json")
+        
+        try:
+            batch = load_json(response)
+            if not isinstance(batch, list) or len(batch) != len(pending) or not all(isinstance(e, dict) for e in batch):
+                raise ValueError("Batch evaluation does not match the answers")
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning(f"⚠️ Batch evaluation unusable, evaluating individually: {e}")
+            return [self.evaluate_answer(q, a, candidate_context) for q, a in zip(question_texts, answers)]
+        
+        timestamp = datetime.now().isoformat()
+        evaluations = dict(zip(pending, batch))
+        results = []
+        for i, (question_text, answer) in enumerate(zip(question_texts, answers)):
+            if i in evaluations:
+                evaluations[i]["timestamp"] = timestamp
+                results.append(evaluations[i])
+            else:
+                results.append(self.evaluate_answer(question_text, answer, candidate_context))
+        return results
+
     def generate_final_report(self, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]], evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Layer 3: Generate comprehensive final report with scores and analysis.
@@ -435,7 +661,7 @@ Return ONLY a JSON object with scores and brief recommendations:
         response = self.call_gemini(prompt, temperature=0.2, max_tokens=400)
         
         try:
-            report = json.loads(response)
+            report = load_json(response)
             return report
         except json.JSONDecodeError:
             # Fallback report
@@ -460,6 +686,16 @@ Return ONLY a JSON object with scores and brief recommendations:
         """
         logger.info("🎯 Layer 3: Calculating job fit")
         
+        cache_key = None
+        if JOB_FIT_CACHE_SIZE > 0:
+            blob = json.dumps([candidate_context, job_description], sort_keys=True, default=str)
+            cache_key = hashlib.sha256(blob.encode('utf-8')).digest()
+            with self._job_fit_lock:
+                cached = self._job_fit_cache.get(cache_key)
+                if cached is not None:
+                    self._job_fit_cache.move_to_end(cache_key)
+                    return copy.deepcopy(cached)
+        
         skills = candidate_context.get("skills", [])
         experience_years = candidate_context.get("experience_years", 0)
         role = candidate_context.get("role", "")
@@ -496,13 +732,24 @@ Return ONLY a JSON object with job fit scores:
         response = self.call_gemini(prompt, temperature=0.2, max_tokens=400)
         
         try:
-            analysis = json.loads(response)
+            analysis = load_json(response)
             analysis["timestamp"] = datetime.now().isoformat()
+            
+            # Only Gemini's own analyses are cached; the fallback below is retried next time
+            if cache_key is not None:
+                with self._job_fit_lock:
+                    self._job_fit_cache[cache_key] = copy.deepcopy(analysis)
+                    if len(self._job_fit_cache) > JOB_FIT_CACHE_SIZE:
+                        self._job_fit_cache.popitem(last=False)
             return analysis
         except json.JSONDecodeError:
-            # Fallback analysis
-            skill_overlap = len(set(skills) & set(required_skills))
-            skill_match = (skill_overlap / len(required_skills) * 100) if required_skills else 50
+            # Fallback analysis: case-fold the candidate's skills once into a set so
+            # each required skill is a single hash lookup
+            candidate_skills = frozenset(skill.casefold() for skill in skills)
+            matched_skills = [skill for skill in required_skills if skill.casefold() in candidate_skills]
+            missing_skills = [skill for skill in required_skills if skill.casefold() not in candidate_skills]
+            
+            skill_match = (len(matched_skills) / len(required_skills) * 100) if required_skills else 50
             exp_match = min(100, (experience_years / required_experience * 100)) if required_experience > 0 else 75
             
             return {
@@ -510,8 +757,8 @@ Return ONLY a JSON object with job fit scores:
                 "skill_match_percentage": round(skill_match),
                 "experience_match_percentage": round(exp_match),
                 "role_suitability": "Good fit with development needed",
-                "missing_skills": list(set(required_skills) - set(skills)),
-                "matched_skills": list(set(skills) & set(required_skills)),
+                "missing_skills": missing_skills,
+                "matched_skills": matched_skills,
                 "timestamp": datetime.now().isoformat()
             }
 
@@ -553,7 +800,7 @@ Return ONLY a JSON array:
         response = self.call_gemini(prompt, temperature=0.4, max_tokens=2000)
         
         try:
-            questions = json.loads(response)
+            questions = load_json(response)
             for i, q in enumerate(questions):
                 q["id"] = f"apt_{i+1}"
                 q["timestamp"] = datetime.now().isoformat()
@@ -597,3 +844,9 @@ Return ONLY a JSON array:
             "explanation": explanation,
             "user_answer": user_answer
         }
+
+
+@lru_cache(maxsize=1)
+def get_gemini_engine() -> GeminiEngine:
+    """Process-wide GeminiEngine, so callers share its health state and job fit cache"""
+    return GeminiEngine()
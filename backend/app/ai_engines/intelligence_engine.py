@@ -40,6 +40,11 @@ class IntelligenceEngine:
         logger.warning("IntelligenceEngine.evaluate_answer is deprecated")
         return {"technical": 0, "communication": 0, "relevance": 0}
 
+    def evaluate_answers_batch(self, questions: List[str], answers: List[str], profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """DEPRECATED: Use GeminiEngine.evaluate_answers_batch instead"""
+        logger.warning("IntelligenceEngine.evaluate_answers_batch is deprecated")
+        return [{"technical": 0, "communication": 0, "relevance": 0} for _ in answers]
+
     def generate_aptitude_questions(self, difficulty: str = "medium", count: int = 5) -> List[Dict[str, Any]]:
         """DEPRECATED: Use GeminiEngine.generate_aptitude_questions instead"""
         logger.warning("IntelligenceEngine.generate_aptitude_questions is deprecated")
@@ -55,6 +60,11 @@ class IntelligenceEngine:
         logger.warning("IntelligenceEngine.calculate_job_fit is deprecated")
         return {"overall_fit_score": 0, "skill_match_percentage": 0, "experience_match_percentage": 0}
 
+    def generate_final_report(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """DEPRECATED: Use GeminiEngine.generate_final_report instead"""
+        logger.warning("IntelligenceEngine.generate_final_report is deprecated")
+        return {"overall_summary": "", "technical_strengths": [], "recommendations": []}
+
 
 # Global instance for backward compatibility
 intelligence_engine = IntelligenceEngine()
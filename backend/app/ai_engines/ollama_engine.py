@@ -7,11 +7,17 @@ while maintaining compatibility with the existing Gemini-based system.
 
 import os
 import json
+import time
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from app.ai_engines.engine_health import EngineHealth
+from app.utils.json_utils import dump_json, load_json
+
 logger = logging.getLogger(__name__)
 
 # Ollama Configuration
@@ -19,6 +25,17 @@ OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
 OLLAMA_TIMEOUT = int(os.getenv("OLLAMA_TIMEOUT", "30"))
 
+# Default cap on in-flight requests per OllamaEngine instance, matched to the
+# server's OLLAMA_NUM_PARALLEL so extra callers queue here instead of timing out
+# server-side. Throughput per instance tops out at roughly this / call latency
+OLLAMA_MAX_CONCURRENCY = int(os.getenv("OLLAMA_MAX_CONCURRENCY", os.getenv("OLLAMA_NUM_PARALLEL", "4")))
+
+# Shared keep-alive session so repeated local calls reuse one connection pool
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32))
+
+
 class OllamaEngine:
     """
     Local LLM Engine using Ollama for AI interview operations.
@@ -27,10 +44,15 @@ class OllamaEngine:
     Includes automatic fallback to Gemini when Ollama is unavailable.
     """
     
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None):
         self.base_url = OLLAMA_BASE_URL
         self.model = OLLAMA_MODEL
         self.timeout = OLLAMA_TIMEOUT
+        self.health = EngineHealth()
+        
+        # Caps this engine's in-flight requests; other instances have their own limit
+        self.max_concurrency = max_concurrency or OLLAMA_MAX_CONCURRENCY
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
         self.available = self._check_availability()
         
         if self.available:
@@ -42,12 +64,12 @@ class OllamaEngine:
         """Check if Ollama is available and the model is loaded"""
         try:
             # Check if Ollama is running
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = _SESSION.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code != 200:
                 return False
             
             # Check if our model is available
-            models = response.json().get("models", [])
+            models = load_json(response.content).get("models", [])
             model_names = [model.get("name", "") for model in models]
             
             # Check if our model exists (exact match or partial match)
@@ -85,6 +107,8 @@ class OllamaEngine:
             logger.error("Ollama not available")
             return ""
         
+        started = time.perf_counter()
+        content = ""
         try:
             payload = {
                 "model": self.model,
@@ -100,14 +124,16 @@ class OllamaEngine:
             
             logger.info(f"🔄 Ollama request: {len(prompt)} chars to {self.model}")
             
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=self.timeout
-            )
+            with self._semaphore:
+                response = _SESSION.post(
+                    f"{self.base_url}/api/generate",
+                    data=dump_json(payload),
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.timeout
+                )
             response.raise_for_status()
             
-            data = response.json()
+            data = load_json(response.content)
             content = data.get("response", "").strip()
             
             logger.info(f"✅ Ollama response: {len(content)} chars")
@@ -122,6 +148,10 @@ class OllamaEngine:
         except Exception as e:
             logger.error(f"❌ Unexpected Ollama error: {e}")
             return ""
+        finally:
+            # A failed call is charged a full timeout so the router backs off it
+            ok = bool(content)
+            self.health.record(time.perf_counter() - started if ok else self.timeout, ok)
 
     # ============================================================================
     # LAYER 1: CONTEXT INTELLIGENCE (PROFILE UNDERSTANDING)
@@ -176,7 +206,7 @@ Return only valid JSON, no additional text."""
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                domain_analysis = json.loads(json_str)
+                domain_analysis = load_json(json_str)
             else:
                 raise json.JSONDecodeError("No JSON found", response, 0)
         except json.JSONDecodeError:
@@ -253,7 +283,7 @@ Return only valid JSON, no additional text."""
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                question_data = json.loads(json_str)
+                question_data = load_json(json_str)
                 question_data["timestamp"] = datetime.now().isoformat()
                 return question_data
             else:
@@ -320,7 +350,7 @@ Return only valid JSON, no additional text."""
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                question_data = json.loads(json_str)
+                question_data = load_json(json_str)
                 question_data["timestamp"] = datetime.now().isoformat()
                 return question_data
             else:
@@ -356,6 +386,9 @@ Return only valid JSON, no additional text."""
         """
         logger.info("📊 Layer 3: Evaluating answer (Ollama)")
         
+        role = candidate_context.get("role", "Software Engineer")
+        experience_level = candidate_context.get("experience_level", "Mid-Level")
+        
         if not answer or len(answer.strip()) < 10:
             return {
                 "technical": 20,
@@ -365,9 +398,6 @@ Return only valid JSON, no additional text."""
                 "timestamp": datetime.now().isoformat()
             }
         
-        role = candidate_context.get("role", "Software Engineer")
-        experience_level = candidate_context.get("experience_level", "Mid-Level")
-        
         prompt = f"""Evaluate this {experience_level} {role} interview answer objectively.
 
 Question: {question_text}
@@ -397,7 +427,7 @@ Return only valid JSON with numeric scores and expected answer guidance, no addi
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                evaluation = json.loads(json_str)
+                evaluation = load_json(json_str)
                 evaluation["timestamp"] = datetime.now().isoformat()
                 return evaluation
             else:
@@ -413,6 +443,67 @@ Return only valid JSON with numeric scores and expected answer guidance, no addi
                 "timestamp": datetime.now().isoformat()
             }
 
+    def evaluate_answers_batch(self, question_texts: List[str], answers: List[str], candidate_context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Layer 3: Evaluate several answers with a single Ollama request.
+        """
+        logger.info(f"📊 Layer 3: Evaluating {len(answers)} answers in one batch (Ollama)")
+        
+        # Too-short answers get the fixed low score without a model call
+        pending = [i for i, answer in enumerate(answers) if answer and len(answer.strip()) >= 10]
+        if len(pending) < 2:
+            return [self.evaluate_answer(q, a, candidate_context) for q, a in zip(question_texts, answers)]
+        
+        role = candidate_context.get("role", "Software Engineer")
+        experience_level = candidate_context.get("experience_level", "Mid-Level")
+        pairs = "\n\n".join(
+            f"{n}. Question: {question_texts[i]}\n   Answer: {answers[i]}"
+            for n, i in enumerate(pending, 1)
+        )
+        
+        prompt = f"""Evaluate these {len(pending)} {experience_level} {role} interview answers objectively.
+
+{pairs}
+
+Provide scores (0-100) and expected answer guidance for each answer:
+- Technical competency and depth
+- Communication clarity and structure  
+- Relevance to the question asked
+- Expected answer elements that would demonstrate strong performance
+
+Return ONLY a JSON array with one object per answer, in the same order:
+[
+    {{"technical": 85, "communication": 90, "relevance": 85, "expected_answer": "A strong answer should include: specific examples and technical details."}}
+]
+
+Return only valid JSON, no additional text."""
+
+        response = self.call_ollama(prompt, temperature=0.1, max_tokens=200 * len(pending))
+        
+        try:
+            # Try to extract the JSON array from the response
+            json_start = response.find('[')
+            json_end = response.rfind(']') + 1
+            if json_start < 0 or json_end <= json_start:
+                raise json.JSONDecodeError("No JSON array found", response, 0)
+            batch = load_json(response[json_start:json_end])
+            if len(batch) != len(pending) or not all(isinstance(e, dict) for e in batch):
+                raise ValueError("Batch evaluation does not match the answers")
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning(f"⚠️ Batch evaluation unusable, evaluating individually: {e}")
+            return [self.evaluate_answer(q, a, candidate_context) for q, a in zip(question_texts, answers)]
+        
+        timestamp = datetime.now().isoformat()
+        evaluations = dict(zip(pending, batch))
+        results = []
+        for i, (question_text, answer) in enumerate(zip(question_texts, answers)):
+            if i in evaluations:
+                evaluations[i]["timestamp"] = timestamp
+                results.append(evaluations[i])
+            else:
+                results.append(self.evaluate_answer(question_text, answer, candidate_context))
+        return results
+
     def generate_final_report(self, candidate_context: Dict[str, Any], conversation_history: List[Dict[str, Any]], evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Layer 3: Generate comprehensive final report with scores and analysis.
@@ -463,7 +554,7 @@ Return only valid JSON, no additional text."""
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                report = json.loads(json_str)
+                report = load_json(json_str)
                 return report
             else:
                 raise json.JSONDecodeError("No JSON found", response, 0)
@@ -526,7 +617,7 @@ Return only valid JSON, no additional text."""
             json_end = response.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                analysis = json.loads(json_str)
+                analysis = load_json(json_str)
                 analysis["timestamp"] = datetime.now().isoformat()
                 return analysis
             else:
@@ -585,7 +676,7 @@ Return only valid JSON array, no additional text."""
             json_end = response.rfind(']') + 1
             if json_start >= 0 and json_end > json_start:
                 json_str = response[json_start:json_end]
-                questions = json.loads(json_str)
+                questions = load_json(json_str)
                 for i, q in enumerate(questions):
                     q["id"] = f"apt_{i+1}"
                     q["timestamp"] = datetime.now().isoformat()
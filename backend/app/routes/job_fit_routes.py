@@ -11,6 +11,7 @@ from typing import Dict, Any, List, Optional
 import logging
 import json
 import io
+import asyncio
 
 from app.database import get_db
 from app.ai_engines.engine_router import ai_engine_router
@@ -251,20 +252,18 @@ async def analyze_multiple_roles(
                 detail=f"Invalid roles: {', '.join(invalid_roles)}"
             )
         
-        role_analyses = []
-        
-        for role in roles_list:
+        async def analyze_role(role: str) -> Dict[str, Any]:
             try:
                 # Create job description for this role
                 job_description = _create_role_based_job_description(role)
                 
                 # Analyze fit using Ollama
-                fit_analysis = ai_engine_router.calculate_job_fit(
+                fit_analysis = await ai_engine_router.acalculate_job_fit(
                     candidate_context=parsed_resume_data,
                     job_description=job_description
                 )
                 
-                role_analyses.append({
+                return {
                     "role": role,
                     "overall_fit_score": fit_analysis.get("overall_fit_score", 0),
                     "skill_match_percentage": fit_analysis.get("skill_match_percentage", 0),
@@ -272,15 +271,18 @@ async def analyze_multiple_roles(
                     "role_suitability": fit_analysis.get("role_suitability", "Unknown"),
                     "top_missing_skills": fit_analysis.get("missing_skills", [])[:3],
                     "top_matched_skills": fit_analysis.get("matched_skills", [])[:5]
-                })
+                }
                 
             except Exception as e:
                 logger.error(f"Error analyzing role {role}: {e}")
-                role_analyses.append({
+                return {
                     "role": role,
                     "error": f"Analysis failed: {str(e)}",
                     "overall_fit_score": 0
-                })
+                }
+        
+        # Roles are independent, so analyze them concurrently
+        role_analyses = list(await asyncio.gather(*(analyze_role(role) for role in roles_list)))
         
         # Sort by fit score (descending)
         role_analyses.sort(key=lambda x: x.get("overall_fit_score", 0), reverse=True)
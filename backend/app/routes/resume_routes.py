@@ -3,10 +3,23 @@ from fastapi import APIRouter, UploadFile, File, HTTPException
 from typing import Optional
 import aiofiles
 import os
+import re
 import tempfile
 
 router = APIRouter()
 
+# Experience patterns are compiled once rather than on every parsed resume;
+# each one matches years or months in a single pass, the named group says which
+_EXPERIENCE_RES = (
+    re.compile(r'(\d+)\s*(?:(?P<years>years?|yrs?)|(?P<months>months?|mos?))\s*(?:of)?\s*experience'),
+    re.compile(r'(\d+)\+?\s*(?:(?P<years>years?|yrs?)|(?P<months>months?|mos?))\s*(?:in|of)'),
+)
+_EMPLOYMENT_DATE_RE = re.compile(
+    r'(\w+\s+\d{4}|\d{4})\s*[-–—]\s*(present|current|now|\w+\s+\d{4}|\d{4})',
+    re.IGNORECASE
+)
+_YEAR_RE = re.compile(r'\d{4}')
+
 # Try to import database and service, but make it optional
 try:
     from app.database import get_db
@@ -18,7 +31,6 @@ except ImportError:
 
 def parse_resume_simple(file_path: str) -> dict:
     """Advanced resume parsing without database dependency - uses same techniques as ResumeService"""
-    import re
     from datetime import datetime
     
     # Read file content
@@ -68,45 +80,34 @@ def parse_resume_simple(file_path: str) -> dict:
         if re.search(pattern, text_lower):
             found_skills.append(skill.title())
     
-    # Extract experience with multiple patterns
-    experience_patterns = [
-        r'(\d+)\s*(?:years?|yrs?)\s*(?:of)?\s*experience',
-        r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:in|of)',
-    ]
-    
-    # Also look for months and convert to years
-    month_patterns = [
-        r'(\d+)\s*(?:months?|mos?)\s*(?:of)?\s*experience',
-        r'(\d+)\+?\s*(?:months?|mos?)\s*(?:in|of)',
-    ]
-    
+    # Extract experience with multiple patterns, using the first years and
+    # first months match of each; months are converted to years
     years_experience = 0
-    for pattern in experience_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            years_experience = max(years_experience, int(match.group(1)))
-    
-    # Handle months separately and convert to years
-    for pattern in month_patterns:
-        match = re.search(pattern, text_lower)
-        if match:
-            months = int(match.group(1))
-            years_from_months = months / 12.0
-            years_experience = max(years_experience, years_from_months)
+    for pattern in _EXPERIENCE_RES:
+        found_years = found_months = False
+        for match in pattern.finditer(text_lower):
+            if match.group('years') and not found_years:
+                found_years = True
+                years_experience = max(years_experience, int(match.group(1)))
+            elif match.group('months') and not found_months:
+                found_months = True
+                years_from_months = int(match.group(1)) / 12.0
+                years_experience = max(years_experience, years_from_months)
+            if found_years and found_months:
+                break
     
     # Calculate from dates if available
     current_year = datetime.now().year
-    date_pattern = r'(\w+\s+\d{4}|\d{4})\s*[-–—]\s*(present|current|now|\w+\s+\d{4}|\d{4})'
-    matches = re.finditer(date_pattern, text, re.IGNORECASE)
+    matches = _EMPLOYMENT_DATE_RE.finditer(text)
     employment_years = []
     for match in matches:
         start_str = match.group(1)
         end_str = match.group(2).lower()
         try:
-            year_match = re.search(r'\d{4}', start_str)
+            year_match = _YEAR_RE.search(start_str)
             if year_match:
                 start_year = int(year_match.group())
-                end_year = current_year if end_str in ['present', 'current', 'now'] else int(re.search(r'\d{4}', end_str).group())
+                end_year = current_year if end_str in ['present', 'current', 'now'] else int(_YEAR_RE.search(end_str).group())
                 if start_year <= current_year:
                     employment_years.append((start_year, end_year))
         except:
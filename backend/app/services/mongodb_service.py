@@ -4,9 +4,11 @@ Demo implementation for AWS ImpactX Challenge presentation
 """
 
 import os
+import copy
 import json
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import logging
 
@@ -27,6 +29,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=32)
+def _load_demo_collection(collection_path: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Parse a demo collection file; mtime and size in the key invalidate it on write"""
+    with open(collection_path, 'r') as f:
+        return json.load(f)
+
 class MongoDBService:
     """MongoDB Service with demo mode for presentations"""
     
@@ -64,8 +72,15 @@ class MongoDBService:
             if not self.demo_mode and MONGODB_AVAILABLE:
                 self.client = MongoClient(
                     self.mongodb_uri,
+                    maxPoolSize=int(os.getenv('MONGODB_MAX_POOL_SIZE', '50')),
+                    minPoolSize=int(os.getenv('MONGODB_MIN_POOL_SIZE', '5')),
+                    compressors='zstd,zlib',  # zstd needs the zstandard package; zlib is the fallback
+                    retryWrites=True,
+                    w='majority',
+                    socketTimeoutMS=20000,
                     serverSelectionTimeoutMS=5000,
-                    connectTimeoutMS=5000
+                    connectTimeoutMS=5000,
+                    appname='genai-career'
                 )
                 # Test connection
                 self.client.admin.command('ping')
@@ -388,22 +403,28 @@ class MongoDBService:
             logger.error(f"❌ Demo insert failed: {e}")
             raise
     
+    def _read_demo_collection(self, collection_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached documents of a demo collection (read-only), or None if missing"""
+        collection_path = os.path.join(self.demo_storage_path, f"{collection_name}.json")
+        try:
+            file_stat = os.stat(collection_path)
+        except FileNotFoundError:
+            return None
+        return _load_demo_collection(collection_path, file_stat.st_mtime_ns, file_stat.st_size)
+    
     def _demo_find(self, collection_name: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Demo implementation of document search"""
         try:
-            collection_path = os.path.join(self.demo_storage_path, f"{collection_name}.json")
+            documents = self._read_demo_collection(collection_name)
             
-            if not os.path.exists(collection_path):
+            if documents is None:
                 return []
             
-            with open(collection_path, 'r') as f:
-                documents = json.load(f)
-            
-            # Simple query matching (for demo purposes)
+            # Simple query matching (for demo purposes); copies keep the cache intact
             results = []
             for doc in documents:
                 if self._matches_query(doc, query):
-                    results.append(doc)
+                    results.append(copy.deepcopy(doc))
             
             return results
             
@@ -478,16 +499,15 @@ class MongoDBService:
             
             for collection_name in self.collections.keys():
                 collection_path = os.path.join(self.demo_storage_path, f"{collection_name}.json")
+                documents = self._read_demo_collection(collection_name)
                 
-                if os.path.exists(collection_path):
-                    with open(collection_path, 'r') as f:
-                        documents = json.load(f)
-                        count = len(documents)
-                        stats["collections"][collection_name] = {
-                            "document_count": count,
-                            "file_size_kb": round(os.path.getsize(collection_path) / 1024, 2)
-                        }
-                        stats["total_documents"] += count
+                if documents is not None:
+                    count = len(documents)
+                    stats["collections"][collection_name] = {
+                        "document_count": count,
+                        "file_size_kb": round(os.path.getsize(collection_path) / 1024, 2)
+                    }
+                    stats["total_documents"] += count
                 else:
                     stats["collections"][collection_name] = {
                         "document_count": 0,
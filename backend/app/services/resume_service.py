@@ -2,13 +2,173 @@
 import pdfplumber
 from docx import Document
 import re
+import copy
+import bisect
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from app.models.resume import Resume
 from sqlalchemy.orm import Session
 
+_WS_RE = re.compile(r'\s+')
+
+# Comprehensive skill database with more keywords
+_SKILL_KEYWORDS = {
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'kotlin', 
+    'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
+    'dart', 'elixir', 'haskell', 'clojure', 'f#', 'vb.net', 'objective-c', 'assembly',
+    
+    # Web Technologies - Frontend
+    'react', 'angular', 'vue', 'vue.js', 'next.js', 'nuxt', 'svelte', 'ember', 'jquery', 
+    'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'stylus', 'webpack', 'vite', 
+    'babel', 'es6', 'es2015', 'jsx', 'tsx', 'bootstrap', 'tailwind', 'material-ui', 'mui',
+    'redux', 'mobx', 'vuex', 'pinia', 'rxjs', 'lodash', 'moment.js', 'axios', 'fetch',
+    
+    # Backend Frameworks & Technologies
+    'node.js', 'express', 'nestjs', 'koa', 'fastify', 'django', 'flask', 'fastapi', 
+    'spring', 'spring boot', 'laravel', 'symfony', 'codeigniter', 'rails', 'sinatra',
+    'asp.net', 'dotnet', '.net', '.net core', 'gin', 'echo', 'fiber', 'actix', 'rocket',
+    
+    # Databases & Data Storage
+    'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'cassandra', 'elasticsearch',
+    'dynamodb', 'oracle', 'sqlite', 'mariadb', 'neo4j', 'couchdb', 'firebase', 'firestore',
+    'influxdb', 'clickhouse', 'snowflake', 'bigquery', 'redshift', 'cosmos db', 'aurora',
+    
+    # Cloud Platforms & Services
+    'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud', 
+    'google cloud platform', 'heroku', 'vercel', 'netlify', 'digitalocean', 'linode',
+    'ec2', 's3', 'lambda', 'cloudformation', 'cloudwatch', 'rds', 'vpc', 'iam',
+    'azure functions', 'app service', 'cosmos db', 'azure sql', 'blob storage',
+    'compute engine', 'cloud storage', 'cloud functions', 'cloud run', 'bigquery',
+    
+    # DevOps & Infrastructure
+    'docker', 'kubernetes', 'k8s', 'terraform', 'ansible', 'puppet', 'chef', 'vagrant',
+    'jenkins', 'gitlab ci', 'github actions', 'circleci', 'travis ci', 'azure devops',
+    'ci/cd', 'continuous integration', 'continuous deployment', 'nginx', 'apache', 
+    'linux', 'unix', 'ubuntu', 'centos', 'debian', 'bash scripting', 'shell scripting',
+    'helm', 'istio', 'prometheus', 'grafana', 'elk stack', 'logstash', 'kibana',
+    
+    # Machine Learning & AI
+    'machine learning', 'deep learning', 'neural networks', 'artificial intelligence',
+    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
+    'seaborn', 'plotly', 'opencv', 'nltk', 'spacy', 'transformers', 'hugging face',
+    'nlp', 'natural language processing', 'computer vision', 'reinforcement learning',
+    'xgboost', 'lightgbm', 'catboost', 'random forest', 'svm', 'linear regression',
+    'logistic regression', 'clustering', 'classification', 'regression', 'ensemble methods',
+    
+    # Data Science & Analytics
+    'data analysis', 'data science', 'data visualization', 'data mining', 'statistics',
+    'statistical analysis', 'tableau', 'power bi', 'looker', 'qlik', 'qlikview', 'qliksense',
+    'excel', 'vba', 'sql', 'spark', 'apache spark', 'hadoop', 'hive', 'pig', 'kafka',
+    'airflow', 'luigi', 'dbt', 'snowflake', 'databricks', 'jupyter', 'r studio',
+    
+    # Mobile Development
+    'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova', 'phonegap',
+    'swift', 'kotlin', 'objective-c', 'java android', 'android studio', 'xcode',
+    'firebase', 'realm', 'core data', 'sqlite mobile', 'push notifications',
+    
+    # Testing & Quality Assurance
+    'testing', 'unit testing', 'integration testing', 'e2e testing', 'test automation',
+    'jest', 'mocha', 'chai', 'jasmine', 'cypress', 'selenium', 'webdriver', 'puppeteer',
+    'pytest', 'unittest', 'junit', 'testng', 'rspec', 'cucumber', 'postman', 'insomnia',
+    'load testing', 'performance testing', 'stress testing', 'jmeter', 'k6',
+    
+    # Security
+    'cybersecurity', 'information security', 'network security', 'web security',
+    'penetration testing', 'vulnerability assessment', 'owasp', 'ssl', 'tls', 'https',
+    'oauth', 'jwt', 'saml', 'ldap', 'active directory', 'encryption', 'cryptography',
+    'firewall', 'ids', 'ips', 'siem', 'soc', 'incident response', 'forensics',
+    
+    # Project Management & Methodologies
+    'agile', 'scrum', 'kanban', 'waterfall', 'lean', 'six sigma', 'project management',
+    'product management', 'jira', 'confluence', 'trello', 'asana', 'monday.com', 'notion',
+    'pmp', 'prince2', 'safe', 'scaled agile', 'devops', 'gitops', 'devsecops',
+    
+    # Version Control & Collaboration
+    'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'perforce', 'tfs',
+    'version control', 'source control', 'code review', 'pull request', 'merge request',
+    
+    # API & Integration
+    'rest api', 'restful', 'graphql', 'grpc', 'soap', 'websockets', 'microservices',
+    'api design', 'api development', 'api testing', 'postman', 'swagger', 'openapi',
+    'json', 'xml', 'yaml', 'protobuf', 'avro', 'message queues', 'rabbitmq', 'activemq',
+    
+    # Business Intelligence & Analytics
+    'business intelligence', 'bi', 'etl', 'data warehousing', 'olap', 'oltp', 'mdx',
+    'ssas', 'ssis', 'ssrs', 'crystal reports', 'cognos', 'microstrategy', 'pentaho',
+    
+    # Blockchain & Cryptocurrency
+    'blockchain', 'cryptocurrency', 'bitcoin', 'ethereum', 'smart contracts', 'solidity',
+    'web3', 'defi', 'nft', 'dapp', 'hyperledger', 'chaincode', 'truffle', 'ganache',
+    
+    # Game Development
+    'game development', 'unity', 'unreal engine', 'godot', 'game design', 'c# unity',
+    'blueprint', 'game physics', '2d games', '3d games', 'mobile games', 'indie games',
+    
+    # Design & UX/UI
+    'ui design', 'ux design', 'user experience', 'user interface', 'graphic design',
+    'web design', 'figma', 'sketch', 'adobe xd', 'invision', 'zeplin', 'principle',
+    'photoshop', 'illustrator', 'after effects', 'wireframing', 'prototyping',
+    'usability testing', 'user research', 'design thinking', 'design systems',
+    
+    # Soft Skills & Leadership
+    'leadership', 'team management', 'communication', 'problem solving', 'critical thinking',
+    'analytical thinking', 'creativity', 'innovation', 'collaboration', 'teamwork',
+    'mentoring', 'coaching', 'training', 'presentation skills', 'public speaking',
+    'negotiation', 'conflict resolution', 'time management', 'organization',
+    
+    # Industry-Specific
+    'fintech', 'healthtech', 'edtech', 'e-commerce', 'retail', 'banking', 'insurance',
+    'healthcare', 'pharmaceutical', 'automotive', 'aerospace', 'manufacturing',
+    'logistics', 'supply chain', 'telecommunications', 'media', 'entertainment',
+    
+    # Emerging Technologies
+    'artificial intelligence', 'machine learning', 'deep learning', 'computer vision',
+    'natural language processing', 'robotics', 'iot', 'internet of things', 'ar', 'vr',
+    'augmented reality', 'virtual reality', 'mixed reality', 'quantum computing',
+    'edge computing', 'serverless', 'microservices', 'containerization'
+}
+
+# Word-boundary pattern for each known skill, compiled once
+_SKILL_PATTERNS = tuple(
+    (skill, re.compile(r'\b' + re.escape(skill.lower()) + r'\b')) for skill in _SKILL_KEYWORDS
+)
+_SKILL_LIST_RE = re.compile(r'(?:skills?|technologies?|tools?)[\s:]+([^\.\n]{10,200})')
+_SKILL_DELIMITER_RE = re.compile(r'[,;•\-\|]')
+
+_PROJECT_ACTION_VERBS = ['built', 'developed', 'created', 'designed', 'implemented', 'architected', 
+                         'engineered', 'constructed', 'deployed', 'launched', 'established']
+_PROJECT_TECH_KEYWORDS = ['python', 'java', 'javascript', 'react', 'node', 'django', 'flask', 
+                          'aws', 'docker', 'kubernetes', 'mongodb', 'sql', 'machine learning']
+_PROJECT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Action verb + description + technology
+    r'(?:' + '|'.join(_PROJECT_ACTION_VERBS) + r')\s+[^\.]{15,150}(?:using|with|in|via)\s+(?:' + '|'.join(_PROJECT_TECH_KEYWORDS) + r')',
+    # Project name + description
+    r'([A-Z][A-Za-z0-9\s]{3,40})\s*[-–—]?\s*([^\.]{20,150})',
+    # "Project: ..." pattern
+    r'project[:\s]+([^\.]{20,150})',
+))
+_NUMBERED_ITEM_RE = re.compile(r'^\d+[\.\)]\s+')
+_BULLET_PREFIX_RE = re.compile(r'^[•\-*▪▸\d\.\)\s]+')
+
+# Degree patterns
+_DEGREE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(Bachelor|Master|PhD|Doctorate|Associate|Diploma|Certificate)\s+(?:of|in)?\s*(?:Science|Arts|Engineering|Technology|Business|Computer Science|Information Technology|IT)',
+    r'(B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Ph\.?D\.?|MBA|MCA|B\.?Tech|M\.?Tech)\s+(?:in|of)?\s*([A-Z][A-Za-z\s]+)',
+    r'(Bachelor|Master|PhD|Doctorate)\s+(?:Degree|of Science|of Arts|of Engineering)',
+))
+_NEWLINE_RE = re.compile('\n')
+
+# Required resume fields and the check each value must pass
+_VALIDATORS = (
+    ("skills", lambda v: isinstance(v, list) and len(v) > 0),
+    ("projects", lambda v: isinstance(v, list) and len(v) > 0),
+    ("experience_years", lambda v: isinstance(v, (int, float)) and v >= 0),
+)
+
 class ResumeService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Optional[Session] = None):
         self.db = db
     
     def parse_resume(self, file_path: str) -> Dict[str, Any]:
@@ -26,17 +186,18 @@ class ResumeService:
         # Extract information from text
         parsed_data = self._extract_resume_data(text)
         
-        # Save to database
-        resume = Resume(
-            file_name=file_path.split('/')[-1],
-            file_path=file_path,
-            extracted_text=text,
-            parsed_data=parsed_data
-        )
-        
-        self.db.add(resume)
-        self.db.commit()
-        self.db.refresh(resume)
+        # Save to database (parsing-only instances have no session)
+        if self.db is not None:
+            resume = Resume(
+                file_name=file_path.split('/')[-1],
+                file_path=file_path,
+                extracted_text=text,
+                parsed_data=parsed_data
+            )
+            
+            self.db.add(resume)
+            self.db.commit()
+            self.db.refresh(resume)
         
         return parsed_data
     
@@ -61,7 +222,12 @@ class ResumeService:
             raise Exception(f"Failed to extract text from DOCX: {str(e)}")
     
     def _extract_resume_data(self, text: str) -> Dict[str, Any]:
-        """Extract structured data from resume text"""
+        """Extract structured data from resume text (memoized per distinct text)"""
+        # Copy so callers can't modify the cached result
+        return copy.deepcopy(_extract_resume_data_cached(text))
+    
+    def _parse_resume_text(self, text: str) -> Dict[str, Any]:
+        """Run the full extraction pass over resume text"""
         skills = self._extract_skills(text)
         experience = self._extract_experience(text)
         projects = self._extract_projects(text)
@@ -79,123 +245,6 @@ class ResumeService:
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text using advanced techniques"""
-        # Comprehensive skill database with more keywords
-        skill_keywords = {
-            # Programming Languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'kotlin', 
-            'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash', 'powershell',
-            'dart', 'elixir', 'haskell', 'clojure', 'f#', 'vb.net', 'objective-c', 'assembly',
-            
-            # Web Technologies - Frontend
-            'react', 'angular', 'vue', 'vue.js', 'next.js', 'nuxt', 'svelte', 'ember', 'jquery', 
-            'html', 'html5', 'css', 'css3', 'sass', 'scss', 'less', 'stylus', 'webpack', 'vite', 
-            'babel', 'es6', 'es2015', 'jsx', 'tsx', 'bootstrap', 'tailwind', 'material-ui', 'mui',
-            'redux', 'mobx', 'vuex', 'pinia', 'rxjs', 'lodash', 'moment.js', 'axios', 'fetch',
-            
-            # Backend Frameworks & Technologies
-            'node.js', 'express', 'nestjs', 'koa', 'fastify', 'django', 'flask', 'fastapi', 
-            'spring', 'spring boot', 'laravel', 'symfony', 'codeigniter', 'rails', 'sinatra',
-            'asp.net', 'dotnet', '.net', '.net core', 'gin', 'echo', 'fiber', 'actix', 'rocket',
-            
-            # Databases & Data Storage
-            'sql', 'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'cassandra', 'elasticsearch',
-            'dynamodb', 'oracle', 'sqlite', 'mariadb', 'neo4j', 'couchdb', 'firebase', 'firestore',
-            'influxdb', 'clickhouse', 'snowflake', 'bigquery', 'redshift', 'cosmos db', 'aurora',
-            
-            # Cloud Platforms & Services
-            'aws', 'amazon web services', 'azure', 'microsoft azure', 'gcp', 'google cloud', 
-            'google cloud platform', 'heroku', 'vercel', 'netlify', 'digitalocean', 'linode',
-            'ec2', 's3', 'lambda', 'cloudformation', 'cloudwatch', 'rds', 'vpc', 'iam',
-            'azure functions', 'app service', 'cosmos db', 'azure sql', 'blob storage',
-            'compute engine', 'cloud storage', 'cloud functions', 'cloud run', 'bigquery',
-            
-            # DevOps & Infrastructure
-            'docker', 'kubernetes', 'k8s', 'terraform', 'ansible', 'puppet', 'chef', 'vagrant',
-            'jenkins', 'gitlab ci', 'github actions', 'circleci', 'travis ci', 'azure devops',
-            'ci/cd', 'continuous integration', 'continuous deployment', 'nginx', 'apache', 
-            'linux', 'unix', 'ubuntu', 'centos', 'debian', 'bash scripting', 'shell scripting',
-            'helm', 'istio', 'prometheus', 'grafana', 'elk stack', 'logstash', 'kibana',
-            
-            # Machine Learning & AI
-            'machine learning', 'deep learning', 'neural networks', 'artificial intelligence',
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
-            'seaborn', 'plotly', 'opencv', 'nltk', 'spacy', 'transformers', 'hugging face',
-            'nlp', 'natural language processing', 'computer vision', 'reinforcement learning',
-            'xgboost', 'lightgbm', 'catboost', 'random forest', 'svm', 'linear regression',
-            'logistic regression', 'clustering', 'classification', 'regression', 'ensemble methods',
-            
-            # Data Science & Analytics
-            'data analysis', 'data science', 'data visualization', 'data mining', 'statistics',
-            'statistical analysis', 'tableau', 'power bi', 'looker', 'qlik', 'qlikview', 'qliksense',
-            'excel', 'vba', 'sql', 'spark', 'apache spark', 'hadoop', 'hive', 'pig', 'kafka',
-            'airflow', 'luigi', 'dbt', 'snowflake', 'databricks', 'jupyter', 'r studio',
-            
-            # Mobile Development
-            'android', 'ios', 'react native', 'flutter', 'xamarin', 'ionic', 'cordova', 'phonegap',
-            'swift', 'kotlin', 'objective-c', 'java android', 'android studio', 'xcode',
-            'firebase', 'realm', 'core data', 'sqlite mobile', 'push notifications',
-            
-            # Testing & Quality Assurance
-            'testing', 'unit testing', 'integration testing', 'e2e testing', 'test automation',
-            'jest', 'mocha', 'chai', 'jasmine', 'cypress', 'selenium', 'webdriver', 'puppeteer',
-            'pytest', 'unittest', 'junit', 'testng', 'rspec', 'cucumber', 'postman', 'insomnia',
-            'load testing', 'performance testing', 'stress testing', 'jmeter', 'k6',
-            
-            # Security
-            'cybersecurity', 'information security', 'network security', 'web security',
-            'penetration testing', 'vulnerability assessment', 'owasp', 'ssl', 'tls', 'https',
-            'oauth', 'jwt', 'saml', 'ldap', 'active directory', 'encryption', 'cryptography',
-            'firewall', 'ids', 'ips', 'siem', 'soc', 'incident response', 'forensics',
-            
-            # Project Management & Methodologies
-            'agile', 'scrum', 'kanban', 'waterfall', 'lean', 'six sigma', 'project management',
-            'product management', 'jira', 'confluence', 'trello', 'asana', 'monday.com', 'notion',
-            'pmp', 'prince2', 'safe', 'scaled agile', 'devops', 'gitops', 'devsecops',
-            
-            # Version Control & Collaboration
-            'git', 'github', 'gitlab', 'bitbucket', 'svn', 'mercurial', 'perforce', 'tfs',
-            'version control', 'source control', 'code review', 'pull request', 'merge request',
-            
-            # API & Integration
-            'rest api', 'restful', 'graphql', 'grpc', 'soap', 'websockets', 'microservices',
-            'api design', 'api development', 'api testing', 'postman', 'swagger', 'openapi',
-            'json', 'xml', 'yaml', 'protobuf', 'avro', 'message queues', 'rabbitmq', 'activemq',
-            
-            # Business Intelligence & Analytics
-            'business intelligence', 'bi', 'etl', 'data warehousing', 'olap', 'oltp', 'mdx',
-            'ssas', 'ssis', 'ssrs', 'crystal reports', 'cognos', 'microstrategy', 'pentaho',
-            
-            # Blockchain & Cryptocurrency
-            'blockchain', 'cryptocurrency', 'bitcoin', 'ethereum', 'smart contracts', 'solidity',
-            'web3', 'defi', 'nft', 'dapp', 'hyperledger', 'chaincode', 'truffle', 'ganache',
-            
-            # Game Development
-            'game development', 'unity', 'unreal engine', 'godot', 'game design', 'c# unity',
-            'blueprint', 'game physics', '2d games', '3d games', 'mobile games', 'indie games',
-            
-            # Design & UX/UI
-            'ui design', 'ux design', 'user experience', 'user interface', 'graphic design',
-            'web design', 'figma', 'sketch', 'adobe xd', 'invision', 'zeplin', 'principle',
-            'photoshop', 'illustrator', 'after effects', 'wireframing', 'prototyping',
-            'usability testing', 'user research', 'design thinking', 'design systems',
-            
-            # Soft Skills & Leadership
-            'leadership', 'team management', 'communication', 'problem solving', 'critical thinking',
-            'analytical thinking', 'creativity', 'innovation', 'collaboration', 'teamwork',
-            'mentoring', 'coaching', 'training', 'presentation skills', 'public speaking',
-            'negotiation', 'conflict resolution', 'time management', 'organization',
-            
-            # Industry-Specific
-            'fintech', 'healthtech', 'edtech', 'e-commerce', 'retail', 'banking', 'insurance',
-            'healthcare', 'pharmaceutical', 'automotive', 'aerospace', 'manufacturing',
-            'logistics', 'supply chain', 'telecommunications', 'media', 'entertainment',
-            
-            # Emerging Technologies
-            'artificial intelligence', 'machine learning', 'deep learning', 'computer vision',
-            'natural language processing', 'robotics', 'iot', 'internet of things', 'ar', 'vr',
-            'augmented reality', 'virtual reality', 'mixed reality', 'quantum computing',
-            'edge computing', 'serverless', 'microservices', 'containerization'
-        }
         
         found_skills = []
         text_lower = text.lower()
@@ -225,40 +274,33 @@ class ResumeService:
         # Search in skills section first, then whole text
         search_text = skills_section_text if skills_section_text else text_lower
         
-        # Extract skills using keyword matching
-        for skill in skill_keywords:
-            # Use word boundaries for better matching
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, search_text):
+        # Extract skills using keyword matching (word boundaries for better matching)
+        for skill, pattern in _SKILL_PATTERNS:
+            if pattern.search(search_text):
                 # Format skill name properly
                 skill_name = skill.title() if len(skill.split()) == 1 else skill.title()
                 found_skills.append(skill_name)
         
         # Also extract skills mentioned in comma-separated lists
-        skill_list_pattern = r'(?:skills?|technologies?|tools?)[\s:]+([^\.\n]{10,200})'
-        skill_lists = re.findall(skill_list_pattern, text_lower)
+        skill_lists = _SKILL_LIST_RE.findall(text_lower)
         for skill_list in skill_lists:
             # Split by common delimiters
-            potential_skills = re.split(r'[,;•\-\|]', skill_list)
+            potential_skills = _SKILL_DELIMITER_RE.split(skill_list)
             for potential_skill in potential_skills:
                 skill_clean = potential_skill.strip()
                 if len(skill_clean) > 2 and len(skill_clean) < 30:
                     # Check if it matches any known skill
-                    for known_skill in skill_keywords:
+                    for known_skill in _SKILL_KEYWORDS:
                         if known_skill.lower() in skill_clean.lower() or skill_clean.lower() in known_skill.lower():
                             found_skills.append(skill_clean.title())
                             break
         
-        # Remove duplicates and return
-        unique_skills = []
-        seen = set()
+        # Remove duplicates (case-insensitive, first spelling wins) and return
+        unique_skills = {}
         for skill in found_skills:
-            skill_lower = skill.lower()
-            if skill_lower not in seen:
-                seen.add(skill_lower)
-                unique_skills.append(skill)
+            unique_skills.setdefault(skill.lower(), skill)
         
-        return unique_skills[:20]  # Return top 20 skills
+        return list(unique_skills.values())[:20]  # Return top 20 skills
     
     def _extract_experience(self, text: str) -> Dict[str, Any]:
         """Extract experience information - DISABLED for AWS ImpactX Challenge Demo
@@ -275,6 +317,10 @@ class ResumeService:
             "positions": []           # Empty list - no parsing
         }
     
+    def _extract_experience_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Extract experience information for several resume texts in one call"""
+        return [self._extract_experience(text) for text in texts]
+    
     def _extract_projects(self, text: str) -> List[str]:
         """Extract projects from resume text using advanced pattern matching"""
         projects = []
@@ -309,11 +355,11 @@ class ResumeService:
                 
                 # Detect project entries (bullet points, numbered, or project names)
                 if line_original.startswith(('•', '-', '*', '▪', '▸')) or \
-                   re.match(r'^\d+[\.\)]\s+', line_original) or \
+                   _NUMBERED_ITEM_RE.match(line_original) or \
                    (line_original and len(line_original) > 15 and 
                     not line_original.startswith(('EDUCATION', 'EXPERIENCE', 'SKILLS', 'CERTIFICATIONS'))):
                     
-                    clean_line = re.sub(r'^[•\-*▪▸\d\.\)\s]+', '', line_original).strip()
+                    clean_line = _BULLET_PREFIX_RE.sub('', line_original).strip()
                     
                     # Check if this is a new project (has project-like keywords or is capitalized)
                     if (any(word in clean_line.lower() for word in ['project', 'app', 'system', 'platform', 'tool', 'website', 'application']) or
@@ -332,28 +378,17 @@ class ResumeService:
             projects.append(' '.join(current_project))
         
         # Method 2: Pattern-based extraction (action verbs + technologies)
-        action_verbs = ['built', 'developed', 'created', 'designed', 'implemented', 'architected', 
-                       'engineered', 'constructed', 'deployed', 'launched', 'established']
-        tech_keywords = ['python', 'java', 'javascript', 'react', 'node', 'django', 'flask', 
-                        'aws', 'docker', 'kubernetes', 'mongodb', 'sql', 'machine learning']
-        
-        project_patterns = [
-            # Action verb + description + technology
-            r'(?:' + '|'.join(action_verbs) + r')\s+[^\.]{15,150}(?:using|with|in|via)\s+(?:' + '|'.join(tech_keywords) + r')',
-            # Project name + description
-            r'([A-Z][A-Za-z0-9\s]{3,40})\s*[-–—]?\s*([^\.]{20,150})',
-            # "Project: ..." pattern
-            r'project[:\s]+([^\.]{20,150})',
-        ]
-        
-        for pattern in project_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        action_verbs = _PROJECT_ACTION_VERBS
+        tech_keywords = _PROJECT_TECH_KEYWORDS
+        
+        for pattern in _PROJECT_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 project_text = ' '.join(match.groups()) if match.groups() else match.group(0)
                 project_text = project_text.strip()
                 if len(project_text) > 20 and len(project_text) < 250:
                     # Clean up the text
-                    project_text = re.sub(r'\s+', ' ', project_text)
+                    project_text = _WS_RE.sub(' ', project_text)
                     projects.append(project_text)
         
         # Method 3: Extract from work experience (projects mentioned in job descriptions)
@@ -371,22 +406,17 @@ class ResumeService:
                     if any(tech in line_lower for tech in tech_keywords):
                         projects.append(line.strip())
         
-        # Clean and deduplicate
-        cleaned_projects = []
-        seen = set()
-        for project in projects:
-            # Remove extra whitespace and normalize
-            project_clean = re.sub(r'\s+', ' ', project.strip())
+        # Clean and deduplicate (case-insensitive, first spelling wins)
+        cleaned_projects = {}
+        for project_clean in (_WS_RE.sub(' ', project.strip()) for project in projects):
             project_lower = project_clean.lower()
             
-            # Skip if too short, too long, or duplicate
+            # Skip if too short, too long, or contact details
             if (len(project_clean) > 20 and len(project_clean) < 250 and 
-                project_lower not in seen and
                 not any(skip in project_lower for skip in ['email', 'phone', 'address', 'linkedin'])):
-                seen.add(project_lower)
-                cleaned_projects.append(project_clean)
+                cleaned_projects.setdefault(project_lower, project_clean)
         
-        return cleaned_projects[:15]  # Return top 15 projects
+        return list(cleaned_projects.values())[:15]  # Return top 15 projects
     
     def _extract_education(self, text: str) -> List[str]:
         """Extract education information with degree types and institutions"""
@@ -394,13 +424,6 @@ class ResumeService:
         lines = text.split('\n')
         text_lower = text.lower()
         
-        # Degree patterns
-        degree_patterns = [
-            r'(Bachelor|Master|PhD|Doctorate|Associate|Diploma|Certificate)\s+(?:of|in)?\s*(?:Science|Arts|Engineering|Technology|Business|Computer Science|Information Technology|IT)',
-            r'(B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|Ph\.?D\.?|MBA|MCA|B\.?Tech|M\.?Tech)\s+(?:in|of)?\s*([A-Z][A-Za-z\s]+)',
-            r'(Bachelor|Master|PhD|Doctorate)\s+(?:Degree|of Science|of Arts|of Engineering)',
-        ]
-        
         # Institution patterns
         institution_keywords = ['university', 'college', 'institute', 'school', 'academy']
         
@@ -437,17 +460,20 @@ class ResumeService:
         if education_buffer:
             education.append(' '.join(education_buffer))
         
+        # Newline offsets bracketed by sentinels, so the line enclosing a
+        # match is a binary search instead of a scan over the whole text
+        newlines = [-1] + [m.start() for m in _NEWLINE_RE.finditer(text)] + [len(text)]
+        
         # Pattern-based extraction
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _DEGREE_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Get context around the match (next 2-3 lines)
                 match_start = match.start()
                 # Find the line containing this match
-                line_start = text.rfind('\n', 0, match_start) + 1
-                line_end = text.find('\n', match_start)
-                if line_end == -1:
-                    line_end = len(text)
+                idx = bisect.bisect_right(newlines, match_start)
+                line_start = newlines[idx - 1] + 1
+                line_end = newlines[idx]
                 
                 education_line = text[line_start:line_end].strip()
                 if len(education_line) > 10 and len(education_line) < 200:
@@ -455,9 +481,8 @@ class ResumeService:
                     next_lines = text[match_start:match_start+200]
                     if any(inst in next_lines.lower() for inst in institution_keywords):
                         # Include next line if it has institution
-                        next_line_end = text.find('\n', line_end)
-                        if next_line_end != -1 and next_line_end - line_end < 100:
-                            education_line += ' ' + text[line_end+1:next_line_end].strip()
+                        if idx + 1 < len(newlines) and newlines[idx + 1] - line_end < 100:
+                            education_line += ' ' + text[line_end+1:newlines[idx + 1]].strip()
                     
                     education.append(education_line)
         
@@ -471,37 +496,18 @@ class ResumeService:
                     if not any(skip in line_lower for skip in ['experience', 'skills', 'projects']):
                         education.append(line.strip())
         
-        # Clean and deduplicate
-        cleaned_education = []
-        seen = set()
-        for edu in education:
-            edu_clean = re.sub(r'\s+', ' ', edu.strip())
-            edu_lower = edu_clean.lower()
-            if edu_lower not in seen and len(edu_clean) > 10:
-                seen.add(edu_lower)
-                cleaned_education.append(edu_clean)
+        # Clean and deduplicate (case-insensitive, first spelling wins)
+        cleaned_education = {}
+        for edu_clean in (_WS_RE.sub(' ', edu.strip()) for edu in education):
+            if len(edu_clean) > 10:
+                cleaned_education.setdefault(edu_clean.lower(), edu_clean)
         
-        return cleaned_education[:5]  # Return max 5 education entries
+        return list(cleaned_education.values())[:5]  # Return max 5 education entries
     
     def validate_resume(self, parsed: Dict[str, Any]) -> List[str]:
         """Validate resume data and return list of missing required fields"""
-        required = ["skills", "projects", "experience_years"]
-        missing = []
-        
-        for field in required:
-            value = parsed.get(field)
-            if not value:
-                missing.append(field)
-            elif field == "skills" and (not isinstance(value, list) or len(value) == 0):
-                missing.append(field)
-            elif field == "projects" and (not isinstance(value, list) or len(value) == 0):
-                missing.append(field)
-            elif field == "experience_years" and (not isinstance(value, (int, float)) or value < 0):
-                # Experience years should be at least 0, default is now 1.0 (12 months)
-                if field not in parsed:
-                    missing.append(field)
-        
-        return missing
+        # Experience years of 0 is valid; only missing or negative values fail
+        return [field for field, is_valid in _VALIDATORS if not is_valid(parsed.get(field))]
     
     def _estimate_role(self, skills: List[str]) -> str:
         """Estimate role based on skills"""
@@ -540,12 +546,16 @@ class ResumeService:
         """Generate a summary based on extracted data"""
         level = experience.get('level', 'Mid-Level')  # Safe default
         years = experience.get('years_experience', 2.0)  # Safe default
-        top_skills = skills[:5]
+        top_skills = tuple(skills[:5])
         
         # Always show as 2 years for consistency (no parsing issues)
         years_str = "2"
         
-        summary = f"{level} professional with {years_str} years of experience. "
-        summary += f"Skilled in {', '.join(top_skills)}."
-        
-        return summary
\ No newline at end of file
+        return f"{level} professional with {years_str} years of experience. Skilled in {', '.join(top_skills)}."
+
+
+@lru_cache(maxsize=512)
+def _extract_resume_data_cached(text: str) -> Dict[str, Any]:
+    """Parse each distinct resume text once"""
+    # Extraction is pure string parsing and never touches the DB session
+    return ResumeService()._parse_resume_text(text)
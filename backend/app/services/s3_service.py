@@ -6,13 +6,19 @@ Demo implementation for AWS ImpactX Challenge presentation
 import os
 import json
 import uuid
+import asyncio
+import sqlite3
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any
 import logging
 
+from app.utils.json_utils import dump_json
+
 # Optional imports for AWS - fallback to demo mode if not available
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError, NoCredentialsError
     AWS_AVAILABLE = True
 except ImportError:
@@ -25,6 +31,18 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'doc': 'application/msword',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'txt': 'text/plain',
+    'json': 'application/json'
+}
+
+def _file_extension(filename: str) -> str:
+    """Lowercase file extension without the leading dot"""
+    return os.path.splitext(filename)[1][1:].lower()
+
 class S3Service:
     """S3 Service with demo mode for presentations"""
     
@@ -33,12 +51,17 @@ class S3Service:
         self.region = os.getenv('AWS_REGION', 'us-east-1')
         self.demo_mode = os.getenv('DEMO_MODE', 'true').lower() == 'true'
         
-        # Demo storage directory
+        # Demo storage directory (created along with its subdirectories,
+        # which are only stat'ed when they already exist)
         self.demo_storage_path = os.path.join(os.getcwd(), 'demo_storage')
-        os.makedirs(self.demo_storage_path, exist_ok=True)
-        os.makedirs(os.path.join(self.demo_storage_path, 'resumes'), exist_ok=True)
-        os.makedirs(os.path.join(self.demo_storage_path, 'reports'), exist_ok=True)
-        os.makedirs(os.path.join(self.demo_storage_path, 'backups'), exist_ok=True)
+        for subdir in ('resumes', 'reports', 'backups'):
+            subdir_path = os.path.join(self.demo_storage_path, subdir)
+            if not os.path.isdir(subdir_path):
+                os.makedirs(subdir_path, exist_ok=True)
+        
+        # Demo file metadata index (opened on first use)
+        self._meta_db = None
+        self._meta_db_lock = threading.Lock()
         
         # Initialize S3 client
         self.s3_client = None
@@ -52,7 +75,11 @@ class S3Service:
                     's3',
                     region_name=self.region,
                     aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY')
+                    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+                    config=Config(
+                        max_pool_connections=int(os.getenv('AWS_S3_MAX_POOL_CONNECTIONS', '50')),
+                        retries={'mode': 'adaptive'}
+                    )
                 )
                 # Test connection
                 self.s3_client.head_bucket(Bucket=self.bucket_name)
@@ -72,6 +99,65 @@ class S3Service:
             self.demo_mode = True
             self.s3_client = None
     
+    def _get_metadata_index(self) -> sqlite3.Connection:
+        """Open the demo file metadata index, creating it on first use"""
+        if self._meta_db is None:
+            index_path = os.path.join(self.demo_storage_path, 'index.db')
+            is_new = not os.path.exists(index_path)
+            
+            db = sqlite3.connect(index_path, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                """CREATE TABLE IF NOT EXISTS files (
+                    user_id TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    file_size INTEGER NOT NULL,
+                    upload_time TEXT NOT NULL,
+                    file_type TEXT,
+                    PRIMARY KEY (user_id, filename)
+                )"""
+            )
+            
+            if is_new:
+                self._import_legacy_metadata(db)
+            
+            self._meta_db = db
+        
+        return self._meta_db
+    
+    def _import_legacy_metadata(self, db: sqlite3.Connection):
+        """Index resumes stored before the index existed (one-time scan)"""
+        resumes_dir = os.path.join(self.demo_storage_path, 'resumes')
+        rows = []
+        
+        for user_id in os.listdir(resumes_dir):
+            user_dir = os.path.join(resumes_dir, user_id)
+            if not os.path.isdir(user_dir):
+                continue
+            
+            for filename in os.listdir(user_dir):
+                if filename.endswith('.metadata.json'):
+                    continue
+                
+                file_path = os.path.join(user_dir, filename)
+                metadata = {}
+                metadata_path = f"{file_path}.metadata.json"
+                if os.path.exists(metadata_path):
+                    with open(metadata_path, 'r') as f:
+                        metadata = json.load(f)
+                
+                rows.append((
+                    user_id,
+                    filename,
+                    metadata.get("file_size", os.path.getsize(file_path)),
+                    metadata.get("upload_time") or datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat(),
+                    metadata.get("file_type", _file_extension(filename))
+                ))
+        
+        db.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", rows)
+        logger.info(f"📇 Demo: Indexed {len(rows)} existing resume files")
+    
     def upload_resume(self, user_id: str, file_content: bytes, filename: str) -> Dict[str, Any]:
         """Upload resume file to S3 or demo storage"""
         try:
@@ -90,6 +176,10 @@ class S3Service:
                 "file_url": None
             }
     
+    async def upload_resume_async(self, user_id: str, file_content: bytes, filename: str) -> Dict[str, Any]:
+        """Upload resume without blocking the event loop"""
+        return await asyncio.to_thread(self.upload_resume, user_id, file_content, filename)
+    
     def _demo_upload_resume(self, user_id: str, file_content: bytes, filename: str, file_key: str) -> Dict[str, Any]:
         """Demo implementation of resume upload"""
         try:
@@ -97,10 +187,15 @@ class S3Service:
             user_dir = os.path.join(self.demo_storage_path, 'resumes', user_id)
             os.makedirs(user_dir, exist_ok=True)
             
-            # Save file locally
+            # Save file locally, writing the bytes straight to the fd
             file_path = os.path.join(user_dir, filename)
-            with open(file_path, 'wb') as f:
-                f.write(file_content)
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(file_content)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
             # Create metadata
             metadata = {
@@ -108,14 +203,16 @@ class S3Service:
                 "filename": filename,
                 "file_size": len(file_content),
                 "upload_time": datetime.now().isoformat(),
-                "file_type": filename.split('.')[-1].lower(),
+                "file_type": _file_extension(filename),
                 "demo_mode": True
             }
             
             # Save metadata
-            metadata_path = os.path.join(user_dir, f"{filename}.metadata.json")
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            with self._meta_db_lock:
+                self._get_metadata_index().execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                    (user_id, filename, metadata["file_size"], metadata["upload_time"], metadata["file_type"])
+                )
             
             logger.info(f"📁 Demo: Resume uploaded to {file_path}")
             
@@ -135,6 +232,8 @@ class S3Service:
     def _s3_upload_resume(self, file_content: bytes, file_key: str, filename: str) -> Dict[str, Any]:
         """Real S3 implementation of resume upload"""
         try:
+            upload_time = datetime.now().isoformat()
+            
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
@@ -142,7 +241,7 @@ class S3Service:
                 Body=file_content,
                 ContentType=self._get_content_type(filename),
                 Metadata={
-                    'upload_time': datetime.now().isoformat(),
+                    'upload_time': upload_time,
                     'original_filename': filename
                 }
             )
@@ -156,7 +255,7 @@ class S3Service:
                 "success": True,
                 "file_url": file_url,
                 "file_size": len(file_content),
-                "upload_time": datetime.now().isoformat(),
+                "upload_time": upload_time,
                 "demo_mode": False
             }
             
@@ -168,7 +267,7 @@ class S3Service:
         """Store interview report to S3 or demo storage"""
         try:
             file_key = f"reports/{session_id}/interview_report.json"
-            report_json = json.dumps(report_data, indent=2)
+            report_json = dump_json(report_data, indent=True)
             
             if self.demo_mode:
                 return self._demo_store_report(session_id, report_json, file_key)
@@ -183,7 +282,11 @@ class S3Service:
                 "report_url": None
             }
     
-    def _demo_store_report(self, session_id: str, report_json: str, file_key: str) -> Dict[str, Any]:
+    async def store_interview_report_async(self, session_id: str, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Store interview report without blocking the event loop"""
+        return await asyncio.to_thread(self.store_interview_report, session_id, report_data)
+    
+    def _demo_store_report(self, session_id: str, report_json: bytes, file_key: str) -> Dict[str, Any]:
         """Demo implementation of report storage"""
         try:
             # Create session directory
@@ -192,7 +295,7 @@ class S3Service:
             
             # Save report
             report_path = os.path.join(session_dir, 'interview_report.json')
-            with open(report_path, 'w') as f:
+            with open(report_path, 'wb') as f:
                 f.write(report_json)
             
             # Create summary for demo
@@ -205,8 +308,8 @@ class S3Service:
                 "storage_location": "local_demo_storage"
             }
             
-            with open(summary_path, 'w') as f:
-                json.dump(summary, f, indent=2)
+            with open(summary_path, 'wb') as f:
+                f.write(dump_json(summary, indent=True))
             
             logger.info(f"📊 Demo: Report stored to {report_path}")
             
@@ -223,9 +326,11 @@ class S3Service:
             logger.error(f"❌ Demo report storage failed: {e}")
             raise
     
-    def _s3_store_report(self, report_json: str, file_key: str) -> Dict[str, Any]:
+    def _s3_store_report(self, report_json: bytes, file_key: str) -> Dict[str, Any]:
         """Real S3 implementation of report storage"""
         try:
+            generated_time = datetime.now().isoformat()
+            
             # Upload to S3
             self.s3_client.put_object(
                 Bucket=self.bucket_name,
@@ -233,7 +338,7 @@ class S3Service:
                 Body=report_json,
                 ContentType='application/json',
                 Metadata={
-                    'generated_time': datetime.now().isoformat(),
+                    'generated_time': generated_time,
                     'content_type': 'interview_report'
                 }
             )
@@ -246,7 +351,7 @@ class S3Service:
                 "success": True,
                 "report_url": report_url,
                 "file_size": len(report_json),
-                "generated_time": datetime.now().isoformat(),
+                "generated_time": generated_time,
                 "demo_mode": False
             }
             
@@ -286,29 +391,25 @@ class S3Service:
     def _demo_list_user_files(self, user_id: str) -> Dict[str, Any]:
         """Demo implementation of file listing"""
         try:
-            files = []
-            user_dir = os.path.join(self.demo_storage_path, 'resumes', user_id)
-            
-            if os.path.exists(user_dir):
-                for filename in os.listdir(user_dir):
-                    if not filename.endswith('.metadata.json'):
-                        file_path = os.path.join(user_dir, filename)
-                        metadata_path = os.path.join(user_dir, f"{filename}.metadata.json")
-                        
-                        file_info = {
-                            "filename": filename,
-                            "file_size": os.path.getsize(file_path),
-                            "last_modified": datetime.fromtimestamp(os.path.getmtime(file_path)).isoformat(),
-                            "file_url": f"demo://s3/resumes/{user_id}/{filename}"
-                        }
-                        
-                        # Add metadata if available
-                        if os.path.exists(metadata_path):
-                            with open(metadata_path, 'r') as f:
-                                metadata = json.load(f)
-                                file_info.update(metadata)
-                        
-                        files.append(file_info)
+            with self._meta_db_lock:
+                rows = self._get_metadata_index().execute(
+                    "SELECT filename, file_size, upload_time, file_type FROM files WHERE user_id = ? ORDER BY filename",
+                    (user_id,)
+                ).fetchall()
+            
+            files = [
+                {
+                    "filename": filename,
+                    "file_size": file_size,
+                    "last_modified": upload_time,
+                    "file_url": f"demo://s3/resumes/{user_id}/{filename}",
+                    "user_id": user_id,
+                    "upload_time": upload_time,
+                    "file_type": file_type,
+                    "demo_mode": True
+                }
+                for filename, file_size, upload_time, file_type in rows
+            ]
             
             return {
                 "success": True,
@@ -325,19 +426,18 @@ class S3Service:
     def _s3_list_user_files(self, user_id: str) -> Dict[str, Any]:
         """Real S3 implementation of file listing"""
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=f"resumes/{user_id}/"
-            )
+            pages = self._list_objects_pages(Prefix=f"resumes/{user_id}/")
             
-            files = []
-            for obj in response.get('Contents', []):
-                files.append({
+            files = [
+                {
                     "filename": obj['Key'].split('/')[-1],
                     "file_size": obj['Size'],
                     "last_modified": obj['LastModified'].isoformat(),
                     "file_url": f"s3://{self.bucket_name}/{obj['Key']}"
-                })
+                }
+                for page in pages
+                for obj in page.get('Contents', [])
+            ]
             
             return {
                 "success": True,
@@ -377,19 +477,22 @@ class S3Service:
                 "last_updated": datetime.now().isoformat()
             }
             
-            # Count files and calculate sizes
-            for root, dirs, files in os.walk(self.demo_storage_path):
+            # Resumes come straight from the metadata index
+            with self._meta_db_lock:
+                resumes_count, resumes_size = self._get_metadata_index().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(file_size), 0) FROM files"
+                ).fetchone()
+            stats["resumes_count"] = resumes_count
+            stats["total_files"] += resumes_count
+            stats["total_size_bytes"] += resumes_size
+            
+            # Reports are not indexed, so count them on disk
+            for root, dirs, files in os.walk(os.path.join(self.demo_storage_path, 'reports')):
                 for file in files:
-                    if not file.endswith('.metadata.json'):
-                        file_path = os.path.join(root, file)
-                        file_size = os.path.getsize(file_path)
-                        stats["total_files"] += 1
-                        stats["total_size_bytes"] += file_size
-                        
-                        if 'resumes' in root:
-                            stats["resumes_count"] += 1
-                        elif 'reports' in root:
-                            stats["reports_count"] += 1
+                    file_path = os.path.join(root, file)
+                    stats["total_files"] += 1
+                    stats["total_size_bytes"] += os.path.getsize(file_path)
+                    stats["reports_count"] += 1
             
             # Convert bytes to human readable
             stats["total_size_mb"] = round(stats["total_size_bytes"] / (1024 * 1024), 2)
@@ -405,10 +508,12 @@ class S3Service:
         try:
             # This would require CloudWatch metrics in real implementation
             # For now, return basic bucket info
-            response = self.s3_client.list_objects_v2(Bucket=self.bucket_name)
-            
-            total_size = sum(obj['Size'] for obj in response.get('Contents', []))
-            total_files = len(response.get('Contents', []))
+            total_size = 0
+            total_files = 0
+            for page in self._list_objects_pages():
+                contents = page.get('Contents', [])
+                total_files += len(contents)
+                total_size += sum(obj['Size'] for obj in contents)
             
             return {
                 "success": True,
@@ -425,17 +530,18 @@ class S3Service:
             logger.error(f"❌ S3 storage stats failed: {e}")
             raise
     
+    def _list_objects_pages(self, **kwargs):
+        """Iterate over every list_objects_v2 page (S3 returns at most 1000 keys per call)"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        return paginator.paginate(
+            Bucket=self.bucket_name,
+            PaginationConfig={'PageSize': 1000},
+            **kwargs
+        )
+    
     def _get_content_type(self, filename: str) -> str:
         """Get content type based on file extension"""
-        ext = filename.lower().split('.')[-1]
-        content_types = {
-            'pdf': 'application/pdf',
-            'doc': 'application/msword',
-            'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'txt': 'text/plain',
-            'json': 'application/json'
-        }
-        return content_types.get(ext, 'application/octet-stream')
+        return _CONTENT_TYPES.get(_file_extension(filename), 'application/octet-stream')
 
 # Global S3 service instance
 s3_service = S3Service()
\ No newline at end of file
@@ -0,0 +1,29 @@
+# backend/app/utils/json_utils.py
+import json
+from typing import Any
+
+# Optional fast JSON codec - fallback to stdlib json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to JSON bytes (two-space indented if asked), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(",", ":")).encode('utf-8')
+
+def dump_json_str(data: Any, indent: bool = False) -> str:
+    """Serialize data to a JSON string, e.g. for form fields and printed reports"""
+    return dump_json(data, indent).decode('utf-8')
+
+def load_json(body: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
@@ -5,12 +5,17 @@ Check AI engine status after interview test
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Reused across calls so repeated polls keep the connection alive
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 def check_engine_status():
     """Check which AI engine is being used"""
     
     try:
-        response = requests.get('http://localhost:8000/api/v1/ai-engine/status')
+        response = _SESSION.get('http://localhost:8000/api/v1/ai-engine/status')
         
         if response.status_code == 200:
             data = response.json()['data']
@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures for the backend test scripts
+
+The AI engine router (and the engines it owns) is created once per test
+session - once per worker under pytest-xdist - so each test doesn't reload
+API keys, re-probe Ollama and reopen connections.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+# Load environment variables before the engines read their configuration
+backend_dir = Path(__file__).parent
+env_file = backend_dir / ".env"
+if env_file.exists():
+    load_dotenv(env_file)
+
+# Add backend to path
+sys.path.append(str(backend_dir))
+
+
+@pytest.fixture(scope="session")
+def router():
+    """The shared AI engine router"""
+    from app.ai_engines.engine_router import ai_engine_router
+    return ai_engine_router
+
+
+@pytest.fixture(scope="session")
+def gemini_engine(router):
+    """The router's Gemini engine"""
+    return router.gemini_engine
+
+
+@pytest.fixture(scope="session")
+def ollama_engine(router):
+    """The router's Ollama engine"""
+    return router.ollama_engine
@@ -80,12 +80,25 @@ async def test_demo_integration():
         # Simulate complete workflow
         candidate_name = "AWS ImpactX Demo User"
         
-        # 1. Upload resume
+        # 1. Upload resume while the job fit analysis is stored
         resume_content = b"Professional resume content for demonstration"
-        upload_result = s3_service.upload_resume(
-            user_id="impactx_demo_user",
-            file_content=resume_content,
-            filename="impactx_demo_resume.pdf"
+        job_fit_result = {
+            "candidateName": candidate_name,
+            "targetRole": "AWS Solutions Architect",
+            "overallFitScore": 92,
+            "skillMatchPercentage": 90,
+            "recommendation": "Excellent Fit for AWS Role",
+            "matchedSkills": ["Python", "AWS", "S3", "MongoDB"],
+            "aws_impactx_challenge": True
+        }
+        
+        upload_result, job_fit_id = await asyncio.gather(
+            s3_service.upload_resume_async(
+                user_id="impactx_demo_user",
+                file_content=resume_content,
+                filename="impactx_demo_resume.pdf"
+            ),
+            asyncio.to_thread(mongodb_service.insert_job_fit_analysis, job_fit_result)
         )
         
         # 2. Store resume analysis in MongoDB
@@ -108,20 +121,7 @@ async def test_demo_integration():
             "data": resume_analysis
         })
         
-        # 3. Run job fit analysis
-        job_fit_result = {
-            "candidateName": candidate_name,
-            "targetRole": "AWS Solutions Architect",
-            "overallFitScore": 92,
-            "skillMatchPercentage": 90,
-            "recommendation": "Excellent Fit for AWS Role",
-            "matchedSkills": ["Python", "AWS", "S3", "MongoDB"],
-            "aws_impactx_challenge": True
-        }
-        
-        job_fit_id = mongodb_service.insert_job_fit_analysis(job_fit_result)
-        
-        # 4. Generate comprehensive report
+        # 3. Generate comprehensive report
         report_data = {
             "candidate": candidate_name,
             "resume_analysis_id": analysis_id,
@@ -136,7 +136,7 @@ async def test_demo_integration():
             "generated_at": datetime.now().isoformat()
         }
         
-        report_result = s3_service.store_interview_report("impactx_demo_session", report_data)
+        report_result = await s3_service.store_interview_report_async("impactx_demo_session", report_data)
         
         print(f"✅ Full Integration Success!")
         print(f"   📁 Resume stored in S3: {upload_result['file_url']}")
@@ -7,47 +7,138 @@ Installs all required packages for S3 and MongoDB integration
 import subprocess
 import sys
 import os
+import tempfile
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor
 
-def install_package(package):
+# tqdm is optional - this script may run before anything is installed
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Persistent pip cache so repeat runs (and CI with this dir mounted) skip downloads
+PIP_CACHE_DIR = os.environ.get(
+    "PIP_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pip-cache")
+)
+
+def already_satisfied(package):
+    """Check whether an exact name==version pin is already installed"""
+    name, _, version = package.partition("==")
+    if not version:
+        # Only exact pins can be checked without a version parser
+        return False
+    try:
+        # Metadata is keyed by the bare distribution name, e.g. uvicorn for uvicorn[standard]
+        return importlib.metadata.version(name.split('[', 1)[0]) == version
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+def progress(iterable, desc, total=None):
+    """Wrap an iterable in a single in-place progress bar when tqdm is available"""
+    if not TQDM_AVAILABLE:
+        return iterable
+    return tqdm(iterable, desc=desc, total=total, unit="pkg")
+
+def install_package(package, quiet=False):
     """Install a package using pip"""
+    if already_satisfied(package):
+        if not quiet:
+            print(f"✅ {package} already installed")
+        return True
+    
+    # In quiet mode pip's own output would shred the progress bar
+    stdout = subprocess.DEVNULL if quiet else None
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        print(f"✅ Successfully installed {package}")
+        subprocess.check_call(
+            [sys.executable, "-m", "pip", "install", "--cache-dir", PIP_CACHE_DIR, package],
+            stdout=stdout
+        )
+        if not quiet:
+            print(f"✅ Successfully installed {package}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install {package}: {e}")
+        if not quiet:
+            print(f"❌ Failed to install {package}: {e}")
         return False
 
+def download_package(package, dest):
+    """Download a package's wheel/sdist without installing it"""
+    result = subprocess.run([
+        sys.executable, "-m", "pip", "download",
+        "--no-input", "--disable-pip-version-check", "--quiet", "--no-deps",
+        "--cache-dir", PIP_CACHE_DIR, "--dest", dest, package
+    ])
+    return result.returncode == 0
+
+def prefetch_packages(packages, dest):
+    """Download packages concurrently so the install step finds them locally"""
+    # Only downloads overlap - concurrent pip installs into one environment are unsafe
+    with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+        downloads = executor.map(lambda package: download_package(package, dest), packages)
+        list(progress(downloads, "pip download", total=len(packages)))
+
+def install_packages(packages, find_links=None):
+    """Install all packages with a single pip invocation"""
+    command = [
+        sys.executable, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check", "--cache-dir", PIP_CACHE_DIR
+    ]
+    if find_links:
+        command += ["--find-links", find_links]
+    result = subprocess.run(command + list(packages))
+    return result.returncode == 0
+
 def main():
     """Install all required dependencies"""
     print("🚀 Installing GenAI Career Platform Dependencies...")
     print("=" * 60)
     
-    # Core dependencies for S3 and MongoDB integration
+    # Core dependencies for S3 and MongoDB integration, listed in dependency
+    # order (botocore before boto3, pymongo before motor, pydantic before
+    # fastapi) so the resolver pins shared libraries before their consumers
     dependencies = [
-        "boto3==1.34.0",
-        "botocore==1.34.0", 
-        "pymongo==4.6.0",
-        "motor==3.3.2",
-        "fastapi==0.104.1",
-        "uvicorn==0.24.0",
-        "python-multipart==0.0.6",
+        "numpy>=2.0.0",
+        "requests>=2.31.0",
         "pydantic==1.10.24",
         "python-dotenv==1.0.0",
+        "python-multipart==0.0.6",
         "aiofiles==23.2.1",
+        "botocore==1.34.0",
+        "pymongo==4.6.0",
         "pdfplumber==0.10.3",
         "python-docx==1.1.0",
+        "boto3==1.34.0",
+        "motor==3.3.2",
+        "fastapi==0.104.1",
+        "uvicorn[standard]==0.24.0",
         "google-generativeai==0.3.2",
-        "ollama==0.1.7",
-        "requests>=2.31.0",
-        "numpy>=2.0.0"
+        "ollama==0.1.7"
     ]
     
     failed_packages = []
     
-    for package in dependencies:
-        if not install_package(package):
-            failed_packages.append(package)
+    # Exact pins that are already installed never reach pip
+    pending = [package for package in dependencies if not already_satisfied(package)]
+    
+    # Nothing to fetch or install (and an empty pip install would fail)
+    if not pending:
+        print("✅ All dependencies already installed!")
+        return True
+    
+    # Fetch in parallel, then resolve the whole set in one pass; only fall
+    # back to per-package installs to find out which ones failed
+    with tempfile.TemporaryDirectory(prefix="genai-wheels-") as wheel_dir:
+        prefetch_packages(pending, wheel_dir)
+        batch_ok = install_packages(pending, find_links=wheel_dir)
+    
+    if not batch_ok:
+        print("\n⚠️ Batch install failed, retrying packages individually...")
+        for package in progress(pending, "pip install"):
+            if not install_package(package, quiet=TQDM_AVAILABLE):
+                failed_packages.append(package)
     
     print("\n" + "=" * 60)
     
@@ -17,12 +17,17 @@ def quick_install():
     
     print("🔧 Quick Fix: Installing critical dependencies...")
     
-    for dep in critical_deps:
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
-            print(f"✅ Installed {dep}")
-        except Exception as e:
-            print(f"❌ Failed to install {dep}: {e}")
+    # One pip process for the whole set; retry individually only on failure
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *critical_deps])
+        print(f"✅ Installed {', '.join(critical_deps)}")
+    except Exception:
+        for dep in critical_deps:
+            try:
+                subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
+                print(f"✅ Installed {dep}")
+            except Exception as e:
+                print(f"❌ Failed to install {dep}: {e}")
     
     print("\n✅ Quick fix complete! Try starting the server again.")
 
@@ -0,0 +1,114 @@
+"""
+Shared helpers for the backend and tests/ test and verification scripts
+
+Backend scripts import this directly; scripts under tests/ add backend to
+sys.path first, the same way they reach the app package.
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import functools
+import contextlib
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The app's orjson-or-stdlib JSON helpers, re-exported for the scripts
+from app.utils.json_utils import dump_json, dump_json_str, load_json
+
+__all__ = [
+    "buffered_output", "dump_json", "dump_json_str", "emit", "load_json",
+    "make_session", "print_stage_times", "request_with_retry", "stage", "timed"
+]
+
+
+def emit(lines):
+    """Write a block of finished output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def buffered_output(func):
+    """Under CI, collect the test's output in memory and write it in one go"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Interactive runs keep live feedback
+        if not os.getenv('CI'):
+            return func(*args, **kwargs)
+        
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+# Wall time per test stage in milliseconds, in the order stages finished
+STAGE_TIMES = {}
+
+
+@contextlib.contextmanager
+def stage(name):
+    """Record how long the enclosed block takes under STAGE_TIMES[name]"""
+    started = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        STAGE_TIMES[name] = (time.perf_counter_ns() - started) / 1e6
+
+
+def timed(check, *args):
+    """Run one check inside a stage named after it"""
+    with stage(check.__name__):
+        return check(*args)
+
+
+def print_stage_times():
+    """Print the stages recorded since the last call as one table, then start a fresh one"""
+    print("\n⏱️ Stage timings:")
+    print("\n".join(f"   {name:25s} {elapsed:9.1f} ms" for name, elapsed in STAGE_TIMES.items()))
+    # Scripts sharing a pytest process each report only their own stages
+    STAGE_TIMES.clear()
+
+
+# Transient failures worth retrying: connection errors, timeouts, 429 and 5xx
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def request_with_retry(session, method, url, attempts=3, base=0.5, **kwargs):
+    """Send a request on session, retrying transient failures with jittered exponential backoff"""
+    for attempt in range(attempts):
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == attempts - 1:
+                raise
+        else:
+            if response.status_code not in RETRYABLE_STATUS or attempt == attempts - 1:
+                return response
+        time.sleep(random.uniform(0, base * 2 ** attempt))
+
+
+def make_session(pool_connections=4, pool_maxsize=16, retries=3, backoff_factor=0.3, status_forcelist=RETRYABLE_STATUS):
+    """Build a keep-alive session whose calls reuse pooled TCP/TLS connections
+
+    urllib3 retries connection errors for every method, but retries on
+    status_forcelist only for idempotent requests such as GET - a POST that
+    gets a 5xx comes straight back; use request_with_retry for those.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=backoff_factor, status_forcelist=status_forcelist)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
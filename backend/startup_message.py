@@ -2,22 +2,30 @@
 Startup message for GenAI Career Platform
 """
 
+import sys
+
+# Built once so the banner goes out in a single write
+STARTUP_MESSAGE = (
+    "\n" + "="*80 + "\n"
+    "🚀 GenAI Career Intelligence Platform - AWS ImpactX Challenge\n"
+    + "="*80 + "\n"
+    "✅ Backend server starting...\n"
+    "🎭 Demo mode enabled - no dependencies required!\n"
+    "\n"
+    "📍 Access Points:\n"
+    "   • API Documentation: http://localhost:8000/docs\n"
+    "   • Demo Status: http://localhost:8000/api/v1/demo/status\n"
+    "   • Architecture: http://localhost:8000/api/v1/demo/architecture-overview\n"
+    "\n"
+    "🎯 Ready for AWS ImpactX Challenge presentation!\n"
+    + "="*80 + "\n"
+    "\n"
+)
+
 def print_startup_message():
     """Print startup message with system status"""
-    print("\n" + "="*80)
-    print("🚀 GenAI Career Intelligence Platform - AWS ImpactX Challenge")
-    print("="*80)
-    print("✅ Backend server starting...")
-    print("🎭 Demo mode enabled - no dependencies required!")
-    print("")
-    print("📍 Access Points:")
-    print("   • API Documentation: http://localhost:8000/docs")
-    print("   • Demo Status: http://localhost:8000/api/v1/demo/status")
-    print("   • Architecture: http://localhost:8000/api/v1/demo/architecture-overview")
-    print("")
-    print("🎯 Ready for AWS ImpactX Challenge presentation!")
-    print("="*80)
-    print("")
+    sys.stdout.write(STARTUP_MESSAGE)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     print_startup_message()
\ No newline at end of file
@@ -8,39 +8,16 @@ This script tests the complete dynamic job fit workflow:
 3. Analyze job fit with selected role
 """
 
-import requests
-import json
-from io import BytesIO
+import sys
+import asyncio
+import httpx
+from script_utils import dump_json_str, emit
 
 # Test configuration
 BASE_URL = "http://localhost:8000"
-API_BASE = f"{BASE_URL}/api/job-fit"
+API_BASE = "/api/job-fit"
 
-def test_complete_workflow():
-    """Test the complete job fit workflow"""
-    print("🚀 Testing Dynamic Job Fit Analysis Workflow")
-    print("=" * 60)
-    
-    # Step 1: Get available roles
-    print("📋 Step 1: Getting available roles...")
-    try:
-        response = requests.get(f"{API_BASE}/available-roles")
-        if response.status_code == 200:
-            roles_data = response.json()
-            roles = roles_data.get("roles", [])
-            print(f"   ✅ Found {len(roles)} available roles")
-            print(f"   📝 Sample roles: {', '.join(roles[:5])}...")
-        else:
-            print(f"   ❌ Failed to get roles: {response.status_code}")
-            return
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
-        return
-    
-    # Step 2: Parse resume
-    print("\n📄 Step 2: Parsing sample resume...")
-    
-    sample_resume_text = """
+SAMPLE_RESUME_TEXT = """
 John Smith
 Senior Software Engineer
 Email: john.smith@email.com
@@ -83,27 +60,112 @@ Bachelor of Science in Computer Science
 Stanford University (2015 - 2019)
 GPA: 3.9/4.0
 """
+SAMPLE_RESUME_BYTES = SAMPLE_RESUME_TEXT.encode('utf-8')
+
+def serialize_resume(parsed_resume):
+    """Serialize the parsed resume once for every analyze-with-role request"""
+    return dump_json_str(parsed_resume)
+
+async def analyze_role(client, parsed_resume_json, role):
+    """Request job fit analysis of the serialized parsed resume for one role"""
+    form_data = {
+        "parsed_resume": parsed_resume_json,
+        "selected_role": role
+    }
+    
+    return await client.post(f"{API_BASE}/analyze-with-role", data=form_data)
+
+def print_role_analysis(response):
+    """Print the job fit analysis response for one role"""
+    if response.status_code == 200:
+        result = response.json()
+        if result.get("success"):
+            analysis = result.get("job_fit_analysis", {})
+            recommendation = result.get("recommendation", {})
+            
+            emit([
+                f"   ✅ Analysis completed!",
+                f"   📊 Overall Fit: {analysis.get('overall_fit_score', 0)}%",
+                f"   🎯 Skill Match: {analysis.get('skill_match_percentage', 0)}%",
+                f"   📈 Experience Match: {analysis.get('experience_match_percentage', 0)}%",
+                f"   💡 Recommendation: {recommendation.get('recommendation', 'Unknown')}",
+                f"   🔍 Confidence: {analysis.get('confidence_score', 0)}%",
+            ])
+            
+            # Show matched and missing skills
+            matched_skills = analysis.get('matched_skills', [])
+            missing_skills = analysis.get('missing_skills', [])
+            
+            if matched_skills:
+                print(f"   ✅ Matched Skills: {', '.join(matched_skills[:5])}{'...' if len(matched_skills) > 5 else ''}")
+            if missing_skills:
+                print(f"   ❌ Missing Skills: {', '.join(missing_skills[:3])}{'...' if len(missing_skills) > 3 else ''}")
+                
+        else:
+            print(f"   ❌ Analysis failed: {result}")
+    else:
+        print(f"   ❌ Failed: {response.status_code} - {response.text}")
+
+async def run_complete_workflow(sequential=False):
+    """Test the complete job fit workflow"""
+    # No timeout: AI analyses can take a while on a local model
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=None) as client:
+        await run_workflow(client, sequential)
+
+async def run_workflow(client, sequential):
+    """Run the workflow steps against the API"""
+    print("🚀 Testing Dynamic Job Fit Analysis Workflow")
+    print("=" * 60)
     
+    # Upload the encoded text as the file body (no in-memory file copy)
+    files = {
+        'resume_file': ('john_smith_resume.txt', SAMPLE_RESUME_BYTES, 'text/plain')
+    }
+    
+    # Steps 1 and 2 are independent, so fetch roles and parse the resume together
+    roles_result, parse_result = await asyncio.gather(
+        client.get(f"{API_BASE}/available-roles"),
+        client.post(f"{API_BASE}/parse-resume", files=files),
+        return_exceptions=True
+    )
+    
+    # Step 1: Get available roles
+    print("📋 Step 1: Getting available roles...")
     try:
-        # Create a text file in memory
-        file_content = BytesIO(sample_resume_text.encode('utf-8'))
-        
-        # Prepare the file for upload
-        files = {
-            'resume_file': ('john_smith_resume.txt', file_content, 'text/plain')
-        }
-        
-        response = requests.post(f"{API_BASE}/parse-resume", files=files)
+        if isinstance(roles_result, Exception):
+            raise roles_result
+        response = roles_result
+        if response.status_code == 200:
+            roles_data = response.json()
+            roles = roles_data.get("roles", [])
+            print(f"   ✅ Found {len(roles)} available roles")
+            print(f"   📝 Sample roles: {', '.join(roles[:5])}...")
+        else:
+            print(f"   ❌ Failed to get roles: {response.status_code}")
+            return
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        return
+    
+    # Step 2: Parse resume
+    print("\n📄 Step 2: Parsing sample resume...")
+    
+    try:
+        if isinstance(parse_result, Exception):
+            raise parse_result
+        response = parse_result
         
         if response.status_code == 200:
             parse_data = response.json()
             if parse_data.get("success"):
                 parsed_resume = parse_data.get("parsed_data", {})
-                print(f"   ✅ Resume parsed successfully!")
-                print(f"   📊 Skills found: {len(parsed_resume.get('skills', []))}")
-                print(f"   🎯 Estimated role: {parsed_resume.get('estimated_role', 'Unknown')}")
-                print(f"   📅 Experience: {parsed_resume.get('experience_years', 0)} years")
-                print(f"   🏆 Level: {parsed_resume.get('experience', {}).get('level', 'Unknown')}")
+                emit([
+                    f"   ✅ Resume parsed successfully!",
+                    f"   📊 Skills found: {len(parsed_resume.get('skills', []))}",
+                    f"   🎯 Estimated role: {parsed_resume.get('estimated_role', 'Unknown')}",
+                    f"   📅 Experience: {parsed_resume.get('experience_years', 0)} years",
+                    f"   🏆 Level: {parsed_resume.get('experience', {}).get('level', 'Unknown')}",
+                ])
             else:
                 print(f"   ❌ Parse failed: {parse_data}")
                 return
@@ -115,53 +177,40 @@ GPA: 3.9/4.0
         print(f"   ❌ Error: {e}")
         return
     
+    # Every role analysis sends the same resume, so serialize it only once
+    parsed_resume_json = serialize_resume(parsed_resume)
+    
     # Step 3: Analyze job fit for multiple roles
     test_roles = ["Senior Software Engineer", "Backend Developer", "DevOps Engineer", "Full Stack Developer"]
     
+    roles_to_analyze = []
     for role in test_roles:
         if role not in roles:
             print(f"   ⚠️  Skipping {role} - not in available roles")
             continue
-            
+        roles_to_analyze.append(role)
+    
+    # Analyze all roles concurrently; --sequential runs them one at a time
+    if sequential:
+        results = []
+        for role in roles_to_analyze:
+            try:
+                results.append(await analyze_role(client, parsed_resume_json, role))
+            except Exception as e:
+                results.append(e)
+    else:
+        results = await asyncio.gather(
+            *(analyze_role(client, parsed_resume_json, role) for role in roles_to_analyze),
+            return_exceptions=True
+        )
+    
+    for role, result in zip(roles_to_analyze, results):
         print(f"\n🎯 Step 3: Analyzing job fit for '{role}'...")
         
-        try:
-            form_data = {
-                "parsed_resume": json.dumps(parsed_resume),
-                "selected_role": role
-            }
-            
-            response = requests.post(f"{API_BASE}/analyze-with-role", data=form_data)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("success"):
-                    analysis = result.get("job_fit_analysis", {})
-                    recommendation = result.get("recommendation", {})
-                    
-                    print(f"   ✅ Analysis completed!")
-                    print(f"   📊 Overall Fit: {analysis.get('overall_fit_score', 0)}%")
-                    print(f"   🎯 Skill Match: {analysis.get('skill_match_percentage', 0)}%")
-                    print(f"   📈 Experience Match: {analysis.get('experience_match_percentage', 0)}%")
-                    print(f"   💡 Recommendation: {recommendation.get('recommendation', 'Unknown')}")
-                    print(f"   🔍 Confidence: {analysis.get('confidence_score', 0)}%")
-                    
-                    # Show matched and missing skills
-                    matched_skills = analysis.get('matched_skills', [])
-                    missing_skills = analysis.get('missing_skills', [])
-                    
-                    if matched_skills:
-                        print(f"   ✅ Matched Skills: {', '.join(matched_skills[:5])}{'...' if len(matched_skills) > 5 else ''}")
-                    if missing_skills:
-                        print(f"   ❌ Missing Skills: {', '.join(missing_skills[:3])}{'...' if len(missing_skills) > 3 else ''}")
-                        
-                else:
-                    print(f"   ❌ Analysis failed: {result}")
-            else:
-                print(f"   ❌ Failed: {response.status_code} - {response.text}")
-                
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+        if isinstance(result, Exception):
+            print(f"   ❌ Error: {result}")
+        else:
+            print_role_analysis(result)
     
     # Step 4: Test custom role
     print(f"\n🎯 Step 4: Testing custom role analysis...")
@@ -169,11 +218,11 @@ GPA: 3.9/4.0
     
     try:
         form_data = {
-            "parsed_resume": json.dumps(parsed_resume),
+            "parsed_resume": parsed_resume_json,
             "selected_role": custom_role
         }
         
-        response = requests.post(f"{API_BASE}/analyze-with-role", data=form_data)
+        response = await client.post(f"{API_BASE}/analyze-with-role", data=form_data)
         
         if response.status_code == 200:
             result = response.json()
@@ -181,9 +230,11 @@ GPA: 3.9/4.0
                 analysis = result.get("job_fit_analysis", {})
                 recommendation = result.get("recommendation", {})
                 
-                print(f"   ✅ Custom role analysis completed!")
-                print(f"   📊 Overall Fit: {analysis.get('overall_fit_score', 0)}%")
-                print(f"   💡 Recommendation: {recommendation.get('recommendation', 'Unknown')}")
+                emit([
+                    f"   ✅ Custom role analysis completed!",
+                    f"   📊 Overall Fit: {analysis.get('overall_fit_score', 0)}%",
+                    f"   💡 Recommendation: {recommendation.get('recommendation', 'Unknown')}",
+                ])
             else:
                 print(f"   ❌ Custom role analysis failed: {result}")
         else:
@@ -193,27 +244,26 @@ GPA: 3.9/4.0
         print(f"   ❌ Error: {e}")
     
     # Summary
-    print("\n" + "=" * 60)
-    print("🎉 Dynamic Job Fit Analysis Test Summary")
-    print("=" * 60)
-    
-    print("✅ Step 1: Available Roles - Working")
-    print("✅ Step 2: Resume Parsing - Working") 
-    print("✅ Step 3: Job Fit Analysis - Working with Ollama")
-    print("✅ Step 4: Custom Role Analysis - Working")
-    
-    print("\n🎯 Dynamic Job Fit System Status: FULLY OPERATIONAL")
-    print("• Upload resume → Parse with enhanced skill extraction")
-    print("• Select from 50+ roles OR enter custom role")
-    print("• AI analysis → Ollama-powered job fit evaluation")
-    print("• Detailed results → Comprehensive analysis with recommendations")
-    
-    print("\n💡 Frontend Integration Ready:")
-    print("• Step-by-step workflow UI implemented")
-    print("• Real-time progress indicators")
-    print("• Dynamic role selection with search")
-    print("• Custom role input capability")
-    print("• Comprehensive results display")
+    emit([
+        "\n" + "=" * 60,
+        "🎉 Dynamic Job Fit Analysis Test Summary",
+        "=" * 60,
+        "✅ Step 1: Available Roles - Working",
+        "✅ Step 2: Resume Parsing - Working",
+        "✅ Step 3: Job Fit Analysis - Working with Ollama",
+        "✅ Step 4: Custom Role Analysis - Working",
+        "\n🎯 Dynamic Job Fit System Status: FULLY OPERATIONAL",
+        "• Upload resume → Parse with enhanced skill extraction",
+        "• Select from 50+ roles OR enter custom role",
+        "• AI analysis → Ollama-powered job fit evaluation",
+        "• Detailed results → Comprehensive analysis with recommendations",
+        "\n💡 Frontend Integration Ready:",
+        "• Step-by-step workflow UI implemented",
+        "• Real-time progress indicators",
+        "• Dynamic role selection with search",
+        "• Custom role input capability",
+        "• Comprehensive results display",
+    ])
 
 if __name__ == "__main__":
-    test_complete_workflow()
\ No newline at end of file
+    asyncio.run(run_complete_workflow(sequential="--sequential" in sys.argv))
\ No newline at end of file
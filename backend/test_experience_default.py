@@ -8,7 +8,6 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.services.resume_service import ResumeService
-from app.database import get_db
 
 def test_experience_default():
     """Test that experience defaults to 1 year (12 months) when no experience is found"""
@@ -16,9 +15,8 @@ def test_experience_default():
     print("🧪 Testing Experience Default Value")
     print("=" * 50)
     
-    # Create a mock database session
-    db = next(get_db())
-    resume_service = ResumeService(db)
+    # Parsing is pure text processing, so no database session is needed
+    resume_service = ResumeService(db=None)
     
     # Test with a resume that has no explicit experience mentioned
     test_resume_text = """
@@ -9,14 +9,12 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.services.resume_service import ResumeService
-from unittest.mock import Mock
 
 def test_experience_parsing_disabled():
     """Test that experience parsing returns safe defaults"""
     
-    # Create mock database session
-    mock_db = Mock()
-    service = ResumeService(mock_db)
+    # Parsing is pure text processing, so no database session is needed
+    service = ResumeService(db=None)
     
     # Test with various problematic texts that previously caused issues
     test_cases = [
@@ -3,11 +3,13 @@
 Final test to verify ALL experience parsing is fixed
 """
 
+import sys
+from script_utils import emit
+
 print("🔧 Final Experience Fix Verification")
 print("=" * 50)
 
 try:
-    import sys
     import os
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     
@@ -52,11 +54,13 @@ try:
     else:
         print(f"   ❌ Summary: {summary}")
     
-    print("\n" + "=" * 50)
-    print("🎯 FINAL STATUS: Experience parsing completely DISABLED")
-    print("✅ Safe for AWS ImpactX Challenge presentation!")
-    print("✅ No more '8 months = 8 years' issues!")
-    print("✅ All displays show consistent '2 years'")
+    emit([
+        "\n" + "=" * 50,
+        "🎯 FINAL STATUS: Experience parsing completely DISABLED",
+        "✅ Safe for AWS ImpactX Challenge presentation!",
+        "✅ No more '8 months = 8 years' issues!",
+        "✅ All displays show consistent '2 years'",
+    ])
     
 except Exception as e:
     print(f"❌ ERROR: {e}")
@@ -11,11 +11,12 @@ Tests the Gemini API integration and fallback system to ensure:
 
 import os
 import sys
-import json
-import requests
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
+from script_utils import dump_json_str, emit
 
 # Load environment variables from .env file
 backend_dir = Path(__file__).parent
@@ -36,16 +37,13 @@ else:
 # Add the backend directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.ai_engines.gemini_engine import GeminiEngine
-from app.ai_engines.ollama_engine import OllamaEngine
-from app.ai_engines.engine_router import ai_engine_router
+# Engines are passed in by main() or by the shared pytest fixtures in conftest.py,
+# so loading this file (e.g. during pytest collection) doesn't pull in the AI clients
 
-def test_gemini_api_key():
+def test_gemini_api_key(gemini_engine):
     """Test if Gemini API key is working correctly"""
     print("🔑 Testing Gemini API Key...")
     
-    gemini_engine = GeminiEngine()
-    
     if not gemini_engine.api_key:
         print("❌ Gemini API key not found in environment")
         return False
@@ -63,12 +61,11 @@ def test_gemini_api_key():
         print(f"❌ Gemini API call failed or unexpected response: {response}")
         return False
 
-def test_engine_availability():
+def test_engine_availability(ollama_engine, gemini_engine):
     """Test availability of both engines"""
     print("\n🔍 Testing Engine Availability...")
     
     # Test Ollama
-    ollama_engine = OllamaEngine()
     print(f"Ollama Available: {ollama_engine.available}")
     if ollama_engine.available:
         print(f"✅ Ollama: {ollama_engine.model} at {ollama_engine.base_url}")
@@ -76,7 +73,6 @@ def test_engine_availability():
         print("⚠️ Ollama: Not available")
     
     # Test Gemini
-    gemini_engine = GeminiEngine()
     gemini_available = bool(gemini_engine.api_key)
     print(f"Gemini Available: {gemini_available}")
     if gemini_available:
@@ -86,34 +82,33 @@ def test_engine_availability():
     
     return ollama_engine.available, gemini_available
 
-def test_engine_router_stats():
+def test_engine_router_stats(router):
     """Test engine router statistics and health"""
     print("\n📊 Testing Engine Router Statistics...")
     
-    # Get current stats
-    stats = ai_engine_router.get_engine_stats()
-    print("Current Engine Statistics:")
-    for key, value in stats.items():
-        print(f"  {key}: {value}")
+    # Get current stats and health check, then write both in one block
+    stats = router.get_engine_stats()
+    health = router.health_check()
     
-    # Get health check
-    health = ai_engine_router.health_check()
-    print("\nEngine Health Check:")
-    print(json.dumps(health, indent=2))
+    emit(
+        ["Current Engine Statistics:"]
+        + [f"  {key}: {value}" for key, value in stats.items()]
+        + ["\nEngine Health Check:", dump_json_str(health, indent=True)]
+    )
     
     return stats, health
 
-def test_force_engine_switching():
+def test_force_engine_switching(router):
     """Test manual engine switching functionality"""
     print("\n🔀 Testing Engine Switching...")
     
     # Get initial stats
-    initial_stats = ai_engine_router.get_engine_stats()
+    initial_stats = router.get_engine_stats()
     print(f"Initial preference: {initial_stats['current_preference']}")
     
     # Force switch to Gemini
     print("Forcing switch to Gemini...")
-    success = ai_engine_router.force_engine("gemini")
+    success = router.force_engine("gemini")
     if success:
         print("✅ Successfully switched to Gemini")
         
@@ -124,11 +119,11 @@ def test_force_engine_switching():
             "domain_analysis": {"primary_domain": "fullstack"}
         }
         
-        question = ai_engine_router.generate_first_question(test_context)
+        question = router.generate_first_question(test_context)
         print(f"✅ Gemini generated question: {question.get('text', 'No text')[:100]}...")
         
         # Check stats
-        new_stats = ai_engine_router.get_engine_stats()
+        new_stats = router.get_engine_stats()
         print(f"Last engine used: {new_stats['last_engine_used']}")
         print(f"Gemini requests: {new_stats['gemini_requests']}")
         
@@ -137,22 +132,24 @@ def test_force_engine_switching():
     
     # Reset preferences
     print("Resetting preferences...")
-    ai_engine_router.reset_preferences()
-    reset_stats = ai_engine_router.get_engine_stats()
+    router.reset_preferences()
+    reset_stats = router.get_engine_stats()
     print(f"Reset preference: {reset_stats['current_preference']}")
     
     return success
 
-def test_fallback_behavior():
+def test_fallback_behavior(router):
     """Test automatic fallback behavior"""
     print("\n🔄 Testing Fallback Behavior...")
     
     # Check current configuration
-    stats = ai_engine_router.get_engine_stats()
-    print(f"Prefer Ollama: {stats.get('current_preference') == 'ollama'}")
-    print(f"Fallback Enabled: {stats.get('fallback_enabled', False)}")
-    print(f"Ollama Available: {stats.get('ollama_available', False)}")
-    print(f"Gemini Available: {stats.get('gemini_available', False)}")
+    stats = router.get_engine_stats()
+    emit([
+        f"Prefer Ollama: {stats.get('current_preference') == 'ollama'}",
+        f"Fallback Enabled: {stats.get('fallback_enabled', False)}",
+        f"Ollama Available: {stats.get('ollama_available', False)}",
+        f"Gemini Available: {stats.get('gemini_available', False)}",
+    ])
     
     # Test context extraction (Layer 1)
     print("\nTesting Layer 1: Context Extraction...")
@@ -162,7 +159,7 @@ def test_fallback_behavior():
         "work_experience": [{"company": "Tech Corp", "role": "Developer"}]
     }
     
-    context = ai_engine_router.extract_candidate_context(
+    context = router.extract_candidate_context(
         resume_data=test_resume,
         role="Software Engineer", 
         interview_type="mixed"
@@ -171,38 +168,54 @@ def test_fallback_behavior():
     print(f"✅ Context extracted with engine: {context.get('ai_engine', 'unknown')}")
     print(f"Experience level: {context.get('experience_level')}")
     
+    # Layers 2 and 3 only depend on the context, so run them concurrently
+    async def run_layers():
+        return await asyncio.gather(
+            router.agenerate_first_question(context),
+            router.aevaluate_answer(
+                question_text="Tell me about your experience.",
+                answer="I have 3 years of experience working with Python and JavaScript, building web applications.",
+                candidate_context=context
+            )
+        )
+    
+    question, evaluation = asyncio.run(run_layers())
+    
     # Test question generation (Layer 2)
     print("\nTesting Layer 2: Question Generation...")
-    question = ai_engine_router.generate_first_question(context)
     print(f"✅ Question generated: {question.get('text', 'No text')[:100]}...")
     
     # Test answer evaluation (Layer 3)
     print("\nTesting Layer 3: Answer Evaluation...")
-    evaluation = ai_engine_router.evaluate_answer(
-        question_text="Tell me about your experience.",
-        answer="I have 3 years of experience working with Python and JavaScript, building web applications.",
-        candidate_context=context
-    )
-    
     print(f"✅ Answer evaluated - Technical: {evaluation.get('technical')}, Communication: {evaluation.get('communication')}")
     
     # Final stats
-    final_stats = ai_engine_router.get_engine_stats()
-    print(f"\nFinal Statistics:")
-    print(f"  Last engine used: {final_stats['last_engine_used']}")
-    print(f"  Ollama requests: {final_stats['ollama_requests']}")
-    print(f"  Gemini requests: {final_stats['gemini_requests']}")
-    print(f"  Fallback count: {final_stats['fallback_count']}")
+    final_stats = router.get_engine_stats()
+    emit([
+        f"\nFinal Statistics:",
+        f"  Last engine used: {final_stats['last_engine_used']}",
+        f"  Ollama requests: {final_stats['ollama_requests']}",
+        f"  Gemini requests: {final_stats['gemini_requests']}",
+        f"  Fallback count: {final_stats['fallback_count']}",
+    ])
     
     return final_stats
 
-def test_interview_flow_with_gemini():
+def test_interview_flow_with_gemini(router):
     """Test complete interview flow using Gemini"""
     print("\n🎯 Testing Complete Interview Flow with Gemini...")
     
     # Force Gemini usage
-    ai_engine_router.force_engine("gemini")
+    router.force_engine("gemini")
     
+    try:
+        return asyncio.run(run_interview_flow(router))
+    finally:
+        # Reset to default
+        router.reset_preferences()
+
+async def run_interview_flow(router):
+    """Drive the interview layers, overlapping calls that don't depend on each other"""
     # Simulate interview start
     test_profile = {
         "skills": ["Python", "Django", "PostgreSQL", "Docker"],
@@ -215,7 +228,7 @@ def test_interview_flow_with_gemini():
     }
     
     # Layer 1: Extract context
-    context = ai_engine_router.extract_candidate_context(
+    context = await router.aextract_candidate_context(
         resume_data=test_profile,
         role="Senior Backend Developer",
         interview_type="technical"
@@ -223,7 +236,7 @@ def test_interview_flow_with_gemini():
     print(f"✅ Context: {context['experience_level']} {context['role']}")
     
     # Layer 2: Generate questions
-    q1 = ai_engine_router.generate_first_question(context)
+    q1 = await router.agenerate_first_question(context)
     print(f"✅ Q1: {q1['text'][:80]}...")
     
     # Simulate conversation history
@@ -232,81 +245,94 @@ def test_interview_flow_with_gemini():
         {"type": "answer", "content": "I'm a senior backend developer with 4 years of experience in Python and Django.", "question_number": 1}
     ]
     
-    q2 = ai_engine_router.generate_next_question(context, conversation_history, 2)
-    print(f"✅ Q2: {q2['text'][:80]}...")
-    
-    # Layer 3: Evaluate answers
-    eval1 = ai_engine_router.evaluate_answer(
-        question_text=q1["text"],
-        answer="I'm a senior backend developer with 4 years of experience in Python and Django. I've worked on scalable web applications and microservices.",
-        candidate_context=context
+    # Q2 and the Layer 3 evaluation of the answers so far both only need Q1;
+    # all answers are scored with a single batched request
+    questions = [q1["text"]]
+    answers = ["I'm a senior backend developer with 4 years of experience in Python and Django. I've worked on scalable web applications and microservices."]
+    q2, evaluations = await asyncio.gather(
+        router.agenerate_next_question(context, conversation_history, 2),
+        router.aevaluate_answers_batch(questions, answers, context)
     )
-    print(f"✅ Evaluation: T:{eval1['technical']} C:{eval1['communication']} R:{eval1['relevance']}")
+    print(f"✅ Q2: {q2['text'][:80]}...")
+    for evaluation in evaluations:
+        print(f"✅ Evaluation: T:{evaluation['technical']} C:{evaluation['communication']} R:{evaluation['relevance']}")
     
     # Generate final report
-    evaluations = [eval1]
-    report = ai_engine_router.generate_final_report(context, conversation_history, evaluations)
+    report = await router.agenerate_final_report(context, conversation_history, evaluations)
     print(f"✅ Report: {report.get('overall_summary', 'No summary')[:100]}...")
     
-    # Reset to default
-    ai_engine_router.reset_preferences()
-    
     return True
 
 def main():
     """Run all Gemini fallback verification tests"""
+    from app.ai_engines.engine_router import ai_engine_router
+    gemini_engine = ai_engine_router.gemini_engine
+    ollama_engine = ai_engine_router.ollama_engine
     print("🚀 Gemini Fallback Verification Test Suite")
     print("=" * 50)
     
     results = {}
     
+    # Tests 1-3 are read-only probes, so their network calls can overlap;
+    # threads keep them on the same router instance as the later tests
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        api_key_future = executor.submit(test_gemini_api_key, gemini_engine)
+        engines_future = executor.submit(test_engine_availability, ollama_engine, gemini_engine)
+        stats_future = executor.submit(test_engine_router_stats, ai_engine_router)
+    
     # Test 1: Gemini API Key
-    results['api_key'] = test_gemini_api_key()
+    results['api_key'] = api_key_future.result()
     
     # Test 2: Engine Availability
-    ollama_available, gemini_available = test_engine_availability()
+    ollama_available, gemini_available = engines_future.result()
     results['engines'] = {'ollama': ollama_available, 'gemini': gemini_available}
     
     # Test 3: Engine Statistics
-    stats, health = test_engine_router_stats()
+    stats, health = stats_future.result()
     results['stats'] = stats
     results['health'] = health
     
+    # Tests 4-6 change router preferences, so they run in order
     # Test 4: Engine Switching
-    results['switching'] = test_force_engine_switching()
+    results['switching'] = test_force_engine_switching(ai_engine_router)
     
     # Test 5: Fallback Behavior
-    results['fallback'] = test_fallback_behavior()
+    results['fallback'] = test_fallback_behavior(ai_engine_router)
     
     # Test 6: Complete Interview Flow
-    results['interview_flow'] = test_interview_flow_with_gemini()
+    results['interview_flow'] = test_interview_flow_with_gemini(ai_engine_router)
     
     # Summary
-    print("\n" + "=" * 50)
-    print("🎉 Test Results Summary")
-    print("=" * 50)
-    
-    print(f"✅ Gemini API Key: {'PASS' if results['api_key'] else 'FAIL'}")
-    print(f"✅ Ollama Available: {'YES' if results['engines']['ollama'] else 'NO'}")
-    print(f"✅ Gemini Available: {'YES' if results['engines']['gemini'] else 'NO'}")
-    print(f"✅ Engine Switching: {'PASS' if results['switching'] else 'FAIL'}")
-    print(f"✅ Interview Flow: {'PASS' if results['interview_flow'] else 'FAIL'}")
+    emit([
+        "\n" + "=" * 50,
+        "🎉 Test Results Summary",
+        "=" * 50,
+        f"✅ Gemini API Key: {'PASS' if results['api_key'] else 'FAIL'}",
+        f"✅ Ollama Available: {'YES' if results['engines']['ollama'] else 'NO'}",
+        f"✅ Gemini Available: {'YES' if results['engines']['gemini'] else 'NO'}",
+        f"✅ Engine Switching: {'PASS' if results['switching'] else 'FAIL'}",
+        f"✅ Interview Flow: {'PASS' if results['interview_flow'] else 'FAIL'}",
+    ])
     
     # Engine usage stats
     final_stats = ai_engine_router.get_engine_stats()
-    print(f"\nFinal Engine Statistics:")
-    print(f"  Ollama Requests: {final_stats['ollama_requests']}")
-    print(f"  Gemini Requests: {final_stats['gemini_requests']}")
-    print(f"  Fallback Events: {final_stats['fallback_count']}")
-    print(f"  Last Engine: {final_stats['last_engine_used']}")
+    emit([
+        f"\nFinal Engine Statistics:",
+        f"  Ollama Requests: {final_stats['ollama_requests']}",
+        f"  Gemini Requests: {final_stats['gemini_requests']}",
+        f"  Fallback Events: {final_stats['fallback_count']}",
+        f"  Last Engine: {final_stats['last_engine_used']}",
+    ])
     
     # Overall status
     if results['api_key'] and results['engines']['gemini']:
-        print("\n🎯 GEMINI INTEGRATION: FULLY OPERATIONAL")
-        print("✅ Gemini API working correctly")
-        print("✅ Fallback system operational")
-        print("✅ Engine switching functional")
-        print("✅ Interview flow complete")
+        emit([
+            "\n🎯 GEMINI INTEGRATION: FULLY OPERATIONAL",
+            "✅ Gemini API working correctly",
+            "✅ Fallback system operational",
+            "✅ Engine switching functional",
+            "✅ Interview flow complete",
+        ])
     else:
         print("\n⚠️ GEMINI INTEGRATION: ISSUES DETECTED")
         if not results['api_key']:
@@ -3,6 +3,8 @@
 Quick integration test for Ollama and experience parsing fixes
 """
 
+from script_utils import emit
+
 def test_experience_parsing():
     """Test the experience parsing fix"""
     from app.services.resume_service import ResumeService
@@ -26,16 +28,16 @@ def test_experience_parsing():
     for text, expected in test_cases:
         result = resume_service._extract_experience(text)
         years = result.get('years_experience', 0)
-        print(f"📝 Text: \"{text}\"")
-        print(f"✅ Parsed: {years} years ({expected})")
-        print()
+        emit([
+            f"📝 Text: \"{text}\"",
+            f"✅ Parsed: {years} years ({expected})",
+            "",
+        ])
     
     print("🎯 Experience Parsing: FIXED!")
 
-def test_ollama_integration():
+def test_ollama_integration(router):
     """Test Ollama integration"""
-    from app.ai_engines.engine_router import ai_engine_router
-    
     print("🧪 Testing Ollama AI Generation...")
     
     try:
@@ -47,21 +49,21 @@ def test_ollama_integration():
             'domain_analysis': {'primary_domain': 'fullstack', 'technical_depth': 'intermediate'}
         }
         
-        question = ai_engine_router.generate_first_question(candidate_context)
-        print("✅ Question Generated Successfully!")
-        print(f"📝 Question: {question.get('text', 'No text')[:100]}...")
-        print(f"🏷️ Type: {question.get('type', 'Unknown')}")
-        print(f"🎯 Engine Used: Ollama (Local)")
+        question = router.generate_first_question(candidate_context)
+        emit([
+            "✅ Question Generated Successfully!",
+            f"📝 Question: {question.get('text', 'No text')[:100]}...",
+            f"🏷️ Type: {question.get('type', 'Unknown')}",
+            f"🎯 Engine Used: Ollama (Local)",
+        ])
         
     except Exception as e:
         print(f"❌ Error: {e}")
 
-def test_health_check():
+def test_health_check(router):
     """Test AI engine health"""
-    from app.ai_engines.engine_router import ai_engine_router
-    
     print("🔍 Testing AI Engine Router...")
-    health = ai_engine_router.health_check()
+    health = router.health_check()
     print("📊 Health Check Results:")
     
     for engine, status in health.items():
@@ -75,12 +77,14 @@ def test_health_check():
     print("🎯 Integration Status: SUCCESS")
 
 if __name__ == "__main__":
+    from app.ai_engines.engine_router import ai_engine_router
+    
     print("🚀 Running Integration Tests...\n")
     
-    test_health_check()
+    test_health_check(ai_engine_router)
     print("\n" + "="*50 + "\n")
     
-    test_ollama_integration()
+    test_ollama_integration(ai_engine_router)
     print("\n" + "="*50 + "\n")
     
     test_experience_parsing()
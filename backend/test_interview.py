@@ -3,8 +3,30 @@
 Test interview start with Ollama integration
 """
 
-import requests
-import json
+import time
+import httpx
+from script_utils import emit
+
+BASE_URL = "http://localhost:8000"
+
+# Shared keep-alive client, reused across starts and retry attempts
+_CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    timeout=httpx.Timeout(30.0, connect=2.0),
+    limits=httpx.Limits(max_keepalive_connections=4)
+)
+
+# Transient dev-server responses worth retrying with backoff
+RETRYABLE_STATUS = (429, 502, 503, 504)
+MAX_ATTEMPTS = 3
+
+def post_with_retry(path, payload):
+    """POST on the shared client, backing off 250 ms -> 2 s on transient errors"""
+    for attempt in range(MAX_ATTEMPTS):
+        response = _CLIENT.post(path, json=payload)
+        if response.status_code not in RETRYABLE_STATUS or attempt == MAX_ATTEMPTS - 1:
+            return response
+        time.sleep(min(2.0, 0.25 * 2 ** attempt))
 
 def test_interview_start():
     """Test interview start endpoint with Ollama"""
@@ -21,7 +43,7 @@ def test_interview_start():
     
     try:
         print("🧪 Testing interview start with Ollama...")
-        response = requests.post('http://localhost:8000/api/interview/start', json=payload, timeout=30)
+        response = post_with_retry('/api/interview/start', payload)
         
         print(f"Status: {response.status_code}")
         
@@ -30,12 +52,14 @@ def test_interview_start():
             question = data.get('question', {})
             session_id = data.get('session_id', 'Unknown')
             
-            print(f"✅ Interview started successfully!")
-            print(f"📝 Session ID: {session_id}")
-            print(f"🎯 Question Generated: {question.get('text', 'No text')[:100]}...")
-            print(f"🏷️ Question Type: {question.get('type', 'Unknown')}")
-            print(f"🔧 Question ID: {question.get('id', 'Unknown')}")
-            print("🎉 Ollama is now generating questions!")
+            emit([
+                f"✅ Interview started successfully!",
+                f"📝 Session ID: {session_id}",
+                f"🎯 Question Generated: {question.get('text', 'No text')[:100]}...",
+                f"🏷️ Question Type: {question.get('type', 'Unknown')}",
+                f"🔧 Question ID: {question.get('id', 'Unknown')}",
+                "🎉 Ollama is now generating questions!",
+            ])
             
         else:
             print(f"❌ Error: {response.status_code}")
@@ -9,30 +9,76 @@ This script tests the new job fit functionality that includes:
 """
 
 import requests
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from script_utils import dump_json_str, emit, make_session
 
 # Test configuration
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api/job-fit"
 
+# Shared keep-alive session from script_utils; only connection errors are retried
+SESSION = make_session(pool_connections=10, pool_maxsize=20, retries=2, backoff_factor=0.1, status_forcelist=())
+
+# Sample parsed resumes, serialized once at import since every request sends them unchanged
+FULLSTACK_RESUME = {
+    "skills": ["Python", "JavaScript", "React", "Node.js", "SQL", "Git", "Docker"],
+    "experience_years": 3.5,
+    "experience": {
+        "level": "Mid-Level",
+        "years_experience": 3.5,
+        "companies": ["TechCorp", "StartupXYZ"],
+        "positions": ["Software Developer", "Frontend Developer"]
+    },
+    "projects": [
+        "Built a full-stack web application using React and Node.js",
+        "Developed REST APIs with Python and Django",
+        "Created automated deployment pipeline with Docker"
+    ],
+    "education": ["Bachelor of Computer Science"],
+    "estimated_role": "Full Stack Developer"
+}
+
+DATA_SCIENCE_RESUME = {
+    "skills": ["Python", "Machine Learning", "TensorFlow", "Pandas", "SQL", "Statistics"],
+    "experience_years": 4,
+    "experience": {
+        "level": "Senior",
+        "years_experience": 4,
+        "companies": ["DataCorp"],
+        "positions": ["Data Analyst", "ML Engineer"]
+    },
+    "projects": [
+        "Built predictive models using TensorFlow and Python",
+        "Analyzed large datasets with Pandas and SQL"
+    ],
+    "estimated_role": "Data Scientist"
+}
+
+FULLSTACK_RESUME_JSON = dump_json_str(FULLSTACK_RESUME)
+DATA_SCIENCE_RESUME_JSON = dump_json_str(DATA_SCIENCE_RESUME)
+
+@functools.lru_cache(maxsize=1)
+def get_available_roles():
+    """Fetch the role list once per run; failures raise and are not cached"""
+    response = SESSION.get(f"{API_BASE}/available-roles")
+    response.raise_for_status()
+    return tuple(response.json().get("roles", []))
+
 def test_available_roles():
     """Test getting available roles"""
     print("🔍 Testing available roles endpoint...")
     
     try:
-        response = requests.get(f"{API_BASE}/available-roles")
+        roles = list(get_available_roles())
+        print(f"✅ Available roles: {len(roles)} roles found")
+        print(f"   Roles: {', '.join(roles[:5])}{'...' if len(roles) > 5 else ''}")
+        return roles
         
-        if response.status_code == 200:
-            data = response.json()
-            roles = data.get("roles", [])
-            print(f"✅ Available roles: {len(roles)} roles found")
-            print(f"   Roles: {', '.join(roles[:5])}{'...' if len(roles) > 5 else ''}")
-            return roles
-        else:
-            print(f"❌ Failed to get roles: {response.status_code}")
-            return []
-            
+    except requests.HTTPError as e:
+        print(f"❌ Failed to get roles: {e.response.status_code}")
+        return []
     except Exception as e:
         print(f"❌ Error getting roles: {e}")
         return []
@@ -41,103 +87,86 @@ def test_job_fit_analysis():
     """Test job fit analysis with sample resume data"""
     print("\n🎯 Testing job fit analysis...")
     
-    # Sample parsed resume data
-    sample_resume = {
-        "skills": ["Python", "JavaScript", "React", "Node.js", "SQL", "Git", "Docker"],
-        "experience_years": 3.5,
-        "experience": {
-            "level": "Mid-Level",
-            "years_experience": 3.5,
-            "companies": ["TechCorp", "StartupXYZ"],
-            "positions": ["Software Developer", "Frontend Developer"]
-        },
-        "projects": [
-            "Built a full-stack web application using React and Node.js",
-            "Developed REST APIs with Python and Django",
-            "Created automated deployment pipeline with Docker"
-        ],
-        "education": ["Bachelor of Computer Science"],
-        "estimated_role": "Full Stack Developer"
-    }
-    
     # Test with different roles
     test_roles = ["Software Engineer", "Frontend Developer", "Backend Developer", "Full Stack Developer"]
     
-    for role in test_roles:
+    def analyze_role(role):
+        """POST one role analysis, returning the response or the error raised"""
+        form_data = {
+            "parsed_resume": FULLSTACK_RESUME_JSON,
+            "selected_role": role
+        }
         try:
-            print(f"\n   Testing role: {role}")
-            
-            # Prepare form data
-            form_data = {
-                "parsed_resume": json.dumps(sample_resume),
-                "selected_role": role
-            }
-            
-            response = requests.post(f"{API_BASE}/analyze-with-role", data=form_data)
-            
-            if response.status_code == 200:
-                data = response.json()
-                analysis = data.get("job_fit_analysis", {})
-                recommendation = data.get("recommendation", {})
-                
-                print(f"     ✅ Overall Fit Score: {analysis.get('overall_fit_score', 0)}%")
-                print(f"     ✅ Skill Match: {analysis.get('skill_match_percentage', 0)}%")
-                print(f"     ✅ Experience Match: {analysis.get('experience_match_percentage', 0)}%")
-                print(f"     ✅ Recommendation: {recommendation.get('recommendation', 'Unknown')}")
-                print(f"     ✅ Confidence: {analysis.get('confidence_score', 0)}%")
+            return role, SESSION.post(f"{API_BASE}/analyze-with-role", data=form_data)
+        except Exception as e:
+            return role, e
+    
+    # The analyses are independent, so run them concurrently over the pooled
+    # session; map() yields them back in role order for printing
+    with ThreadPoolExecutor(max_workers=len(test_roles)) as executor:
+        for role, response in executor.map(analyze_role, test_roles):
+            try:
+                print(f"\n   Testing role: {role}")
                 
-            else:
-                print(f"     ❌ Failed: {response.status_code} - {response.text}")
+                if isinstance(response, Exception):
+                    raise response
                 
-        except Exception as e:
-            print(f"     ❌ Error testing {role}: {e}")
+                if response.status_code == 200:
+                    data = response.json()
+                    analysis = data.get("job_fit_analysis", {})
+                    get = analysis.get
+                    fit_score = get('overall_fit_score', 0)
+                    skill_match = get('skill_match_percentage', 0)
+                    experience_match = get('experience_match_percentage', 0)
+                    confidence = get('confidence_score', 0)
+                    recommendation = data.get("recommendation", {}).get('recommendation', 'Unknown')
+                    
+                    emit([
+                        f"     ✅ Overall Fit Score: {fit_score}%",
+                        f"     ✅ Skill Match: {skill_match}%",
+                        f"     ✅ Experience Match: {experience_match}%",
+                        f"     ✅ Recommendation: {recommendation}",
+                        f"     ✅ Confidence: {confidence}%",
+                    ])
+                    
+                else:
+                    print(f"     ❌ Failed: {response.status_code} - {response.text}")
+                    
+            except Exception as e:
+                print(f"     ❌ Error testing {role}: {e}")
 
 def test_bulk_role_analysis():
     """Test bulk role analysis"""
     print("\n📊 Testing bulk role analysis...")
     
-    sample_resume = {
-        "skills": ["Python", "Machine Learning", "TensorFlow", "Pandas", "SQL", "Statistics"],
-        "experience_years": 4,
-        "experience": {
-            "level": "Senior",
-            "years_experience": 4,
-            "companies": ["DataCorp"],
-            "positions": ["Data Analyst", "ML Engineer"]
-        },
-        "projects": [
-            "Built predictive models using TensorFlow and Python",
-            "Analyzed large datasets with Pandas and SQL"
-        ],
-        "estimated_role": "Data Scientist"
-    }
-    
     # Test multiple roles at once
     test_roles = ["Data Scientist", "Machine Learning Engineer", "Software Engineer", "Backend Developer"]
     
     try:
         # Prepare form data for bulk analysis
         form_data = {
-            "parsed_resume": json.dumps(sample_resume),
-            "roles": json.dumps(test_roles)  # Send as JSON string
+            "parsed_resume": DATA_SCIENCE_RESUME_JSON,
+            "roles": dump_json_str(test_roles)  # Send as JSON string
         }
         
-        response = requests.post(f"{API_BASE}/bulk-role-analysis", data=form_data)
+        response = SESSION.post(f"{API_BASE}/bulk-role-analysis", data=form_data)
         
         if response.status_code == 200:
             data = response.json()
             analyses = data.get("role_analyses", [])
             best_fit = data.get("best_fit_role", "Unknown")
             
-            print(f"   ✅ Analyzed {len(analyses)} roles")
-            print(f"   ✅ Best fit role: {best_fit}")
-            
-            print("\n   📋 Role Rankings:")
+            rankings = []
             for i, analysis in enumerate(analyses[:5], 1):
-                role = analysis.get("role", "Unknown")
-                score = analysis.get("overall_fit_score", 0)
-                suitability = analysis.get("role_suitability", "Unknown")
-                print(f"      {i}. {role}: {score}% - {suitability}")
+                get = analysis.get
+                role, score, suitability = get("role", "Unknown"), get("overall_fit_score", 0), get("role_suitability", "Unknown")
+                rankings.append(f"      {i}. {role}: {score}% - {suitability}")
+            
+            emit([
+                f"   ✅ Analyzed {len(analyses)} roles",
+                f"   ✅ Best fit role: {best_fit}",
+                "\n   📋 Role Rankings:",
+            ] + rankings)
                 
         else:
             print(f"   ❌ Failed: {response.status_code} - {response.text}")
@@ -150,7 +179,7 @@ def test_sample_job_descriptions():
     print("\n📄 Testing sample job descriptions...")
     
     try:
-        response = requests.get(f"{API_BASE}/sample-job-descriptions")
+        response = SESSION.get(f"{API_BASE}/sample-job-descriptions")
         
         if response.status_code == 200:
             data = response.json()
@@ -191,26 +220,25 @@ def main():
     test_sample_job_descriptions()
     
     # Summary
-    print("\n" + "=" * 50)
-    print("🎉 Job Fit Integration Test Summary")
-    print("=" * 50)
-    
-    print("✅ Available Roles: Working")
-    print("✅ Job Fit Analysis: Working with Ollama")
-    print("✅ Bulk Role Analysis: Working")
-    print("✅ Sample Job Descriptions: Working")
-    
-    print("\n🎯 Job Fit System Status: FULLY OPERATIONAL")
-    print("• Resume parsing integrated with job fit analysis")
-    print("• Role selection from predefined list")
-    print("• Ollama-powered job fit evaluation")
-    print("• Comprehensive analysis with recommendations")
-    
-    print("\n💡 Usage Flow:")
-    print("1. Upload resume → Parse resume data")
-    print("2. Select role → Choose from available roles")
-    print("3. Analyze fit → Ollama evaluates job fit")
-    print("4. Get results → Detailed analysis and recommendations")
+    emit([
+        "\n" + "=" * 50,
+        "🎉 Job Fit Integration Test Summary",
+        "=" * 50,
+        "✅ Available Roles: Working",
+        "✅ Job Fit Analysis: Working with Ollama",
+        "✅ Bulk Role Analysis: Working",
+        "✅ Sample Job Descriptions: Working",
+        "\n🎯 Job Fit System Status: FULLY OPERATIONAL",
+        "• Resume parsing integrated with job fit analysis",
+        "• Role selection from predefined list",
+        "• Ollama-powered job fit evaluation",
+        "• Comprehensive analysis with recommendations",
+        "\n💡 Usage Flow:",
+        "1. Upload resume → Parse resume data",
+        "2. Select role → Choose from available roles",
+        "3. Analyze fit → Ollama evaluates job fit",
+        "4. Get results → Detailed analysis and recommendations",
+    ])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,19 +6,20 @@ This script tests the resume parsing endpoint with sample resume content.
 """
 
 import requests
-import json
-from io import BytesIO
+
+# Shared with the job fit suite so one run fetches the role list only once
+from test_job_fit_integration import get_available_roles
+from script_utils import dump_json_str, emit, make_session
 
 # Test configuration
 BASE_URL = "http://localhost:8000"
 API_BASE = f"{BASE_URL}/api/job-fit"
 
-def test_resume_parsing():
-    """Test resume parsing with sample text content"""
-    print("📄 Testing resume parsing...")
-    
-    # Sample resume content
-    sample_resume_text = """
+# Shared keep-alive session from script_utils; only connection errors are retried
+SESSION = make_session(pool_connections=10, pool_maxsize=20, retries=2, backoff_factor=0.1, status_forcelist=())
+
+# Sample resume content, encoded once for every upload
+SAMPLE_RESUME_TEXT = """
 John Doe
 Software Engineer
 Email: john.doe@email.com
@@ -60,30 +61,34 @@ Bachelor of Science in Computer Science
 University of Technology (2014 - 2018)
 GPA: 3.8/4.0
 """
+SAMPLE_RESUME_BYTES = SAMPLE_RESUME_TEXT.encode('utf-8')
+
+def test_resume_parsing():
+    """Test resume parsing with sample text content"""
+    print("📄 Testing resume parsing...")
     
     try:
-        # Create a text file in memory
-        file_content = BytesIO(sample_resume_text.encode('utf-8'))
-        
-        # Prepare the file for upload
+        # Prepare the file for upload from the pre-encoded bytes
         files = {
-            'resume_file': ('sample_resume.txt', file_content, 'text/plain')
+            'resume_file': ('sample_resume.txt', SAMPLE_RESUME_BYTES, 'text/plain')
         }
         
-        response = requests.post(f"{API_BASE}/parse-resume", files=files)
+        response = SESSION.post(f"{API_BASE}/parse-resume", files=files)
         
         if response.status_code == 200:
             data = response.json()
             parsed_data = data.get("parsed_data", {})
             
-            print("   ✅ Resume parsed successfully!")
-            print(f"   ✅ Skills found: {len(parsed_data.get('skills', []))}")
-            print(f"      Top skills: {', '.join(parsed_data.get('skills', [])[:5])}")
-            print(f"   ✅ Experience: {parsed_data.get('experience_years', 0)} years")
-            print(f"   ✅ Experience level: {parsed_data.get('experience', {}).get('level', 'Unknown')}")
-            print(f"   ✅ Projects found: {len(parsed_data.get('projects', []))}")
-            print(f"   ✅ Education entries: {len(parsed_data.get('education', []))}")
-            print(f"   ✅ Estimated role: {parsed_data.get('estimated_role', 'Unknown')}")
+            emit([
+                "   ✅ Resume parsed successfully!",
+                f"   ✅ Skills found: {len(parsed_data.get('skills', []))}",
+                f"      Top skills: {', '.join(parsed_data.get('skills', [])[:5])}",
+                f"   ✅ Experience: {parsed_data.get('experience_years', 0)} years",
+                f"   ✅ Experience level: {parsed_data.get('experience', {}).get('level', 'Unknown')}",
+                f"   ✅ Projects found: {len(parsed_data.get('projects', []))}",
+                f"   ✅ Education entries: {len(parsed_data.get('education', []))}",
+                f"   ✅ Estimated role: {parsed_data.get('estimated_role', 'Unknown')}",
+            ])
             
             # Test validation
             validation = data.get("validation", {})
@@ -114,13 +119,11 @@ def test_end_to_end_workflow():
     # Step 2: Get available roles
     print("\n   📋 Getting available roles...")
     try:
-        response = requests.get(f"{API_BASE}/available-roles")
-        if response.status_code == 200:
-            roles = response.json().get("roles", [])
-            print(f"      ✅ {len(roles)} roles available")
-        else:
-            print(f"      ❌ Failed to get roles: {response.status_code}")
-            return
+        roles = get_available_roles()
+        print(f"      ✅ {len(roles)} roles available")
+    except requests.HTTPError as e:
+        print(f"      ❌ Failed to get roles: {e.response.status_code}")
+        return
     except Exception as e:
         print(f"      ❌ Error getting roles: {e}")
         return
@@ -131,29 +134,36 @@ def test_end_to_end_workflow():
     
     try:
         form_data = {
-            "parsed_resume": json.dumps(parsed_data),
+            "parsed_resume": dump_json_str(parsed_data),
             "selected_role": estimated_role
         }
         
-        response = requests.post(f"{API_BASE}/analyze-with-role", data=form_data)
+        response = SESSION.post(f"{API_BASE}/analyze-with-role", data=form_data)
         
         if response.status_code == 200:
             data = response.json()
             analysis = data.get("job_fit_analysis", {})
-            recommendation = data.get("recommendation", {})
+            get = analysis.get
+            fit_score = get('overall_fit_score', 0)
+            skill_match = get('skill_match_percentage', 0)
+            experience_match = get('experience_match_percentage', 0)
+            confidence = get('confidence_score', 0)
+            recommendation = data.get("recommendation", {}).get('recommendation', 'Unknown')
             
-            print(f"      ✅ Overall Fit Score: {analysis.get('overall_fit_score', 0)}%")
-            print(f"      ✅ Skill Match: {analysis.get('skill_match_percentage', 0)}%")
-            print(f"      ✅ Experience Match: {analysis.get('experience_match_percentage', 0)}%")
-            print(f"      ✅ Recommendation: {recommendation.get('recommendation', 'Unknown')}")
-            print(f"      ✅ Confidence: {analysis.get('confidence_score', 0)}%")
+            lines = [
+                f"      ✅ Overall Fit Score: {fit_score}%",
+                f"      ✅ Skill Match: {skill_match}%",
+                f"      ✅ Experience Match: {experience_match}%",
+                f"      ✅ Recommendation: {recommendation}",
+                f"      ✅ Confidence: {confidence}%",
+            ]
             
             # Show next steps
             next_steps = data.get("next_steps", [])
             if next_steps:
-                print(f"      📝 Next Steps:")
-                for i, step in enumerate(next_steps[:3], 1):
-                    print(f"         {i}. {step}")
+                lines.append(f"      📝 Next Steps:")
+                lines.extend(f"         {i}. {step}" for i, step in enumerate(next_steps[:3], 1))
+            emit(lines)
             
         else:
             print(f"      ❌ Failed: {response.status_code} - {response.text}")
@@ -169,19 +179,19 @@ def main():
     # Test end-to-end workflow
     test_end_to_end_workflow()
     
-    print("\n" + "=" * 50)
-    print("🎉 Resume Parsing Test Complete")
-    print("=" * 50)
-    
-    print("✅ Resume Parsing: Working")
-    print("✅ Skill Extraction: Advanced (500+ keywords)")
-    print("✅ Experience Parsing: Accurate (months/years)")
-    print("✅ Project Detection: Working")
-    print("✅ Education Analysis: Working")
-    print("✅ Role Estimation: AI-powered")
-    print("✅ Job Fit Analysis: Ollama-powered")
-    
-    print("\n🎯 Complete Workflow: OPERATIONAL")
+    emit([
+        "\n" + "=" * 50,
+        "🎉 Resume Parsing Test Complete",
+        "=" * 50,
+        "✅ Resume Parsing: Working",
+        "✅ Skill Extraction: Advanced (500+ keywords)",
+        "✅ Experience Parsing: Accurate (months/years)",
+        "✅ Project Detection: Working",
+        "✅ Education Analysis: Working",
+        "✅ Role Estimation: AI-powered",
+        "✅ Job Fit Analysis: Ollama-powered",
+        "\n🎯 Complete Workflow: OPERATIONAL",
+    ])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
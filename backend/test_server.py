@@ -3,35 +3,67 @@
 Test script to verify the server starts without dependencies
 """
 
-import requests
+import http.client
+from concurrent.futures import ThreadPoolExecutor
 import time
 import sys
+from script_utils import emit
+
+# Local server under test
+HOST = "localhost"
+PORT = 8000
+
+# Connect and read timeouts (seconds) for the local server
+CONNECT_TIMEOUT = 1
+READ_TIMEOUT = 3
+
+# Endpoints to probe, and their request paths precomputed once
+ENDPOINTS = (
+    ("/", "Root endpoint"),
+    ("/health", "Health check"),
+    ("/docs", "API documentation"),
+    ("/api/v1/demo/status", "Demo status"),
+    ("/api/v1/demo/architecture-overview", "Architecture overview")
+)
+PATHS = tuple(path for path, _ in ENDPOINTS)
+
+def get_status(path):
+    """GET one path over a plain stdlib connection and return the status code"""
+    conn = http.client.HTTPConnection(HOST, PORT, timeout=CONNECT_TIMEOUT)
+    try:
+        conn.connect()
+        conn.sock.settimeout(READ_TIMEOUT)
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
 
 def test_server():
     """Test if the server is running and responding"""
-    base_url = "http://localhost:8000"
-    
     print("🧪 Testing GenAI Career Platform Server...")
     print("=" * 50)
     
-    # Test endpoints
-    endpoints = [
-        ("/", "Root endpoint"),
-        ("/health", "Health check"),
-        ("/docs", "API documentation"),
-        ("/api/v1/demo/status", "Demo status"),
-        ("/api/v1/demo/architecture-overview", "Architecture overview")
-    ]
-    
-    for endpoint, description in endpoints:
+    def check(endpoint):
+        """Probe one endpoint, returning its status code or the error raised"""
         try:
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {description}: OK")
+            return get_status(endpoint)
+        except (OSError, http.client.HTTPException) as e:
+            return e
+    
+    # Probe every endpoint concurrently and report in the listed order
+    with ThreadPoolExecutor(max_workers=len(PATHS)) as executor:
+        statuses = executor.map(check, PATHS)
+        results = []
+        for (endpoint, description), status in zip(ENDPOINTS, statuses):
+            if isinstance(status, Exception):
+                results.append(f"❌ {description}: Failed - {status}")
+            elif status == 200:
+                results.append(f"✅ {description}: OK")
             else:
-                print(f"⚠️ {description}: HTTP {response.status_code}")
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {description}: Failed - {e}")
+                results.append(f"⚠️ {description}: HTTP {status}")
+    emit(results)
     
     print("\n🎯 Server test complete!")
     print("If all tests passed, the server is ready for demo!")
@@ -6,36 +6,39 @@ Tests all components to ensure no experience parsing issues remain
 
 import sys
 import os
-import json
+import io
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from pathlib import Path
+from script_utils import dump_json, emit
 
-print("🎯 AWS ImpactX Challenge - Complete System Verification")
-print("=" * 60)
+REPORT_FILE = Path("verification_report.json")
+
+# Make the app package importable for every check (including pool workers)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Problematic month-based texts that must all fall back to the safe default
+EXPERIENCE_TEST_CASES = (
+    "I have 8 months of experience in software development",
+    "Working for 6 months as a developer",
+    "3 months internship at Google",
+    "12 months of experience in Python",
+    "18 months working as data scientist"
+)
 
 def test_resume_service():
     """Test resume service with problematic text"""
     print("1. Testing Resume Service Experience Parsing...")
     
     try:
-        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         from app.services.resume_service import ResumeService
-        from unittest.mock import Mock
-        
-        mock_db = Mock()
-        service = ResumeService(mock_db)
         
-        # Test with various problematic texts
-        test_cases = [
-            "I have 8 months of experience in software development",
-            "Working for 6 months as a developer",
-            "3 months internship at Google",
-            "12 months of experience in Python",
-            "18 months working as data scientist"
-        ]
+        service = ResumeService()
         
         all_passed = True
-        for test_text in test_cases:
-            result = service._extract_experience(test_text)
+        results = service._extract_experience_batch(EXPERIENCE_TEST_CASES)
+        for test_text, result in zip(EXPERIENCE_TEST_CASES, results):
             if result["years_experience"] != 2.0:
                 print(f"   ❌ FAILED: '{test_text}' -> {result['years_experience']} years")
                 all_passed = False
@@ -109,11 +112,20 @@ def test_job_fit_routes():
         print(f"   ❌ ERROR: {e}")
         return False
 
-def generate_verification_report():
-    """Generate verification report"""
-    print("\n" + "=" * 60)
-    print("🎯 VERIFICATION REPORT")
-    print("=" * 60)
+def run_check(test_func):
+    """Run one check in a worker process, capturing its output for ordered printing"""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        result = test_func()
+    return result, output.getvalue()
+
+def generate_verification_report(write_report=False):
+    """Generate verification report, saving it to REPORT_FILE when write_report is set"""
+    emit([
+        "\n" + "=" * 60,
+        "🎯 VERIFICATION REPORT",
+        "=" * 60,
+    ])
     
     tests = [
         ("Resume Service", test_resume_service),
@@ -123,10 +135,16 @@ def generate_verification_report():
         ("Job Fit Routes", test_job_fit_routes)
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        result = test_func()
-        results.append((test_name, result))
+    # The checks share no state and are dominated by first-time imports, so run
+    # each in its own process; output is replayed in the original test order
+    with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [(test_name, executor.submit(run_check, test_func)) for test_name, test_func in tests]
+        
+        results = []
+        for test_name, future in futures:
+            result, output = future.result()
+            sys.stdout.write(output)
+            results.append((test_name, result))
     
     print("\n📊 SUMMARY:")
     print("-" * 30)
@@ -140,17 +158,22 @@ def generate_verification_report():
     
     print("\n" + "=" * 60)
     if all_passed:
-        print("🚀 SYSTEM STATUS: READY FOR AWS ImpactX CHALLENGE!")
-        print("✅ No experience parsing issues detected")
-        print("✅ All components operational")
-        print("✅ Demo mode enabled")
-        print("✅ Safe for presentation")
+        emit([
+            "🚀 SYSTEM STATUS: READY FOR AWS ImpactX CHALLENGE!",
+            "✅ No experience parsing issues detected",
+            "✅ All components operational",
+            "✅ Demo mode enabled",
+            "✅ Safe for presentation",
+        ])
     else:
         print("❌ SYSTEM STATUS: ISSUES DETECTED!")
         print("⚠️  Please fix issues before presentation")
     
     print("=" * 60)
     
+    if not write_report:
+        return all_passed
+    
     # Create verification timestamp
     timestamp = datetime.now().isoformat()
     verification_data = {
@@ -163,12 +186,14 @@ def generate_verification_report():
     }
     
     # Save verification report
-    with open('verification_report.json', 'w') as f:
-        json.dump(verification_data, f, indent=2)
+    REPORT_FILE.write_bytes(dump_json(verification_data, indent=True))
     
-    print(f"📄 Verification report saved: verification_report.json")
+    print(f"📄 Verification report saved: {REPORT_FILE}")
     return all_passed
 
 if __name__ == "__main__":
-    success = generate_verification_report()
+    print("🎯 AWS ImpactX Challenge - Complete System Verification")
+    print("=" * 60)
+    
+    success = generate_verification_report(write_report="--report" in sys.argv)
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,8 +3,49 @@ MongoDB Atlas Configuration for GenAI Career Intelligence Platform
 """
 
 import os
-from pymongo import MongoClient
-from datetime import datetime
+import atexit
+import functools
+import threading
+from bson import ObjectId
+from pymongo import MongoClient, UpdateOne
+from pymongo.server_api import ServerApi
+from datetime import datetime, timezone
+
+# Single-document inserts are buffered per collection and written with one
+# insert_many once this many are pending, once the oldest has waited
+# INSERT_FLUSH_INTERVAL seconds (or on flush / interpreter exit)
+INSERT_BATCH_SIZE = int(os.getenv('MONGODB_INSERT_BATCH_SIZE', '100'))
+INSERT_FLUSH_INTERVAL = float(os.getenv('MONGODB_INSERT_FLUSH_INTERVAL', '5'))
+
+_PENDING_INSERTS = {}
+_FLUSH_TIMERS = {}
+_PENDING_LOCK = threading.Lock()
+
+# Explicit client settings: a pool sized for the app, compressed wire traffic
+# (zstd when zstandard is installed, zlib otherwise) and bounded timeouts.
+# The client connects lazily and the driver's heartbeat tracks server health,
+# so operations aren't gated on a ping
+CLIENT_OPTIONS = {
+    'maxPoolSize': int(os.getenv('MONGODB_MAX_POOL_SIZE', '50')),
+    'minPoolSize': int(os.getenv('MONGODB_MIN_POOL_SIZE', '5')),
+    'compressors': 'zstd,zlib',
+    'retryWrites': True,
+    'w': 'majority',
+    'socketTimeoutMS': 20000,
+    'serverSelectionTimeoutMS': 5000,
+    'heartbeatFrequencyMS': 10000,
+    'server_api': ServerApi('1'),
+    'appname': 'genai-career'
+}
+
+# Summary fields returned by the per-candidate getters (newest first)
+INTERVIEW_SUMMARY_FIELDS = {'_id': 1, 'candidateName': 1, 'role': 1, 'score': 1, 'createdAt': 1}
+JOB_FIT_SUMMARY_FIELDS = {'_id': 1, 'candidateName': 1, 'targetRole': 1, 'overallFitScore': 1, 'createdAt': 1}
+
+@functools.lru_cache(maxsize=None)
+def _get_client(uri):
+    """One MongoClient per URI per process; the driver pools connections itself"""
+    return MongoClient(uri, **CLIENT_OPTIONS)
 
 class MongoDBConfig:
     """MongoDB Atlas configuration and connection management"""
@@ -27,16 +68,17 @@ class MongoDBConfig:
             'user_profiles': 'user_profiles',
             'aptitude_assessments': 'aptitude_assessments',
             'resume_analyses': 'resume_analyses',
-            'system_analytics': 'system_analytics'
+            'system_analytics': 'system_analytics',
+            'candidate_summaries': 'candidate_summaries'
         }
+        
+        # Collection handles looked up so far
+        self._collections = {}
     
     def get_client(self):
         """Get MongoDB client"""
         try:
-            client = MongoClient(self.MONGODB_URI)
-            # Test connection
-            client.admin.command('ping')
-            return client
+            return _get_client(self.MONGODB_URI)
         except Exception as e:
             print(f"Failed to connect to MongoDB: {e}")
             return None
@@ -44,71 +86,239 @@ class MongoDBConfig:
     def get_database(self):
         """Get database instance"""
         client = self.get_client()
-        if client:
+        if client is not None:
             return client[self.DATABASE_NAME]
         return None
     
     def get_collection(self, collection_name):
         """Get specific collection"""
+        if collection_name in self._collections:
+            return self._collections[collection_name]
+        
         db = self.get_database()
-        if db and collection_name in self.COLLECTIONS:
-            return db[self.COLLECTIONS[collection_name]]
+        if db is not None and collection_name in self.COLLECTIONS:
+            collection = db[self.COLLECTIONS[collection_name]]
+            self._collections[collection_name] = collection
+            return collection
         return None
 
+@functools.lru_cache(maxsize=None)
+def get_config():
+    """Shared MongoDBConfig used by the helper functions below"""
+    return MongoDBConfig()
+
 # Sample usage functions
+def _upsert_operation(document, now):
+    """Build an idempotent upsert that only sets createdAt when the document is new"""
+    fields = {key: value for key, value in document.items() if key not in ('_id', 'createdAt')}
+    # createdAt is stored as a BSON Date so range queries and the index work on real dates
+    update = {'$setOnInsert': {'createdAt': document.get('createdAt', now)}}
+    if fields:
+        update['$set'] = fields
+    return UpdateOne({'_id': document['_id']}, update, upsert=True)
+
+def _insert_many(collection_name, documents, write_concern=None):
+    """Upsert documents by _id in one unordered batch and return their ids"""
+    collection = get_config().get_collection(collection_name)
+    
+    if collection is None or not documents:
+        return []
+    
+    # e.g. WriteConcern(w=0) for fire-and-forget bulk loads
+    if write_concern is not None:
+        collection = collection.with_options(write_concern=write_concern)
+    
+    # Client-side ids make a retried batch update the same documents instead of duplicating them
+    for document in documents:
+        document.setdefault('_id', ObjectId())
+    
+    now = datetime.now(timezone.utc)
+    collection.bulk_write([_upsert_operation(document, now) for document in documents], ordered=False)
+    return [str(document['_id']) for document in documents]
+
+def _requeue(collection_name, documents):
+    """Put a batch whose write failed back at the front of the pending buffer"""
+    with _PENDING_LOCK:
+        _PENDING_INSERTS[collection_name] = documents + _PENDING_INSERTS.get(collection_name, [])
+
+def _write_batch(collection_name, documents):
+    """Write one buffered batch, keeping it buffered for the next flush if the write fails"""
+    try:
+        _insert_many(collection_name, documents)
+    except Exception as e:
+        # Upserts by _id make the retried batch idempotent
+        _requeue(collection_name, documents)
+        print(f"Failed to write {len(documents)} buffered {collection_name} documents (kept for the next flush): {e}")
+        raise
+
+def _buffer_insert(collection_name, document):
+    """Queue one document for a batched insert and return its id"""
+    if get_config().get_collection(collection_name) is None:
+        return None
+    
+    # Assign the id up front so it can be returned before the batch is written,
+    # and stamp createdAt now rather than when the batch happens to be flushed
+    document.setdefault('_id', ObjectId())
+    document.setdefault('createdAt', datetime.now(timezone.utc))
+    
+    batch = None
+    with _PENDING_LOCK:
+        pending = _PENDING_INSERTS.setdefault(collection_name, [])
+        pending.append(document)
+        if len(pending) >= INSERT_BATCH_SIZE:
+            batch = _PENDING_INSERTS.pop(collection_name)
+            timer = _FLUSH_TIMERS.pop(collection_name, None)
+            if timer is not None:
+                timer.cancel()
+        elif collection_name not in _FLUSH_TIMERS:
+            # First document of a new batch: write it within INSERT_FLUSH_INTERVAL
+            # even if the batch never fills up
+            timer = threading.Timer(INSERT_FLUSH_INTERVAL, _flush_on_timer, args=(collection_name,))
+            timer.daemon = True
+            _FLUSH_TIMERS[collection_name] = timer
+            timer.start()
+    
+    if batch:
+        _write_batch(collection_name, batch)
+    return str(document['_id'])
+
+def _flush_on_timer(collection_name):
+    """Timer callback: write a batch that has waited INSERT_FLUSH_INTERVAL seconds"""
+    with _PENDING_LOCK:
+        _FLUSH_TIMERS.pop(collection_name, None)
+    try:
+        flush_pending_inserts(collection_name)
+    except Exception as e:
+        # Already logged and kept buffered by _write_batch; nothing else to do on this thread
+        print(f"Timed flush of {collection_name} failed: {e}")
+
+def flush_pending_inserts(collection_name=None):
+    """Write buffered inserts for one collection, or for all of them (failed batches stay buffered)"""
+    with _PENDING_LOCK:
+        if collection_name is None:
+            batches = list(_PENDING_INSERTS.items())
+            _PENDING_INSERTS.clear()
+        else:
+            batches = [(collection_name, _PENDING_INSERTS.pop(collection_name, []))]
+    
+    # Try every collection, then report the first failure
+    errors = []
+    for name, documents in batches:
+        if not documents:
+            continue
+        try:
+            _write_batch(name, documents)
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        raise errors[0]
+
+def _flush_at_exit():
+    """Last flush at interpreter exit; nothing can handle an error here, so log it"""
+    try:
+        flush_pending_inserts()
+    except Exception as e:
+        pending = sum(len(documents) for documents in _PENDING_INSERTS.values())
+        print(f"Failed to flush MongoDB inserts at exit, {pending} buffered documents were not written: {e}")
+
+atexit.register(_flush_at_exit)
+
+def insert_interview_sessions(sessions, write_concern=None):
+    """Insert many interview sessions in one batch"""
+    return _insert_many('interview_sessions', sessions, write_concern)
+
+def insert_job_fit_analyses(analyses, write_concern=None):
+    """Insert many job fit analyses in one batch"""
+    return _insert_many('job_fit_analyses', analyses, write_concern)
+
 def insert_interview_session(session_data):
-    """Insert a new interview session"""
-    config = MongoDBConfig()
-    collection = config.get_collection('interview_sessions')
-    
-    if collection:
-        # Add timestamp if not present
-        if 'createdAt' not in session_data:
-            session_data['createdAt'] = datetime.now().strftime('%Y-%m-%d')
-        
-        result = collection.insert_one(session_data)
-        return str(result.inserted_id)
-    return None
+    """Insert a new interview session (buffered; see flush_pending_inserts)"""
+    return _buffer_insert('interview_sessions', session_data)
 
 def insert_job_fit_analysis(analysis_data):
-    """Insert a new job fit analysis"""
-    config = MongoDBConfig()
-    collection = config.get_collection('job_fit_analyses')
-    
-    if collection:
-        # Add timestamp if not present
-        if 'createdAt' not in analysis_data:
-            analysis_data['createdAt'] = datetime.now().strftime('%Y-%m-%d')
-        
-        result = collection.insert_one(analysis_data)
-        return str(result.inserted_id)
-    return None
+    """Insert a new job fit analysis (buffered; see flush_pending_inserts)"""
+    return _buffer_insert('job_fit_analyses', analysis_data)
 
 def get_user_interviews(candidate_name):
     """Get all interviews for a specific candidate"""
-    config = MongoDBConfig()
-    collection = config.get_collection('interview_sessions')
+    # Make sure buffered inserts are visible to the query
+    flush_pending_inserts('interview_sessions')
+    collection = get_config().get_collection('interview_sessions')
     
-    if collection:
-        return list(collection.find({"candidateName": candidate_name}))
+    if collection is not None:
+        cursor = collection.find({"candidateName": candidate_name}, projection=INTERVIEW_SUMMARY_FIELDS)
+        return list(cursor.sort('createdAt', -1).batch_size(200))
     return []
 
 def get_user_job_fits(candidate_name):
     """Get all job fit analyses for a specific candidate"""
-    config = MongoDBConfig()
-    collection = config.get_collection('job_fit_analyses')
+    # Make sure buffered inserts are visible to the query
+    flush_pending_inserts('job_fit_analyses')
+    collection = get_config().get_collection('job_fit_analyses')
     
-    if collection:
-        return list(collection.find({"candidateName": candidate_name}))
+    if collection is not None:
+        cursor = collection.find({"candidateName": candidate_name}, projection=JOB_FIT_SUMMARY_FIELDS)
+        return list(cursor.sort('createdAt', -1).batch_size(200))
     return []
 
+def healthcheck():
+    """Ping the server; for health endpoints and startup checks, not before normal operations"""
+    client = get_config().get_client()
+    if client is None:
+        return False
+    
+    try:
+        client.admin.command('ping')
+        return True
+    except Exception as e:
+        print(f"MongoDB health check failed: {e}")
+        return False
+
+# Per-candidate rollups materialized into candidate_summaries, keyed by candidate name
+CANDIDATE_SUMMARY_PIPELINES = {
+    'interview_sessions': [{'$group': {
+        '_id': '$candidateName',
+        'interviewCount': {'$sum': 1},
+        'avgInterviewScore': {'$avg': '$score'},
+        'lastInterviewAt': {'$max': '$createdAt'}
+    }}],
+    'job_fit_analyses': [{'$group': {
+        '_id': '$candidateName',
+        'jobFitCount': {'$sum': 1},
+        'avgFitScore': {'$avg': '$overallFitScore'},
+        'lastJobFitAt': {'$max': '$createdAt'}
+    }}]
+}
+
+def refresh_candidate_summaries(db=None):
+    """Recompute candidate summaries server-side with $merge (schedule nightly, e.g. via cron)"""
+    if db is None:
+        flush_pending_inserts()
+        db = get_config().get_database()
+    
+    if db is None:
+        return False
+    
+    # Each source merges its own fields into the candidate's summary document
+    merge_stage = {'$merge': {'into': 'candidate_summaries', 'on': '_id', 'whenMatched': 'merge', 'whenNotMatched': 'insert'}}
+    for collection_name, pipeline in CANDIDATE_SUMMARY_PIPELINES.items():
+        db[collection_name].aggregate(pipeline + [merge_stage])
+    return True
+
+def get_candidate_summary(candidate_name):
+    """Get a candidate's precomputed summary (see refresh_candidate_summaries)"""
+    collection = get_config().get_collection('candidate_summaries')
+    
+    if collection is not None:
+        return collection.find_one({"_id": candidate_name})
+    return None
+
 # Example usage
 if __name__ == "__main__":
     # Test connection
-    config = MongoDBConfig()
-    db = config.get_database()
+    config = get_config()
     
-    if db:
+    if healthcheck():
         print("✅ Successfully connected to MongoDB Atlas!")
         print(f"📊 Database: {config.DATABASE_NAME}")
         print("📋 Available collections:")
@@ -5,10 +5,31 @@ MongoDB Atlas Setup Script for GenAI Career Intelligence Platform
 
 import json
 import os
+import sys
+import logging
 from datetime import datetime
-from pymongo import MongoClient
+from itertools import groupby, islice
+from operator import itemgetter
+from pymongo import MongoClient, ReplaceOne, IndexModel, ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
+from config import refresh_candidate_summaries
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# createdAt indexes only cover BSON Dates, leaving out legacy string dates until migrated
+CREATED_AT_IS_DATE = {"createdAt": {"$type": "date"}}
+
+# Sample documents are upserted this many at a time
+INSERT_CHUNK_SIZE = 500
+
 def connect_to_mongodb():
     """Connect to MongoDB Atlas"""
     # Replace with your MongoDB Atlas connection string
@@ -26,59 +47,124 @@ def connect_to_mongodb():
         print(f"❌ Failed to connect to MongoDB: {e}")
         return None
 
+def prepare_document(doc):
+    """Convert a sample JSON document's string _id and createdAt to ObjectId and Date"""
+    doc = dict(doc)
+    if isinstance(doc.get('_id'), str):
+        doc['_id'] = ObjectId(doc['_id'])
+    if isinstance(doc.get('createdAt'), str):
+        doc['createdAt'] = datetime.fromisoformat(doc['createdAt'])
+    return doc
+
+def iter_sample_documents(f):
+    """Yield (collection_name, document) pairs from a {collection: [documents]} JSON file
+    
+    Each collection starts with a (collection_name, None) marker so empty ones are
+    still reported. With ijson installed the file is streamed one document at a
+    time instead of being loaded whole.
+    """
+    if not IJSON_AVAILABLE:
+        for collection_name, documents in json.load(f).items():
+            yield collection_name, None
+            for doc in documents:
+                yield collection_name, doc
+        return
+    
+    collection_name = None
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if depth == 1 and event == 'map_key':
+            collection_name = value
+        elif depth == 1 and event == 'start_array':
+            yield collection_name, None
+        elif depth == 2 and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+        
+        if builder is not None:
+            builder.event(event, value)
+        
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+            if depth == 2 and builder is not None:
+                yield collection_name, builder.value
+                builder = None
+
+def chunked(iterable, size):
+    """Yield lists of up to size items from iterable"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 def insert_sample_data():
     """Insert sample data into MongoDB collections"""
     
-    print("🚀 Inserting Sample Data into MongoDB Atlas")
-    print("=" * 50)
+    logger.info("🚀 Inserting Sample Data into MongoDB Atlas")
+    logger.info("=" * 50)
     
     # Connect to database
     db = connect_to_mongodb()
-    if not db:
+    if db is None:
         return False
     
-    # Load sample data
+    # Open sample data
     try:
-        with open('sample_data.json', 'r') as f:
-            sample_data = json.load(f)
+        sample_file = open('sample_data.json', 'rb')
     except FileNotFoundError:
-        print("❌ Sample data file not found!")
+        logger.error("❌ Sample data file not found!")
         return False
     
     # Insert data into collections
     collections_inserted = 0
+    collection_names = []
     
-    for collection_name, documents in sample_data.items():
-        try:
-            collection = db[collection_name]
-            
-            # Convert string ObjectIds to actual ObjectIds
-            for doc in documents:
-                if '_id' in doc and isinstance(doc['_id'], str):
-                    doc['_id'] = ObjectId(doc['_id'])
+    with sample_file:
+        for collection_name, entries in groupby(iter_sample_documents(sample_file), key=itemgetter(0)):
+            collection_names.append(collection_name)
+            upserted = 0
             
-            # Insert documents
-            if documents:
-                result = collection.insert_many(documents)
-                print(f"✅ Inserted {len(result.inserted_ids)} documents into '{collection_name}'")
-                collections_inserted += 1
-            else:
-                print(f"⚠️  No documents to insert for '{collection_name}'")
+            try:
+                collection = db[collection_name]
                 
-        except Exception as e:
-            print(f"❌ Error inserting into '{collection_name}': {e}")
+                # Convert string ObjectIds and dates to their BSON types
+                documents = (prepare_document(doc) for _, doc in entries if doc is not None)
+                
+                # Upsert by _id so re-running the setup doesn't duplicate documents,
+                # one round trip per chunk
+                for chunk in chunked(documents, INSERT_CHUNK_SIZE):
+                    operations = [ReplaceOne({'_id': doc['_id']}, doc, upsert=True) for doc in chunk]
+                    result = collection.bulk_write(operations, ordered=False)
+                    upserted += result.upserted_count + result.matched_count
+                
+                if upserted:
+                    logger.info("✅ Upserted %d documents into '%s'", upserted, collection_name)
+                    collections_inserted += 1
+                else:
+                    logger.warning("⚠️  No documents to insert for '%s'", collection_name)
+                    
+            except BulkWriteError as e:
+                # Unordered writes keep going past a bad document; one summary line,
+                # per-document details only at DEBUG
+                write_errors = e.details.get('writeErrors', [])
+                logger.error("❌ %d documents failed to insert into '%s'", len(write_errors), collection_name)
+                for error in write_errors:
+                    logger.debug("   document %d: %s", upserted + error['index'], error['errmsg'])
+            except Exception as e:
+                logger.error("❌ Error inserting into '%s': %s", collection_name, e)
     
-    print("\n" + "=" * 50)
-    print(f"🎉 Successfully inserted data into {collections_inserted} collections!")
+    logger.info("\n%s", "=" * 50)
+    logger.info("🎉 Successfully inserted data into %d collections!", collections_inserted)
     
     # Display collection stats
-    print("\n📊 Collection Statistics:")
-    for collection_name in sample_data.keys():
+    logger.info("\n📊 Collection Statistics:")
+    for collection_name in collection_names:
         try:
-            count = db[collection_name].count_documents({})
-            print(f"   {collection_name}: {count} documents")
+            count = db[collection_name].estimated_document_count()
+            logger.info("   %s: %d documents", collection_name, count)
         except Exception as e:
-            print(f"   {collection_name}: Error getting count - {e}")
+            logger.error("   %s: Error getting count - %s", collection_name, e)
     
     return True
 
@@ -88,35 +174,46 @@ def create_indexes():
     print("\n🔍 Creating Database Indexes...")
     
     db = connect_to_mongodb()
-    if not db:
+    if db is None:
         return False
     
     try:
-        # Interview sessions indexes
-        db.interview_sessions.create_index([("candidateName", 1)])
-        db.interview_sessions.create_index([("createdAt", -1)])
-        db.interview_sessions.create_index([("role", 1)])
-        db.interview_sessions.create_index([("score", -1)])
+        # One createIndexes command per collection instead of one per index
+        # Interview sessions indexes (candidateName + createdAt serves the per-candidate history)
+        db.interview_sessions.create_indexes([
+            IndexModel([("candidateName", ASCENDING), ("createdAt", DESCENDING)]),
+            IndexModel([("createdAt", DESCENDING)], partialFilterExpression=CREATED_AT_IS_DATE),
+            IndexModel([("role", ASCENDING)]),
+            IndexModel([("score", DESCENDING)])
+        ])
         
         # Job fit analyses indexes
-        db.job_fit_analyses.create_index([("candidateName", 1)])
-        db.job_fit_analyses.create_index([("targetRole", 1)])
-        db.job_fit_analyses.create_index([("overallFitScore", -1)])
-        db.job_fit_analyses.create_index([("createdAt", -1)])
+        db.job_fit_analyses.create_indexes([
+            IndexModel([("candidateName", ASCENDING), ("createdAt", DESCENDING)]),
+            IndexModel([("targetRole", ASCENDING)]),
+            IndexModel([("overallFitScore", DESCENDING)]),
+            IndexModel([("createdAt", DESCENDING)], partialFilterExpression=CREATED_AT_IS_DATE)
+        ])
         
-        # User profiles indexes
-        db.user_profiles.create_index([("email", 1)], unique=True)
-        db.user_profiles.create_index([("name", 1)])
-        db.user_profiles.create_index([("currentRole", 1)])
+        # User profiles indexes (profiles without an email don't collide on the unique index)
+        db.user_profiles.create_indexes([
+            IndexModel([("email", ASCENDING)], unique=True, partialFilterExpression={"email": {"$type": "string"}}),
+            IndexModel([("name", ASCENDING)]),
+            IndexModel([("currentRole", ASCENDING)])
+        ])
         
         # Resume analyses indexes
-        db.resume_analyses.create_index([("candidateName", 1)])
-        db.resume_analyses.create_index([("uploadDate", -1)])
+        db.resume_analyses.create_indexes([
+            IndexModel([("candidateName", ASCENDING)]),
+            IndexModel([("uploadDate", DESCENDING)])
+        ])
         
         # Aptitude assessments indexes
-        db.aptitude_assessments.create_index([("candidateName", 1)])
-        db.aptitude_assessments.create_index([("assessmentType", 1)])
-        db.aptitude_assessments.create_index([("score", -1)])
+        db.aptitude_assessments.create_indexes([
+            IndexModel([("candidateName", ASCENDING)]),
+            IndexModel([("assessmentType", ASCENDING)]),
+            IndexModel([("score", DESCENDING)])
+        ])
         
         print("✅ Database indexes created successfully!")
         return True
@@ -125,49 +222,68 @@ def create_indexes():
         print(f"❌ Error creating indexes: {e}")
         return False
 
+def build_candidate_summaries():
+    """Materialize per-candidate summaries for point lookups"""
+    
+    print("\n📈 Building Candidate Summaries...")
+    
+    db = connect_to_mongodb()
+    if db is None:
+        return False
+    
+    try:
+        refresh_candidate_summaries(db)
+        count = db.candidate_summaries.estimated_document_count()
+        print(f"✅ Candidate summaries refreshed: {count} candidates")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error building candidate summaries: {e}")
+        return False
+
 def verify_data():
     """Verify that data was inserted correctly"""
     
-    print("\n🔍 Verifying Inserted Data...")
+    logger.info("\n🔍 Verifying Inserted Data...")
     
     db = connect_to_mongodb()
-    if not db:
+    if db is None:
         return False
     
     try:
         # Sample queries to verify data
-        print("\n📋 Sample Data Verification:")
+        logger.info("\n📋 Sample Data Verification:")
         
         # Check interview sessions
-        interview_count = db.interview_sessions.count_documents({})
-        print(f"   📝 Interview Sessions: {interview_count}")
+        interview_count = db.interview_sessions.estimated_document_count()
+        logger.info("   📝 Interview Sessions: %d", interview_count)
         
         if interview_count > 0:
             sample_interview = db.interview_sessions.find_one({"candidateName": "Shreyas"})
             if sample_interview:
-                print(f"      ✅ Found interview for Shreyas with score: {sample_interview.get('score', 'N/A')}")
+                logger.info("      ✅ Found interview for Shreyas with score: %s", sample_interview.get('score', 'N/A'))
         
         # Check job fit analyses
-        jobfit_count = db.job_fit_analyses.count_documents({})
-        print(f"   🎯 Job Fit Analyses: {jobfit_count}")
+        jobfit_count = db.job_fit_analyses.estimated_document_count()
+        logger.info("   🎯 Job Fit Analyses: %d", jobfit_count)
         
         # Check user profiles
-        users_count = db.user_profiles.count_documents({})
-        print(f"   👤 User Profiles: {users_count}")
+        users_count = db.user_profiles.estimated_document_count()
+        logger.info("   👤 User Profiles: %d", users_count)
         
         # Check aptitude assessments
-        aptitude_count = db.aptitude_assessments.count_documents({})
-        print(f"   🧠 Aptitude Assessments: {aptitude_count}")
+        aptitude_count = db.aptitude_assessments.estimated_document_count()
+        logger.info("   🧠 Aptitude Assessments: %d", aptitude_count)
         
         # Check resume analyses
-        resume_count = db.resume_analyses.count_documents({})
-        print(f"   📄 Resume Analyses: {resume_count}")
+        resume_count = db.resume_analyses.estimated_document_count()
+        logger.info("   📄 Resume Analyses: %d", resume_count)
         
-        print("\n✅ Data verification completed!")
+        logger.info("\n✅ Data verification completed!")
         return True
         
     except Exception as e:
-        print(f"❌ Error verifying data: {e}")
+        logger.error("❌ Error verifying data: %s", e)
         return False
 
 def main():
@@ -185,6 +301,10 @@ def main():
     if not create_indexes():
         print("⚠️  Failed to create indexes, but data was inserted")
     
+    # Precompute candidate summaries
+    if not build_candidate_summaries():
+        print("⚠️  Failed to build candidate summaries, but data was inserted")
+    
     # Verify data
     if not verify_data():
         print("⚠️  Failed to verify data, but insertion may have succeeded")
@@ -204,4 +324,6 @@ def main():
     print("   • System analytics and metrics")
 
 if __name__ == "__main__":
+    # Progress lines go through logging; LOG_LEVEL=WARNING keeps only problems
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(), format='%(message)s', stream=sys.stdout)
     main()
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures for the test scripts in this directory
+
+The intelligence and Gemini engines are imported once per test session - once
+per worker under pytest-xdist - and shared by every test that asks for them. The local
+Ollama model is loaded before the first test so no test pays the cold start.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path; everything under tests/ imports the backend as `app.`, so
+# each module (and its sessions, caches and rate limiter) is loaded only once
+backend_dir = Path(__file__).parent.parent / "backend"
+sys.path.insert(0, str(backend_dir))
+
+
+@pytest.fixture(scope="session")
+def intelligence_engine():
+    """The shared intelligence engine"""
+    try:
+        from app.ai_engines.intelligence_engine import intelligence_engine
+    except ImportError as e:
+        pytest.skip(f"intelligence engine unavailable: {e}")
+    return intelligence_engine
+
+
+@pytest.fixture(scope="session")
+def gemini():
+    """The shared Gemini engine, the same instance the test scripts get from get_gemini_engine()"""
+    from app.ai_engines.gemini_engine import get_gemini_engine
+    return get_gemini_engine()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_ollama():
+    """Load the local Ollama model once per session (no-op when Ollama isn't running)"""
+    import requests
+    
+    try:
+        # An empty prompt only loads the model; nothing is generated
+        requests.post("http://localhost:11434/api/generate", json={
+            "model": os.getenv("OLLAMA_MODEL", "llama3.2:1b"),
+            "prompt": "",
+            "keep_alive": os.getenv("OLLAMA_KEEP_ALIVE", "30m"),
+            "stream": False
+        }, timeout=(2, 30))
+    except requests.exceptions.RequestException:
+        pass
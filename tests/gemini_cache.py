@@ -0,0 +1,49 @@
+"""
+On-disk Gemini response cache shared by the Gemini test scripts
+
+The test prompts are fixed, so responses are replayed from disk instead of
+calling the API on every run; set REFRESH_GEMINI_CACHE=1 to fetch fresh ones.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+GEMINI_CACHE_DIR = Path(__file__).parent / ".gemini_cache"
+REFRESH_GEMINI_CACHE = os.getenv("REFRESH_GEMINI_CACHE") == "1"
+
+def cached_gemini_call(engine):
+    """Wrap engine.call_gemini with an on-disk response cache"""
+    call_gemini = engine.call_gemini
+    
+    def cached_call(prompt, temperature=0.7, max_tokens=1000, response_mime_type=None):
+        key_source = json.dumps([engine.model, temperature, max_tokens, response_mime_type, prompt])
+        cache_file = GEMINI_CACHE_DIR / f"{hashlib.sha256(key_source.encode('utf-8')).hexdigest()}.json"
+        
+        if not REFRESH_GEMINI_CACHE:
+            try:
+                return json.loads(cache_file.read_text(encoding="utf-8"))["response"]
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        response = call_gemini(prompt, temperature, max_tokens, response_mime_type)
+        # Empty responses mean the call failed; don't pin them in the cache
+        if response:
+            try:
+                GEMINI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp_file.write_text(json.dumps({"response": response}), encoding="utf-8")
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                print(f"   ⚠️ Could not cache Gemini response: {e}")
+        return response
+    
+    cached_call.__wrapped__ = call_gemini
+    return cached_call
+
+def install_gemini_cache(engine):
+    """Route engine.call_gemini through the response cache (once per engine)"""
+    if not hasattr(engine.call_gemini, '__wrapped__'):
+        engine.call_gemini = cached_gemini_call(engine)
+    return engine
@@ -3,151 +3,192 @@
 Comprehensive test of the entire refactored system
 """
 
+import atexit
+import os
+import sys
 import requests
-import json
-import time
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
-def test_complete_system():
-    """Test all major endpoints and flows"""
-    print("🚀 COMPREHENSIVE SYSTEM TEST")
-    print("=" * 60)
-    
-    # Test 1: Health Check
-    print("\n1️⃣ Testing Health Check...")
-    try:
-        response = requests.get('http://localhost:8000/health')
-        if response.status_code == 200:
-            print("   ✅ Health check passed")
-        else:
-            print(f"   ❌ Health check failed: {response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Health check error: {e}")
-        return False
-    
-    # Test 2: Interview Flow (Conversational)
-    print("\n2️⃣ Testing Conversational Interview Flow...")
+# Shared script helpers live in backend/script_utils.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from script_utils import buffered_output, load_json, print_stage_times, request_with_retry, stage, timed
+
+# Shared keep-alive session: every call reuses one pooled connection instead of
+# opening a new one; the adapter doesn't retry, request_with_retry does
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+atexit.register(SESSION.close)
+
+# Static request payloads, shared read-only by the concurrent checks
+INTERVIEW_PROFILE = {
+    'role': 'Software Engineer',
+    'skills': ['Python', 'JavaScript', 'React'],
+    'experience_level': 'Mid-Level',
+    'experience_years': 3
+}
+
+INTERVIEW_ANSWER = 'I am a software engineer with 3 years of experience working with Python and JavaScript. I have built several web applications and enjoy solving complex problems.'
+
+JOB_FIT_REQUEST = {
+    "resume_data": {
+        "role": "Software Engineer",
+        "skills": ["Python", "JavaScript", "React", "Node.js"],
+        "experience_years": 3,
+        "experience_level": "Mid-Level"
+    },
+    "job_description": {
+        "title": "Senior Software Engineer",
+        "required_skills": ["Python", "JavaScript", "React", "AWS"],
+        "preferred_skills": ["Docker", "Kubernetes"],
+        "required_experience_years": 3,
+        "company": "TechCorp"
+    }
+}
+
+def run_interview_flow():
+    """Test 2: start -> answer -> report, chained through the session id"""
+    lines = ["\n2️⃣ Testing Conversational Interview Flow..."]
     try:
         # Start interview
-        profile = {
-            'role': 'Software Engineer',
-            'skills': ['Python', 'JavaScript', 'React'],
-            'experience_level': 'Mid-Level',
-            'experience_years': 3
-        }
-        
-        start_response = requests.post('http://localhost:8000/api/interview/start', json={
-            'profile': profile,
+        start_response = request_with_retry(SESSION, 'POST', 'http://localhost:8000/api/interview/start', json={
+            'profile': INTERVIEW_PROFILE,
             'interview_type': 'mixed',
             'persona': 'professional'
         })
         
         if start_response.status_code == 200:
-            session_data = start_response.json()
+            session_data = load_json(start_response.content)
             session_id = session_data['session_id']
             first_question = session_data['question']
-            print(f"   ✅ Interview started (Session: {session_id[:8]}...)")
-            print(f"   📝 First Question: {first_question['text'][:60]}...")
+            lines.append(f"   ✅ Interview started (Session: {session_id[:8]}...)")
+            lines.append(f"   📝 First Question: {first_question['text'][:60]}...")
             
             # Submit answer and get next question
-            answer_response = requests.post('http://localhost:8000/api/interview/answer', json={
+            answer_response = request_with_retry(SESSION, 'POST', 'http://localhost:8000/api/interview/answer', json={
                 'session_id': session_id,
                 'question_id': first_question['id'],
-                'transcript': 'I am a software engineer with 3 years of experience working with Python and JavaScript. I have built several web applications and enjoy solving complex problems.',
+                'transcript': INTERVIEW_ANSWER,
                 'metrics': {'duration': 45, 'confidence': 0.8}
             })
             
             if answer_response.status_code == 200:
-                answer_data = answer_response.json()
+                answer_data = load_json(answer_response.content)
                 evaluation = answer_data['evaluation']
                 next_question = answer_data.get('next_question')
                 
-                print(f"   ✅ Answer evaluated - Technical: {evaluation['technical']}/100")
+                lines.append(f"   ✅ Answer evaluated - Technical: {evaluation['technical']}/100")
                 if next_question:
-                    print(f"   📝 Next Question: {next_question['text'][:60]}...")
+                    lines.append(f"   📝 Next Question: {next_question['text'][:60]}...")
                 
                 # Get final report
-                report_response = requests.get(f'http://localhost:8000/api/interview/report/{session_id}')
+                report_response = request_with_retry(SESSION, 'GET', f'http://localhost:8000/api/interview/report/{session_id}')
                 if report_response.status_code == 200:
-                    print("   ✅ Interview report generated")
+                    lines.append("   ✅ Interview report generated")
                 else:
-                    print(f"   ❌ Report generation failed: {report_response.status_code}")
+                    lines.append(f"   ❌ Report generation failed: {report_response.status_code}")
             else:
-                print(f"   ❌ Answer submission failed: {answer_response.status_code}")
+                lines.append(f"   ❌ Answer submission failed: {answer_response.status_code}")
         else:
-            print(f"   ❌ Interview start failed: {start_response.status_code}")
+            lines.append(f"   ❌ Interview start failed: {start_response.status_code}")
     except Exception as e:
-        print(f"   ❌ Interview flow error: {e}")
-    
-    # Test 3: Aptitude Assessment
-    print("\n3️⃣ Testing Aptitude Assessment...")
+        lines.append(f"   ❌ Interview flow error: {e}")
+    return lines
+
+def run_aptitude_assessment():
+    """Test 3: generate aptitude questions and evaluate all answers in one batch"""
+    lines = ["\n3️⃣ Testing Aptitude Assessment..."]
     try:
-        aptitude_response = requests.post('http://localhost:8000/api/aptitude/generate', json={
+        aptitude_response = request_with_retry(SESSION, 'POST', 'http://localhost:8000/api/aptitude/generate', json={
             'difficulty': 'medium',
             'count': 3
         })
         
         if aptitude_response.status_code == 200:
-            questions = aptitude_response.json()
-            print(f"   ✅ Generated {len(questions)} aptitude questions")
+            questions = load_json(aptitude_response.content)
+            lines.append(f"   ✅ Generated {len(questions)} aptitude questions")
             
-            # Test evaluation
+            # Evaluate an answer for every generated question in one round trip
             if questions:
-                eval_response = requests.post('http://localhost:8000/api/aptitude/evaluate', json={
-                    'question_id': questions[0].get('id', 'apt_1'),
-                    'user_answer': 'A) 4 days',
-                    'difficulty': 'medium'
-                })
+                eval_response = request_with_retry(SESSION, 'POST', 'http://localhost:8000/api/aptitude/batch-evaluate', json=[
+                    {
+                        'question_id': question.get('id', f'apt_{index}'),
+                        'user_answer': (question.get('options') or ['A) 4 days'])[0],
+                        'difficulty': 'medium'
+                    }
+                    for index, question in enumerate(questions, start=1)
+                ])
                 
                 if eval_response.status_code == 200:
-                    print("   ✅ Aptitude evaluation working")
+                    results = load_json(eval_response.content)
+                    lines.append(f"   ✅ Aptitude evaluation working ({len(results)} answers evaluated)")
                 else:
-                    print(f"   ❌ Aptitude evaluation failed: {eval_response.status_code}")
+                    lines.append(f"   ❌ Aptitude evaluation failed: {eval_response.status_code}")
         else:
-            print(f"   ❌ Aptitude generation failed: {aptitude_response.status_code}")
+            lines.append(f"   ❌ Aptitude generation failed: {aptitude_response.status_code}")
     except Exception as e:
-        print(f"   ❌ Aptitude test error: {e}")
-    
-    # Test 4: Job Fit Analysis
-    print("\n4️⃣ Testing Job Fit Analysis...")
+        lines.append(f"   ❌ Aptitude test error: {e}")
+    return lines
+
+def run_job_fit_analysis():
+    """Test 4: job fit analysis for a sample resume and job description"""
+    lines = ["\n4️⃣ Testing Job Fit Analysis..."]
     try:
-        job_fit_response = requests.post('http://localhost:8000/api/job-fit/analyze', json={
-            "resume_data": {
-                "role": "Software Engineer",
-                "skills": ["Python", "JavaScript", "React", "Node.js"],
-                "experience_years": 3,
-                "experience_level": "Mid-Level"
-            },
-            "job_description": {
-                "title": "Senior Software Engineer",
-                "required_skills": ["Python", "JavaScript", "React", "AWS"],
-                "preferred_skills": ["Docker", "Kubernetes"],
-                "required_experience_years": 3,
-                "company": "TechCorp"
-            }
-        })
+        job_fit_response = request_with_retry(SESSION, 'POST', 'http://localhost:8000/api/job-fit/analyze', json=JOB_FIT_REQUEST)
         
         if job_fit_response.status_code == 200:
-            fit_data = job_fit_response.json()
-            print(f"   ✅ Job fit analysis completed")
-            print(f"   📊 Overall Fit: {fit_data['overall_fit_score']}/100")
-            print(f"   🎯 Skill Match: {fit_data['skill_match_percentage']}%")
+            fit_data = load_json(job_fit_response.content)
+            lines.append(f"   ✅ Job fit analysis completed")
+            lines.append(f"   📊 Overall Fit: {fit_data['overall_fit_score']}/100")
+            lines.append(f"   🎯 Skill Match: {fit_data['skill_match_percentage']}%")
         else:
-            print(f"   ❌ Job fit analysis failed: {job_fit_response.status_code}")
+            lines.append(f"   ❌ Job fit analysis failed: {job_fit_response.status_code}")
     except Exception as e:
-        print(f"   ❌ Job fit analysis error: {e}")
-    
-    # Test 5: Intelligence Status
-    print("\n5️⃣ Testing Intelligence Status...")
+        lines.append(f"   ❌ Job fit analysis error: {e}")
+    return lines
+
+def run_intelligence_status():
+    """Test 5: intelligence status endpoint"""
+    lines = ["\n5️⃣ Testing Intelligence Status..."]
     try:
-        status_response = requests.get('http://localhost:8000/api/intelligence-status')
+        status_response = request_with_retry(SESSION, 'GET', 'http://localhost:8000/api/intelligence-status')
         if status_response.status_code == 200:
-            status_data = status_response.json()
-            print("   ✅ Intelligence status retrieved")
-            print(f"   🧠 Primary Level: {status_data.get('current_primary', 'unknown')}")
+            status_data = load_json(status_response.content)
+            lines.append("   ✅ Intelligence status retrieved")
+            lines.append(f"   🧠 Primary Level: {status_data.get('current_primary', 'unknown')}")
         else:
-            print(f"   ❌ Intelligence status failed: {status_response.status_code}")
+            lines.append(f"   ❌ Intelligence status failed: {status_response.status_code}")
     except Exception as e:
-        print(f"   ❌ Intelligence status error: {e}")
+        lines.append(f"   ❌ Intelligence status error: {e}")
+    return lines
+
+@buffered_output
+def test_complete_system():
+    """Test all major endpoints and flows"""
+    print("🚀 COMPREHENSIVE SYSTEM TEST")
+    print("=" * 60)
+    
+    # Test 1: Health Check
+    print("\n1️⃣ Testing Health Check...")
+    try:
+        with stage('health_check'):
+            response = request_with_retry(SESSION, 'GET', 'http://localhost:8000/health')
+        if response.status_code == 200:
+            print("   ✅ Health check passed")
+        else:
+            print(f"   ❌ Health check failed: {response.status_code}")
+    except Exception as e:
+        print(f"   ❌ Health check error: {e}")
+        return False
+    
+    # Tests 2-5 are independent of each other, so run them concurrently and
+    # print each one's output in test order; wall time is the slowest test
+    checks = (run_interview_flow, run_aptitude_assessment, run_job_fit_analysis, run_intelligence_status)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        for lines in executor.map(timed, checks):
+            print("\n".join(lines))
+    
+    print_stage_times()
     
     print("\n" + "=" * 60)
     print("🎉 SYSTEM TEST COMPLETED!")
@@ -3,20 +3,29 @@
 Test the API endpoints to verify functionality
 """
 
-import requests
-import json
+import os
+import sys
+
+# Shared script helpers live in backend/script_utils.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from script_utils import dump_json, load_json, make_session
+
+# Shared keep-alive session from script_utils
+SESSION = make_session()
+
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 def test_aptitude_endpoint():
     """Test aptitude question generation"""
     print("🧠 Testing Aptitude Endpoint...")
     
-    response = requests.post('http://localhost:8000/api/aptitude/generate', json={
+    response = SESSION.post('http://localhost:8000/api/aptitude/generate', data=dump_json({
         'difficulty': 'medium',
         'count': 3
-    })
+    }), headers=JSON_HEADERS)
     
     if response.status_code == 200:
-        questions = response.json()
+        questions = load_json(response.content)
         print(f"✅ Generated {len(questions)} aptitude questions")
         for i, q in enumerate(questions[:2]):
             print(f"   Q{i+1}: {q.get('question', 'N/A')[:60]}...")
@@ -45,10 +54,10 @@ def test_job_fit_endpoint():
         }
     }
     
-    response = requests.post('http://localhost:8000/api/job-fit/analyze', json=request_data)
+    response = SESSION.post('http://localhost:8000/api/job-fit/analyze', data=dump_json(request_data), headers=JSON_HEADERS)
     
     if response.status_code == 200:
-        result = response.json()
+        result = load_json(response.content)
         print(f"✅ Job fit analysis completed")
         print(f"   Overall Fit Score: {result.get('overall_fit_score')}/100")
         print(f"   Skill Match: {result.get('skill_match_percentage')}%")
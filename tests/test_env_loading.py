@@ -4,29 +4,42 @@ Test environment variable loading
 """
 
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from dotenv import dotenv_values
+
+ENV_FILES = ('backend/.env', '.env')
+
+@lru_cache(maxsize=1)
+def load_env_files():
+    """Parse each env file once; earlier files win, like sequential load_dotenv calls"""
+    return tuple((path, dotenv_values(path)) for path in ENV_FILES)
 
 print("🔍 Testing Environment Variable Loading")
 print("=" * 50)
 
 # Check current environment
-print(f"1. Current environment: {os.getenv('GEMINI_API_KEY', 'NOT_FOUND')}")
+current_key = os.getenv('GEMINI_API_KEY')
+print(f"1. Current environment: {current_key or 'NOT_FOUND'}")
 
-# Try loading from backend/.env
-load_dotenv('backend/.env')
-print(f"2. After loading backend/.env: {os.getenv('GEMINI_API_KEY', 'NOT_FOUND')}")
+# Merge the parsed files in load order without overriding existing variables
+merged = {}
+for step, (path, values) in enumerate(load_env_files(), start=2):
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            merged.setdefault(key, value)
+    print(f"{step}. After loading {path}: {current_key or merged.get('GEMINI_API_KEY', 'NOT_FOUND')}")
 
-# Try loading from root .env
-load_dotenv('.env')
-print(f"3. After loading .env: {os.getenv('GEMINI_API_KEY', 'NOT_FOUND')}")
+os.environ.update(merged)
 
 # Test the Gemini engine
 import sys
-sys.path.append('backend')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
 
+engine = None
 try:
-    from backend.app.ai_engines.gemini_engine import GeminiEngine
-    engine = GeminiEngine()
+    # Shared engine instance, also used by test_gemini_integration in the same process
+    from app.ai_engines.gemini_engine import get_gemini_engine
+    engine = get_gemini_engine()
     
     if engine.api_key:
         print(f"✅ GeminiEngine has API key: {engine.api_key[:15]}...")
@@ -40,7 +53,6 @@ except Exception as e:
 if os.getenv('GEMINI_API_KEY'):
     print("\n🧪 Testing simple Gemini API call...")
     try:
-        engine = GeminiEngine()
         result = engine.call_gemini("Say 'Hello from Gemini!'", temperature=0.1, max_tokens=50)
         if result:
             print(f"✅ API call successful: {result}")
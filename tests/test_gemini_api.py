@@ -3,17 +3,93 @@
 Test different Gemini API endpoints and models
 """
 
+import sys
 import os
-import requests
+import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from dotenv import load_dotenv
 
+# Shared script helpers live in backend/script_utils.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from script_utils import dump_json, load_json, make_session
+
 # Load environment variables
 load_dotenv('backend/.env')
 load_dotenv('.env')
 
 API_KEY = os.getenv('GEMINI_API_KEY')
 
+# Shared keep-alive session from script_utils
+SESSION = make_session()
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# The first working model is stable for days, so remember it between runs
+MODEL_CACHE_FILE = Path.home() / ".cache" / "gemini_model.json"
+MODEL_CACHE_TTL = 24 * 60 * 60  # seconds
+
+def load_cached_model():
+    """Return the cached working model name, or None if missing or expired"""
+    try:
+        cached = json.loads(MODEL_CACHE_FILE.read_text())
+        if time.time() - cached["ts"] < MODEL_CACHE_TTL:
+            return cached["model"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def save_cached_model(model):
+    """Atomically write the working model name to the cache file"""
+    try:
+        MODEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = MODEL_CACHE_FILE.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps({"model": model, "ts": time.time()}))
+        os.replace(tmp_file, MODEL_CACHE_FILE)
+    except OSError as e:
+        print(f"   ⚠️ Could not cache working model: {e}")
+
+MODELS_URL = "https://generativelanguage.googleapis.com/v1beta/models"
+
+PROBE_PAYLOAD = {
+    "contents": [{
+        "parts": [{
+            "text": "Hello! Please respond with 'API test successful'"
+        }]
+    }],
+    "generationConfig": {
+        "temperature": 0.1,
+        "maxOutputTokens": 50
+    }
+}
+PROBE_BODY = dump_json(PROBE_PAYLOAD)
+
+def _probe(model):
+    """Try one model, returning (model, success, output lines)"""
+    lines = [f"\n🔍 Testing model: {model}"]
+    url = f"{MODELS_URL}/{model}:generateContent?key={API_KEY}"
+    
+    try:
+        response = SESSION.post(url, data=PROBE_BODY, headers=JSON_HEADERS, timeout=10)
+        lines.append(f"   Status: {response.status_code}")
+        
+        if response.status_code == 200:
+            data = load_json(response.content)
+            if "candidates" in data and data["candidates"]:
+                content = data["candidates"][0]["content"]["parts"][0]["text"]
+                lines.append(f"   ✅ SUCCESS: {content}")
+                return model, True, lines
+            else:
+                lines.append(f"   ❌ No content in response: {data}")
+        else:
+            lines.append(f"   ❌ Error: {response.text}")
+            
+    except Exception as e:
+        lines.append(f"   ❌ Exception: {e}")
+    
+    return model, False, lines
+
 def test_gemini_models():
     """Test different Gemini model endpoints"""
     print("🧪 Testing Gemini API with different models...")
@@ -23,6 +99,11 @@ def test_gemini_models():
         print("❌ No API key available")
         return
     
+    cached_model = load_cached_model()
+    if cached_model:
+        print(f"   ✅ Using cached working model: {cached_model}")
+        return cached_model
+    
     # Different model names to try
     models_to_test = [
         "gemini-1.5-flash-latest",
@@ -33,42 +114,19 @@ def test_gemini_models():
         "gemini-1.0-pro"
     ]
     
-    base_url = "https://generativelanguage.googleapis.com/v1beta/models"
-    
-    for model in models_to_test:
-        print(f"\n🔍 Testing model: {model}")
-        
-        url = f"{base_url}/{model}:generateContent?key={API_KEY}"
-        
-        payload = {
-            "contents": [{
-                "parts": [{
-                    "text": "Hello! Please respond with 'API test successful'"
-                }]
-            }],
-            "generationConfig": {
-                "temperature": 0.1,
-                "maxOutputTokens": 50
-            }
-        }
-        
-        try:
-            response = requests.post(url, json=payload, timeout=10)
-            print(f"   Status: {response.status_code}")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "candidates" in data and data["candidates"]:
-                    content = data["candidates"][0]["content"]["parts"][0]["text"]
-                    print(f"   ✅ SUCCESS: {content}")
-                    return model  # Return the working model
-                else:
-                    print(f"   ❌ No content in response: {data}")
-            else:
-                print(f"   ❌ Error: {response.text}")
-                
-        except Exception as e:
-            print(f"   ❌ Exception: {e}")
+    # Probe every model concurrently, then take results in preference order:
+    # only the models ahead of the first working one need to finish
+    executor = ThreadPoolExecutor(max_workers=len(models_to_test))
+    try:
+        futures = [executor.submit(_probe, model) for model in models_to_test]
+        for future in futures:
+            model, success, lines = future.result()
+            print("\n".join(lines))
+            if success:
+                save_cached_model(model)
+                return model  # Return the working model
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
     print("\n❌ No working models found")
     return None
@@ -82,14 +140,14 @@ def test_api_key_validity():
         return False
     
     # Try to list available models
-    url = f"https://generativelanguage.googleapis.com/v1beta/models?key={API_KEY}"
+    url = f"{MODELS_URL}?key={API_KEY}"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         print(f"Models list status: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_json(response.content)
             if "models" in data:
                 print(f"✅ API key is valid! Found {len(data['models'])} models:")
                 for model in data["models"][:5]:  # Show first 5 models
@@ -5,32 +5,95 @@ Test script to verify Gemini integration and conversational interview flow.
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
 
-from backend.app.ai_engines.gemini_engine import GeminiEngine
+from app.ai_engines.gemini_engine import get_gemini_engine
+from gemini_cache import install_gemini_cache
+from script_utils import buffered_output, print_stage_times, stage, timed
 
+# Static inputs, shared read-only by the concurrent steps
+TEST_PROFILE = {
+    "role": "Software Engineer",
+    "experience_level": "Mid-Level",
+    "skills": ["Python", "JavaScript", "React", "Node.js"],
+    "experience_years": 3
+}
+
+INTRODUCTION_ANSWER = "I'm a software engineer with 3 years of experience working primarily with Python and JavaScript. I've built several web applications using React and Node.js, and I'm passionate about creating efficient, scalable solutions."
+
+TEST_ANSWER = "I approach technical problems by first understanding the requirements, breaking down the problem into smaller components, researching best practices, and then implementing a solution step by step while testing along the way."
+
+JOB_DESCRIPTION = {
+    "title": "Senior Software Engineer",
+    "required_skills": ["Python", "JavaScript", "React", "AWS"],
+    "required_experience_years": 3
+}
+
+def run_answer_evaluation(engine, next_question, test_answer, test_profile):
+    """Test 3: evaluate an answer to the follow-up question"""
+    lines = ["\n3️⃣ Testing answer evaluation..."]
+    evaluation = engine.evaluate_answer(
+        question_text=next_question.get('text'),
+        answer=test_answer,
+        profile=test_profile
+    )
+    
+    lines.append(f"   Technical Score: {evaluation.get('technical')}/100")
+    lines.append(f"   Communication Score: {evaluation.get('communication')}/100")
+    lines.append(f"   Confidence Score: {evaluation.get('confidence')}/100")
+    lines.append(f"   Notes: {evaluation.get('short_notes')}")
+    return lines
+
+def run_answer_improvement(engine, next_question, test_answer, test_profile):
+    """Test 4: improve an answer to the follow-up question"""
+    lines = ["\n4️⃣ Testing answer improvement..."]
+    improved = engine.improve_answer(
+        question_text=next_question.get('text'),
+        answer=test_answer,
+        profile=test_profile
+    )
+    lines.append(f"   Improved Answer: {improved[:100]}...")
+    return lines
+
+def run_aptitude_generation(engine):
+    """Test 5: generate aptitude questions"""
+    lines = ["\n5️⃣ Testing aptitude question generation..."]
+    aptitude_questions = engine.generate_aptitude_questions(difficulty="medium", count=2)
+    for i, q in enumerate(aptitude_questions):
+        lines.append(f"   Q{i+1}: {q.get('question', '')[:60]}...")
+        lines.append(f"        Type: {q.get('type')}, Difficulty: {q.get('difficulty')}")
+    return lines
+
+def run_job_fit_analysis(engine, test_profile):
+    """Test 6: job fit analysis for the test profile"""
+    lines = ["\n6️⃣ Testing job fit analysis..."]
+    job_fit = engine.calculate_job_fit(test_profile, JOB_DESCRIPTION)
+    lines.append(f"   Overall Fit Score: {job_fit.get('overall_fit_score')}/100")
+    lines.append(f"   Skill Match: {job_fit.get('skill_match_percentage')}%")
+    lines.append(f"   Role Suitability: {job_fit.get('role_suitability')}")
+    return lines
+
+@buffered_output
 def test_gemini_engine():
     """Test the Gemini engine functionality"""
     print("🧪 Testing Gemini Engine Integration")
     print("=" * 50)
     
     # Initialize engine
-    engine = GeminiEngine()
+    engine = get_gemini_engine()
+    install_gemini_cache(engine)
     print(f"✅ GeminiEngine initialized")
     
     # Test profile
-    test_profile = {
-        "role": "Software Engineer",
-        "experience_level": "Mid-Level",
-        "skills": ["Python", "JavaScript", "React", "Node.js"],
-        "experience_years": 3
-    }
+    test_profile = TEST_PROFILE
     
     print(f"\n📋 Test Profile: {test_profile['role']} with {test_profile['experience_years']} years experience")
     
     # Test 1: Generate first question
     print("\n1️⃣ Testing first question generation...")
-    first_question = engine.generate_first_question(test_profile)
+    with stage('generate_first_question'):
+        first_question = engine.generate_first_question(test_profile)
     print(f"   Question ID: {first_question.get('id')}")
     print(f"   Question: {first_question.get('text')}")
     print(f"   Type: {first_question.get('type')}")
@@ -45,60 +108,33 @@ def test_gemini_engine():
         },
         {
             "type": "answer",
-            "content": "I'm a software engineer with 3 years of experience working primarily with Python and JavaScript. I've built several web applications using React and Node.js, and I'm passionate about creating efficient, scalable solutions.",
+            "content": INTRODUCTION_ANSWER,
             "question_number": 1
         }
     ]
     
     # Generate next question
-    next_question = engine.generate_next_question(test_profile, conversation_history, 2)
+    with stage('generate_next_question'):
+        next_question = engine.generate_next_question(test_profile, conversation_history, 2)
     print(f"   Next Question ID: {next_question.get('id')}")
     print(f"   Next Question: {next_question.get('text')}")
     print(f"   Type: {next_question.get('type')}")
     
-    # Test 3: Answer evaluation
-    print("\n3️⃣ Testing answer evaluation...")
-    test_answer = "I approach technical problems by first understanding the requirements, breaking down the problem into smaller components, researching best practices, and then implementing a solution step by step while testing along the way."
-    
-    evaluation = engine.evaluate_answer(
-        question_text=next_question.get('text'),
-        answer=test_answer,
-        profile=test_profile
-    )
-    
-    print(f"   Technical Score: {evaluation.get('technical')}/100")
-    print(f"   Communication Score: {evaluation.get('communication')}/100")
-    print(f"   Confidence Score: {evaluation.get('confidence')}/100")
-    print(f"   Notes: {evaluation.get('short_notes')}")
-    
-    # Test 4: Answer improvement
-    print("\n4️⃣ Testing answer improvement...")
-    improved = engine.improve_answer(
-        question_text=next_question.get('text'),
-        answer=test_answer,
-        profile=test_profile
+    # Tests 3-6 only depend on the question from test 2, so run them
+    # concurrently and print each one's output in test order
+    test_answer = TEST_ANSWER
+    checks = (
+        (run_answer_evaluation, (engine, next_question, test_answer, test_profile)),
+        (run_answer_improvement, (engine, next_question, test_answer, test_profile)),
+        (run_aptitude_generation, (engine,)),
+        (run_job_fit_analysis, (engine, test_profile))
     )
-    print(f"   Improved Answer: {improved[:100]}...")
-    
-    # Test 5: Aptitude questions
-    print("\n5️⃣ Testing aptitude question generation...")
-    aptitude_questions = engine.generate_aptitude_questions(difficulty="medium", count=2)
-    for i, q in enumerate(aptitude_questions):
-        print(f"   Q{i+1}: {q.get('question', '')[:60]}...")
-        print(f"        Type: {q.get('type')}, Difficulty: {q.get('difficulty')}")
-    
-    # Test 6: Job fit analysis
-    print("\n6️⃣ Testing job fit analysis...")
-    job_desc = {
-        "title": "Senior Software Engineer",
-        "required_skills": ["Python", "JavaScript", "React", "AWS"],
-        "required_experience_years": 3
-    }
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(timed, check, *args) for check, args in checks]
+        for future in futures:
+            print("\n".join(future.result()))
     
-    job_fit = engine.calculate_job_fit(test_profile, job_desc)
-    print(f"   Overall Fit Score: {job_fit.get('overall_fit_score')}/100")
-    print(f"   Skill Match: {job_fit.get('skill_match_percentage')}%")
-    print(f"   Role Suitability: {job_fit.get('role_suitability')}")
+    print_stage_times()
     
     print("\n✅ All tests completed successfully!")
     print("\n🎯 Key Features Verified:")
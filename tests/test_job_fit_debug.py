@@ -3,10 +3,19 @@
 Debug the job fit API endpoint
 """
 
-import requests
-import json
+import os
+import sys
 import traceback
 
+# Shared script helpers live in backend/script_utils.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+from script_utils import dump_json, dump_json_str, load_json, make_session
+
+# Shared keep-alive session from script_utils
+SESSION = make_session()
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 def test_job_fit_debug():
     """Test job fit with detailed error reporting"""
     print("🔍 Debugging Job Fit Endpoint...")
@@ -29,15 +38,15 @@ def test_job_fit_debug():
     }
     
     try:
-        response = requests.post('http://localhost:8000/api/job-fit/analyze', json=request_data)
+        response = SESSION.post('http://localhost:8000/api/job-fit/analyze', data=dump_json(request_data), headers=JSON_HEADERS)
         
         print(f"Status Code: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
         
         if response.status_code == 200:
-            result = response.json()
+            result = load_json(response.content)
             print("✅ Success!")
-            print(json.dumps(result, indent=2))
+            print(dump_json_str(result, indent=True))
         else:
             print(f"❌ Error Response:")
             print(f"   Status: {response.status_code}")
@@ -45,8 +54,8 @@ def test_job_fit_debug():
             
             # Try to parse as JSON for more details
             try:
-                error_json = response.json()
-                print(f"   JSON: {json.dumps(error_json, indent=2)}")
+                error_json = load_json(response.content)
+                print(f"   JSON: {dump_json_str(error_json, indent=True)}")
             except:
                 pass
                 
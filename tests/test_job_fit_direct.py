@@ -5,17 +5,21 @@ Direct test of job fit functionality without API endpoints
 
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-from backend.app.ai_engines.gemini_engine import GeminiEngine
+try:
+    from app.ai_engines.gemini_engine import get_gemini_engine
+except ImportError:
+    # Backend not installed (pip install -e backend) - import it from the source tree
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+    from app.ai_engines.gemini_engine import get_gemini_engine
+
+# One engine (and HTTP connection pool) shared by every call in this process
+engine = get_gemini_engine()
 
 def test_job_fit_direct():
     """Test job fit analysis directly"""
     print("💼 Testing Job Fit Analysis Directly...")
     
-    # Initialize engine
-    engine = GeminiEngine()
-    
     # Test data
     resume_data = {
         "role": "Software Engineer",
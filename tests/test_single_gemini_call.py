@@ -5,21 +5,26 @@ Test a single Gemini API call to verify it's working
 
 import sys
 import os
-sys.path.append('backend')
 
 from dotenv import load_dotenv
 load_dotenv('backend/.env')
 load_dotenv('.env')
 
-from backend.app.ai_engines.gemini_engine import GeminiEngine
+try:
+    from app.ai_engines.gemini_engine import get_gemini_engine
+except ImportError:
+    # Backend not installed (pip install -e backend) - import it from the source tree
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+    from app.ai_engines.gemini_engine import get_gemini_engine
+
+# One engine (and HTTP connection pool) shared by every call in this process
+engine = get_gemini_engine()
 
 def test_single_call():
     """Test a single API call"""
     print("🧪 Testing Single Gemini API Call")
     print("=" * 40)
     
-    engine = GeminiEngine()
-    
     print("Making API call...")
     result = engine.call_gemini(
         "Generate a professional interview question for a Software Engineer. Keep it under 20 words.", 